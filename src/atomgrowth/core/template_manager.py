@@ -2,15 +2,55 @@
 
 import json
 import copy
+import operator
+import os
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
-from dataclasses import fields, is_dataclass
+from dataclasses import fields, is_dataclass, replace
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json fallback below
+    orjson = None
 
 from atomgrowth.models.recipe import (
     RecipeTemplate, TemperatureProfile, GasFlow, PrecursorSetup, SubstrateInfo
 )
 from atomgrowth.signals.app_signals import get_app_signals
 
+# The template schema is fixed at import time, so the field paths are
+# computed once here instead of re-introspecting per call
+_ALL_FIELD_PATHS: tuple[str, ...] = tuple(
+    f"{section}.{f.name}"
+    for section, section_cls in (
+        ("temperature", TemperatureProfile),
+        ("gas_flow", GasFlow),
+        ("precursor", PrecursorSetup),
+        ("substrate", SubstrateInfo),
+    )
+    for f in fields(section_cls)
+)
+
+# C-implemented getters for the fixed schema paths; much cheaper than the
+# generic _get_field_value dot-walker in the diff hot loop
+_FIELD_PATH_GETTERS: dict[str, Any] = {
+    path: operator.attrgetter(path) for path in _ALL_FIELD_PATHS
+}
+
+
+@lru_cache(maxsize=None)
+def _split_field_path(path: str) -> tuple[str, ...]:
+    """
+    Split a dotted field path into its parts, memoized.
+
+    The same handful of override keys ("temperature.peak_temp", ...) are
+    re-split on every resolve/apply pass, so caching the tuples makes the
+    walkers allocation-free on repeat paths.
+    """
+    return tuple(path.split('.'))
+
 
 class TemplateManager:
     """
@@ -25,6 +65,15 @@ class TemplateManager:
 
     def __init__(self, storage_path: Optional[Path] = None):
         self._templates: dict[str, RecipeTemplate] = {}
+        # Secondary index parent_id -> child ids, maintained on CRUD so
+        # child lookups don't scan every template
+        self._children_by_parent: dict[str, set[str]] = defaultdict(set)
+        # Memoized resolve_template results: id -> (chain fingerprint, resolved)
+        self._resolve_cache: dict[str, tuple[tuple, RecipeTemplate]] = {}
+        # Bumped on every create/update/delete/load; list_templates memoizes
+        # against it so repeated dialog opens reuse one list
+        self._revision = 0
+        self._list_cache: Optional[tuple[int, list[RecipeTemplate]]] = None
         self._storage_path = storage_path
         self._signals = get_app_signals()
 
@@ -50,13 +99,48 @@ class TemplateManager:
             template.parent_template_id = parent_id
 
         self._templates[template.id] = template
+        if template.parent_template_id:
+            self._children_by_parent[template.parent_template_id].add(template.id)
+        self._resolve_cache.clear()
+        self._revision += 1
         self._signals.template_created.emit(template.id)
         return template
 
+    def register_template(self, template: RecipeTemplate) -> None:
+        """
+        Insert a pre-built template into the store.
+
+        Same bookkeeping as create_template (child index, caches,
+        revision counter, created signal) for callers that construct the
+        RecipeTemplate themselves - e.g. the editor saving a draft.
+        Writing into the store through any other path leaves the child
+        index and memoized list stale.
+        """
+        if template.id in self._templates:
+            raise ValueError(f"Template '{template.id}' already exists")
+
+        parent_id = template.parent_template_id
+        if parent_id:
+            if parent_id not in self._templates:
+                raise ValueError(f"Parent template '{parent_id}' not found")
+            if self._would_create_cycle(template.id, parent_id):
+                raise ValueError("Cannot create circular inheritance")
+
+        self._templates[template.id] = template
+        if parent_id:
+            self._children_by_parent[parent_id].add(template.id)
+        self._resolve_cache.clear()
+        self._revision += 1
+        self._signals.template_created.emit(template.id)
+
     def get_template(self, template_id: str) -> Optional[RecipeTemplate]:
         """Get a template by ID."""
         return self._templates.get(template_id)
 
+    def __contains__(self, template_id: str) -> bool:
+        """Existence check by ID; O(1) dict lookup."""
+        return template_id in self._templates
+
     def update_template(self, template: RecipeTemplate) -> None:
         """Update an existing template."""
         if template.id not in self._templates:
@@ -64,6 +148,16 @@ class TemplateManager:
 
         template.update_modified()
         self._templates[template.id] = template
+
+        # Re-home the child index entry in case the parent changed
+        # (the old parent isn't known - callers may mutate in place)
+        for children in self._children_by_parent.values():
+            children.discard(template.id)
+        if template.parent_template_id:
+            self._children_by_parent[template.parent_template_id].add(template.id)
+
+        self._resolve_cache.clear()
+        self._revision += 1
         self._signals.template_modified.emit(template.id)
 
     def delete_template(self, template_id: str) -> bool:
@@ -72,19 +166,35 @@ class TemplateManager:
             return False
 
         # Check if any templates inherit from this one
-        for t in self._templates.values():
-            if t.parent_template_id == template_id:
-                raise ValueError(
-                    f"Cannot delete: template '{t.name}' inherits from this template"
-                )
-
-        del self._templates[template_id]
+        children = self._children_by_parent.get(template_id)
+        if children:
+            child = self._templates[next(iter(children))]
+            raise ValueError(
+                f"Cannot delete: template '{child.name}' inherits from this template"
+            )
+
+        template = self._templates.pop(template_id)
+        if template.parent_template_id:
+            self._children_by_parent[template.parent_template_id].discard(template_id)
+        self._resolve_cache.clear()
+        self._revision += 1
         self._signals.template_deleted.emit(template_id)
         return True
 
     def list_templates(self) -> list[RecipeTemplate]:
-        """List all templates."""
-        return list(self._templates.values())
+        """
+        List all templates.
+
+        The list is memoized against the revision counter, so every dialog
+        open between two CRUD operations shares one list object. Callers
+        must treat it as read-only.
+        """
+        cached = self._list_cache
+        if cached is not None and cached[0] == self._revision:
+            return cached[1]
+        templates = list(self._templates.values())
+        self._list_cache = (self._revision, templates)
+        return templates
 
     def get_root_templates(self) -> list[RecipeTemplate]:
         """Get templates with no parent (root templates)."""
@@ -93,8 +203,8 @@ class TemplateManager:
     def get_children(self, template_id: str) -> list[RecipeTemplate]:
         """Get templates that directly inherit from the given template."""
         return [
-            t for t in self._templates.values()
-            if t.parent_template_id == template_id
+            self._templates[cid]
+            for cid in self._children_by_parent.get(template_id, ())
         ]
 
     # ==================== Inheritance Resolution ====================
@@ -109,6 +219,14 @@ class TemplateManager:
 
         chain = self.get_inheritance_chain(template_id)
 
+        # Resolution only changes when a template in the chain changes,
+        # so memoize keyed on the chain's (id, modified_at) fingerprint
+        fingerprint = tuple((t.id, t.modified_at) for t in chain)
+        cached = self._resolve_cache.get(template_id)
+        if cached and cached[0] == fingerprint:
+            # Return a copy so callers can't mutate the cached instance
+            return copy.deepcopy(cached[1])
+
         # Start with default values
         resolved = RecipeTemplate(
             id=template_id,
@@ -119,6 +237,7 @@ class TemplateManager:
         for template in reversed(chain):
             resolved = self._merge_templates(resolved, template)
 
+        self._resolve_cache[template_id] = (fingerprint, copy.deepcopy(resolved))
         return resolved
 
     def get_inheritance_chain(self, template_id: str) -> list[RecipeTemplate]:
@@ -126,14 +245,16 @@ class TemplateManager:
         Return the full inheritance chain for a template.
         Order: [template, parent, grandparent, ..., root]
         """
-        chain = []
+        chain: list[RecipeTemplate] = []
         current_id = template_id
-        visited = set()
+        # Chains are typically 2-5 deep, so a list membership check beats
+        # paying set hashing overhead per level
+        visited: list[str] = []
 
         while current_id:
             if current_id in visited:
                 raise ValueError("Circular inheritance detected")
-            visited.add(current_id)
+            visited.append(current_id)
 
             template = self._templates.get(current_id)
             if not template:
@@ -170,6 +291,38 @@ class TemplateManager:
         default_value = self._get_field_value(default_template, field_path)
         return (default_value, None)
 
+    def resolve_with_sources(
+        self,
+        template_id: str
+    ) -> dict[str, tuple[Any, Optional[str]]]:
+        """
+        Get effective (value, source_template_id) for every field path.
+
+        One walk of the inheritance chain covers the whole schema, so
+        loading an editor full of fields costs O(chain + fields) instead
+        of re-walking the chain per field via get_effective_value.
+        """
+        chain = self.get_inheritance_chain(template_id)
+        total = len(_FIELD_PATH_GETTERS)
+        resolved: dict[str, tuple[Any, Optional[str]]] = {}
+
+        for template in chain:
+            for path, getter in _FIELD_PATH_GETTERS.items():
+                if path not in resolved:
+                    value = getter(template)
+                    if value is not None:
+                        resolved[path] = (value, template.id)
+            if len(resolved) == total:
+                return resolved
+
+        # Fill the gaps from one default instance instead of building a
+        # fresh RecipeTemplate per unresolved field
+        default_template = RecipeTemplate()
+        for path, getter in _FIELD_PATH_GETTERS.items():
+            if path not in resolved:
+                resolved[path] = (getter(default_template), None)
+        return resolved
+
     # ==================== Field Path Access ====================
 
     @staticmethod
@@ -178,7 +331,7 @@ class TemplateManager:
         Get a nested field value using dot notation.
         e.g., "temperature.peak_temp" -> obj.temperature.peak_temp
         """
-        parts = path.split('.')
+        parts = _split_field_path(path)
         current = obj
 
         for part in parts:
@@ -199,7 +352,7 @@ class TemplateManager:
         Set a nested field value using dot notation.
         Returns True if successful.
         """
-        parts = path.split('.')
+        parts = _split_field_path(path)
         current = obj
 
         # Navigate to the parent of the target field
@@ -226,25 +379,7 @@ class TemplateManager:
 
     def get_all_field_paths(self) -> list[str]:
         """Get all available field paths for a template."""
-        paths = []
-
-        # Temperature fields
-        for f in fields(TemperatureProfile):
-            paths.append(f"temperature.{f.name}")
-
-        # Gas flow fields
-        for f in fields(GasFlow):
-            paths.append(f"gas_flow.{f.name}")
-
-        # Precursor fields
-        for f in fields(PrecursorSetup):
-            paths.append(f"precursor.{f.name}")
-
-        # Substrate fields
-        for f in fields(SubstrateInfo):
-            paths.append(f"substrate.{f.name}")
-
-        return paths
+        return list(_ALL_FIELD_PATHS)
 
     # ==================== Merge & Diff ====================
 
@@ -255,37 +390,33 @@ class TemplateManager:
     ) -> RecipeTemplate:
         """
         Deep merge overlay onto base. Overlay values win.
+        Neither input is mutated; the sections only hold scalars/strings,
+        so field-wise copies suffice and generic deepcopy is avoided.
         """
-        result = copy.deepcopy(base)
-
-        # Merge each section
-        result.temperature = self._merge_dataclass(
-            result.temperature, overlay.temperature
-        )
-        result.gas_flow = self._merge_dataclass(
-            result.gas_flow, overlay.gas_flow
-        )
-        result.precursor = self._merge_dataclass(
-            result.precursor, overlay.precursor
+        return RecipeTemplate(
+            id=base.id,
+            name=overlay.name,
+            description=overlay.description or base.description,
+            parent_template_id=overlay.parent_template_id,
+            created_at=overlay.created_at,
+            modified_at=overlay.modified_at,
+            temperature=self._merge_dataclass(
+                base.temperature, overlay.temperature
+            ),
+            gas_flow=self._merge_dataclass(
+                base.gas_flow, overlay.gas_flow
+            ),
+            precursor=self._merge_dataclass(
+                base.precursor, overlay.precursor
+            ),
+            substrate=self._merge_dataclass(
+                base.substrate, overlay.substrate
+            ),
+            # Overlay wins on custom fields; tags are the union
+            # (dict dedup keeps insertion order, so saves stay deterministic)
+            custom_fields={**base.custom_fields, **overlay.custom_fields},
+            tags=list({t: None for t in (*base.tags, *overlay.tags)}),
         )
-        result.substrate = self._merge_dataclass(
-            result.substrate, overlay.substrate
-        )
-
-        # Merge custom fields (overlay wins)
-        result.custom_fields.update(overlay.custom_fields)
-
-        # Merge tags (union)
-        result.tags = list(set(result.tags) | set(overlay.tags))
-
-        # Keep overlay's metadata
-        result.name = overlay.name
-        result.description = overlay.description or result.description
-        result.parent_template_id = overlay.parent_template_id
-        result.created_at = overlay.created_at
-        result.modified_at = overlay.modified_at
-
-        return result
 
     @staticmethod
     def _merge_dataclass(base: Any, overlay: Any) -> Any:
@@ -293,14 +424,10 @@ class TemplateManager:
         if not is_dataclass(base) or not is_dataclass(overlay):
             return overlay if overlay is not None else base
 
-        result = copy.deepcopy(base)
-
-        for field in fields(overlay):
-            overlay_value = getattr(overlay, field.name)
-            # Always use overlay value (could add smarter default detection)
-            setattr(result, field.name, overlay_value)
-
-        return result
+        # Always use overlay value (could add smarter default detection)
+        return replace(
+            base, **{f.name: getattr(overlay, f.name) for f in fields(overlay)}
+        )
 
     def diff_templates(
         self,
@@ -313,13 +440,37 @@ class TemplateManager:
         Returns list of dicts:
         [{"field_path": "...", "value_1": ..., "value_2": ...}, ...]
         """
-        t1 = self.resolve_template(template_id_1)
-        t2 = self.resolve_template(template_id_2)
+        for template_id in (template_id_1, template_id_2):
+            if template_id not in self._templates:
+                raise ValueError(f"Template '{template_id}' not found")
+
+        chain1 = self.get_inheritance_chain(template_id_1)
+        chain2 = self.get_inheritance_chain(template_id_2)
+
+        # Templates in the same family share a root-ward chain suffix;
+        # resolve that shared part once and apply only the divergent
+        # overlays per side (merging never mutates its inputs)
+        shared = 0
+        limit = min(len(chain1), len(chain2))
+        while shared < limit and chain1[-1 - shared].id == chain2[-1 - shared].id:
+            shared += 1
+
+        common = RecipeTemplate()
+        for template in reversed(chain1[len(chain1) - shared:]):
+            common = self._merge_templates(common, template)
+
+        t1 = common
+        for template in reversed(chain1[:len(chain1) - shared]):
+            t1 = self._merge_templates(t1, template)
+
+        t2 = common
+        for template in reversed(chain2[:len(chain2) - shared]):
+            t2 = self._merge_templates(t2, template)
 
         diffs = []
-        for path in self.get_all_field_paths():
-            v1 = self._get_field_value(t1, path)
-            v2 = self._get_field_value(t2, path)
+        for path, getter in _FIELD_PATH_GETTERS.items():
+            v1 = getter(t1)
+            v2 = getter(t2)
 
             if v1 != v2:
                 diffs.append({
@@ -359,15 +510,36 @@ class TemplateManager:
 
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "version": 1,
-            "templates": {
-                tid: t.to_dict() for tid, t in self._templates.items()
-            }
-        }
-
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and atomically swap it in, so a crash
+        # mid-write can't leave a truncated store behind
+        tmp_path = save_path.with_name(save_path.name + ".tmp")
+
+        if orjson is not None:
+            # orjson walks the dataclass fields in C, so no to_dict() and
+            # no intermediate per-template dicts
+            data = {"version": 1, "templates": self._templates}
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_DATACLASS))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            # Stream one template at a time instead of building the full
+            # dict; the 1 MiB buffer keeps write syscalls few
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write('{"version": 1, "templates": {')
+                first = True
+                for tid, template in self._templates.items():
+                    if not first:
+                        f.write(', ')
+                    f.write(json.dumps(tid))
+                    f.write(': ')
+                    f.write(json.dumps(template.to_dict()))
+                    first = False
+                f.write('}}')
+                f.flush()
+                os.fsync(f.fileno())
+
+        os.replace(tmp_path, save_path)
 
     def load(self, path: Optional[Path] = None) -> None:
         """Load templates from JSON file."""
@@ -375,9 +547,20 @@ class TemplateManager:
         if not load_path or not load_path.exists():
             return
 
-        with open(load_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        raw = load_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-        self._templates = {}
-        for tid, tdata in data.get("templates", {}).items():
+        source = data.get("templates", {})
+        # Size the dict's table once instead of growing through rehashes
+        self._templates = dict.fromkeys(source)
+        for tid, tdata in source.items():
             self._templates[tid] = RecipeTemplate.from_dict(tdata)
+
+        # Rebuild the secondary index
+        self._children_by_parent = defaultdict(set)
+        for template in self._templates.values():
+            if template.parent_template_id:
+                self._children_by_parent[template.parent_template_id].add(template.id)
+
+        self._resolve_cache.clear()
+        self._revision += 1
@@ -0,0 +1,112 @@
+"""Code-generated deserializers for the model dataclasses.
+
+from_dict is the hot path when loading a project with thousands of
+records. Generating the constructor call once at import time inlines
+every key as a literal expression, so each call is a single dict-literal
+style constructor invocation with no per-call reflection.
+"""
+
+from dataclasses import fields
+from typing import Any, Optional
+
+
+def make_from_dict(
+    cls,
+    field_exprs: dict[str, str],
+    namespace: Optional[dict[str, Any]] = None,
+    prelude: tuple[str, ...] = (),
+) -> classmethod:
+    """
+    Build a ``from_dict`` classmethod for *cls*.
+
+    field_exprs maps constructor argument names to Python expressions
+    evaluated against the incoming dict, which is bound to ``data``.
+    prelude lines run first (e.g. to hoist nested sub-dicts to locals).
+    """
+    body = "".join(f"    {line}\n" for line in prelude)
+    args = ",\n        ".join(
+        f"{name}={expr}" for name, expr in field_exprs.items()
+    )
+    src = (
+        "def from_dict(cls, data):\n"
+        f"{body}"
+        "    return cls(\n"
+        f"        {args},\n"
+        "    )\n"
+    )
+
+    ns = dict(namespace) if namespace else {}
+    exec(src, ns)
+    fn = ns["from_dict"]
+    fn.__doc__ = "Create from dictionary (JSON deserialization)."
+    fn.__qualname__ = f"{cls.__name__}.from_dict"
+    return classmethod(fn)
+
+
+def make_to_dict(
+    cls,
+    field_exprs: dict[str, str],
+    namespace: Optional[dict[str, Any]] = None,
+    prelude: tuple[str, ...] = (),
+):
+    """
+    Build a ``to_dict`` method for *cls*, mirroring :func:`make_from_dict`.
+
+    field_exprs maps output keys to Python expressions evaluated against
+    ``self``; the whole body is a single dict literal, so there is no
+    per-call loop or getattr dispatch.
+    """
+    body = "".join(f"    {line}\n" for line in prelude)
+    items = ",\n        ".join(
+        f"'{key}': {expr}" for key, expr in field_exprs.items()
+    )
+    src = (
+        "def to_dict(self):\n"
+        f"{body}"
+        "    return {\n"
+        f"        {items},\n"
+        "    }\n"
+    )
+
+    ns = dict(namespace) if namespace else {}
+    exec(src, ns)
+    fn = ns["to_dict"]
+    fn.__doc__ = "Convert to dictionary for JSON serialization."
+    fn.__qualname__ = f"{cls.__name__}.to_dict"
+    return fn
+
+
+def cache_fields(cls):
+    """Cache the dataclass field-name tuple on the class itself."""
+    cls.__fields_tuple__ = tuple(f.name for f in fields(cls))
+    return cls
+
+
+def section_dict_expr(section_cls, var: str) -> str:
+    """
+    Emit a dict-literal expression serializing a flat section dataclass
+    bound to the local name *var*.
+    """
+    items = ", ".join(
+        f"'{name}': {var}.{name}" for name in section_cls.__fields_tuple__
+    )
+    return "{" + items + "}"
+
+
+def section_expr(section_cls, var: str, intern: tuple[str, ...] = ()) -> str:
+    """
+    Emit a constructor-call expression for a flat section dataclass,
+    reading each field from the local dict named *var* with the field's
+    declared default inlined as the fallback.
+
+    Fields named in *intern* (low-cardinality strings) are passed through
+    sys.intern so repeated values share one object; callers must provide
+    ``sys`` in the namespace.
+    """
+    args = []
+    for f in fields(section_cls):
+        expr = f"{var}.get('{f.name}', {f.default!r})"
+        if f.name in intern:
+            expr = f"(sys.intern(_v) if (_v := {expr}) else _v)"
+        args.append(f"{f.name}={expr}")
+    return f"{section_cls.__name__}({', '.join(args)})"
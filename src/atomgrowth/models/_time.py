@@ -0,0 +1,24 @@
+"""Fast ISO-8601 timestamp emission.
+
+datetime.now().isoformat() builds a full datetime object just to
+reformat it, and the models stamp modified_at on every mutation.
+Formatting straight from time.time_ns() through one localtime call and
+an f-string skips the object construction entirely.
+"""
+
+import time
+
+
+def fast_iso_now() -> str:
+    """Return the current local time as an ISO-8601 string.
+
+    Matches datetime.now().isoformat(): local time, microsecond
+    precision, no timezone suffix.
+    """
+    ns = time.time_ns()
+    secs, us = divmod(ns // 1000, 1_000_000)
+    t = time.localtime(secs)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{us:06d}"
+    )
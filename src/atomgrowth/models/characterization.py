@@ -1,12 +1,16 @@
 """Characterization data model for images and spectra"""
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from enum import StrEnum
 from typing import Any, Optional
-from uuid import uuid4
 
+from atomgrowth.models._ids import new_id
+from atomgrowth.models._time import fast_iso_now
+from atomgrowth.models._serde import cache_fields, make_from_dict
 
-class CharacterizationType:
+
+class CharacterizationType(StrEnum):
     """Type constants for characterization data."""
     OPTICAL_IMAGE = "optical_image"
     RAMAN_SPECTRUM = "raman_spectrum"
@@ -18,13 +22,23 @@ class CharacterizationType:
     OTHER = "other"
 
 
-@dataclass
+# Intern the values so == against loaded strings hits the pointer fast path
+for _member in CharacterizationType:
+    sys.intern(_member.value)
+
+# Shared empty default - most records never get annotations, so they all
+# point at this one tuple instead of each allocating an empty list
+_EMPTY: tuple = ()
+
+
+@cache_fields
+@dataclass(slots=True)
 class CharacterizationData:
     """
     Characterization data linked to samples or experiments.
     Supports optical images, Raman spectra, and extensible data types.
     """
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
 
     # Links (at least one should be set)
     sample_id: Optional[str] = None
@@ -51,63 +65,37 @@ class CharacterizationData:
 
     # Notes and annotations
     notes: str = ""
-    annotations: list[dict] = field(default_factory=list)  # For image annotations
+    annotations: list[dict] = _EMPTY  # For image annotations
 
     # Timestamps
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    modified_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=fast_iso_now)
+    modified_at: str = field(default_factory=fast_iso_now)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "sample_id": self.sample_id,
-            "experiment_id": self.experiment_id,
-            "data_type": self.data_type,
-            "file_path": self.file_path,
-            "file_name": self.file_name,
-            "file_size": self.file_size,
-            "metadata": self.metadata,
-            "acquired_at": self.acquired_at,
-            "acquired_by": self.acquired_by,
-            "instrument": self.instrument,
-            "notes": self.notes,
-            "annotations": self.annotations,
-            "created_at": self.created_at,
-            "modified_at": self.modified_at,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "CharacterizationData":
-        """Create from dictionary (JSON deserialization)."""
-        return cls(
-            id=data.get("id", str(uuid4())),
-            sample_id=data.get("sample_id"),
-            experiment_id=data.get("experiment_id"),
-            data_type=data.get("data_type", CharacterizationType.OTHER),
-            file_path=data.get("file_path", ""),
-            file_name=data.get("file_name", ""),
-            file_size=data.get("file_size", 0),
-            metadata=data.get("metadata", {}),
-            acquired_at=data.get("acquired_at", ""),
-            acquired_by=data.get("acquired_by", ""),
-            instrument=data.get("instrument", ""),
-            notes=data.get("notes", ""),
-            annotations=data.get("annotations", []),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            modified_at=data.get("modified_at", datetime.now().isoformat()),
-        )
+        return {name: getattr(self, name) for name in self.__fields_tuple__}
+
+    def add_annotation(self, annotation: dict) -> None:
+        """Append an image annotation, upgrading the shared empty default."""
+        if self.annotations is _EMPTY:
+            self.annotations = []
+        self.annotations.append(annotation)
 
     def update_modified(self) -> None:
         """Update the modified timestamp."""
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = fast_iso_now()
 
 
-@dataclass
+@cache_fields
+@dataclass(slots=True)
 class RamanData(CharacterizationData):
     """
     Extended schema for Raman spectra with extracted peak information.
     """
+    # Redeclared default replaces the old __post_init__ assignment, which
+    # wrote the same value on every construction
+    data_type: str = CharacterizationType.RAMAN_SPECTRUM
+
     # Extracted peak data for MoS2
     e2g_position: Optional[float] = None    # cm^-1 - E2g peak position
     a1g_position: Optional[float] = None    # cm^-1 - A1g peak position
@@ -118,54 +106,6 @@ class RamanData(CharacterizationData):
     a1g_fwhm: Optional[float] = None
     layer_count_estimate: Optional[int] = None  # Estimated layer count from separation
 
-    def __post_init__(self):
-        # Ensure data_type is set correctly
-        self.data_type = CharacterizationType.RAMAN_SPECTRUM
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
-            "e2g_position": self.e2g_position,
-            "a1g_position": self.a1g_position,
-            "peak_separation": self.peak_separation,
-            "e2g_intensity": self.e2g_intensity,
-            "a1g_intensity": self.a1g_intensity,
-            "e2g_fwhm": self.e2g_fwhm,
-            "a1g_fwhm": self.a1g_fwhm,
-            "layer_count_estimate": self.layer_count_estimate,
-        })
-        return base
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "RamanData":
-        """Create from dictionary (JSON deserialization)."""
-        return cls(
-            id=data.get("id", str(uuid4())),
-            sample_id=data.get("sample_id"),
-            experiment_id=data.get("experiment_id"),
-            data_type=CharacterizationType.RAMAN_SPECTRUM,
-            file_path=data.get("file_path", ""),
-            file_name=data.get("file_name", ""),
-            file_size=data.get("file_size", 0),
-            metadata=data.get("metadata", {}),
-            acquired_at=data.get("acquired_at", ""),
-            acquired_by=data.get("acquired_by", ""),
-            instrument=data.get("instrument", ""),
-            notes=data.get("notes", ""),
-            annotations=data.get("annotations", []),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            modified_at=data.get("modified_at", datetime.now().isoformat()),
-            e2g_position=data.get("e2g_position"),
-            a1g_position=data.get("a1g_position"),
-            peak_separation=data.get("peak_separation"),
-            e2g_intensity=data.get("e2g_intensity"),
-            a1g_intensity=data.get("a1g_intensity"),
-            e2g_fwhm=data.get("e2g_fwhm"),
-            a1g_fwhm=data.get("a1g_fwhm"),
-            layer_count_estimate=data.get("layer_count_estimate"),
-        )
-
     def calculate_peak_separation(self) -> None:
         """Calculate peak separation from positions."""
         if self.e2g_position is not None and self.a1g_position is not None:
@@ -193,3 +133,52 @@ class RamanData(CharacterizationData):
                 self.layer_count_estimate = 3
             else:
                 self.layer_count_estimate = 4  # 4+ means bulk-like
+
+
+# Generated deserializers (see _serde): inline every key as a literal so
+# bulk loads skip per-call reflection
+_BASE_FIELD_EXPRS = {
+    "id": "data.get('id') or new_id()",
+    "sample_id": "data.get('sample_id')",
+    "experiment_id": "data.get('experiment_id')",
+    "data_type": "data.get('data_type', CharacterizationType.OTHER)",
+    "file_path": "data.get('file_path', '')",
+    "file_name": "data.get('file_name', '')",
+    "file_size": "data.get('file_size', 0)",
+    "metadata": "data.get('metadata', {})",
+    "acquired_at": "data.get('acquired_at', '')",
+    "acquired_by": "data.get('acquired_by', '')",
+    "instrument": "data.get('instrument', '')",
+    "notes": "data.get('notes', '')",
+    "annotations": "data.get('annotations') or _EMPTY",
+    "created_at": "data.get('created_at') or fast_iso_now()",
+    "modified_at": "data.get('modified_at') or fast_iso_now()",
+}
+
+_NAMESPACE = {
+    "new_id": new_id,
+    "fast_iso_now": fast_iso_now,
+    "CharacterizationType": CharacterizationType,
+    "_EMPTY": _EMPTY,
+}
+
+CharacterizationData.from_dict = make_from_dict(
+    CharacterizationData, _BASE_FIELD_EXPRS, namespace=_NAMESPACE
+)
+
+RamanData.from_dict = make_from_dict(
+    RamanData,
+    {
+        **_BASE_FIELD_EXPRS,
+        "data_type": "'raman_spectrum'",
+        "e2g_position": "data.get('e2g_position')",
+        "a1g_position": "data.get('a1g_position')",
+        "peak_separation": "data.get('peak_separation')",
+        "e2g_intensity": "data.get('e2g_intensity')",
+        "a1g_intensity": "data.get('a1g_intensity')",
+        "e2g_fwhm": "data.get('e2g_fwhm')",
+        "a1g_fwhm": "data.get('a1g_fwhm')",
+        "layer_count_estimate": "data.get('layer_count_estimate')",
+    },
+    namespace=_NAMESPACE,
+)
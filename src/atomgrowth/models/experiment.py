@@ -1,12 +1,16 @@
 """Experiment data model for CVD synthesis runs"""
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from enum import StrEnum
 from typing import Any, Optional
-from uuid import uuid4
 
+from atomgrowth.models._ids import new_id
+from atomgrowth.models._time import fast_iso_now
+from atomgrowth.models._serde import cache_fields, make_from_dict
 
-class ExperimentStatus:
+
+class ExperimentStatus(StrEnum):
     """Status constants for experiments."""
     PLANNED = "planned"
     IN_PROGRESS = "in_progress"
@@ -14,7 +18,7 @@ class ExperimentStatus:
     FAILED = "failed"
 
 
-class ExperimentOutcome:
+class ExperimentOutcome(StrEnum):
     """Outcome constants for completed experiments."""
     SUCCESS = "success"
     PARTIAL = "partial"
@@ -22,7 +26,17 @@ class ExperimentOutcome:
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Intern the values so == against loaded strings hits the pointer fast path
+for _member in (*ExperimentStatus, *ExperimentOutcome):
+    sys.intern(_member.value)
+
+# Shared empty default - most experiments are untagged, so they all point
+# at this one tuple instead of each allocating an empty list
+_EMPTY: tuple = ()
+
+
+@cache_fields
+@dataclass(slots=True)
 class Experiment:
     """
     A single CVD synthesis run.
@@ -31,12 +45,12 @@ class Experiment:
     The resolved recipe is computed at runtime by merging
     template values with overrides.
     """
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     name: str = ""
     template_id: str = ""              # Required - which template this is based on
 
     # Timing
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=fast_iso_now)
     run_date: Optional[str] = None     # When the experiment was actually run
     completed_at: Optional[str] = None
 
@@ -66,52 +80,16 @@ class Experiment:
     raman_files: list[str] = field(default_factory=list)     # Paths relative to data dir
 
     # Tags
-    tags: list[str] = field(default_factory=list)
+    tags: list[str] = _EMPTY
+
+    @property
+    def date_str(self) -> str:
+        """Date portion of created_at for list displays."""
+        return self.created_at[:10] if self.created_at else ""
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "template_id": self.template_id,
-            "created_at": self.created_at,
-            "run_date": self.run_date,
-            "completed_at": self.completed_at,
-            "status": self.status,
-            "overrides": self.overrides,
-            "override_reasons": self.override_reasons,
-            "outcome": self.outcome,
-            "notes": self.notes,
-            "observations": self.observations,
-            "sample_ids": self.sample_ids,
-            "characterization_ids": self.characterization_ids,
-            "optical_images": self.optical_images,
-            "raman_files": self.raman_files,
-            "tags": self.tags,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Experiment":
-        """Create from dictionary (JSON deserialization)."""
-        return cls(
-            id=data.get("id", str(uuid4())),
-            name=data.get("name", ""),
-            template_id=data.get("template_id", ""),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            run_date=data.get("run_date"),
-            completed_at=data.get("completed_at"),
-            status=data.get("status", ExperimentStatus.PLANNED),
-            overrides=data.get("overrides", {}),
-            override_reasons=data.get("override_reasons", {}),
-            outcome=data.get("outcome", ExperimentOutcome.UNKNOWN),
-            notes=data.get("notes", ""),
-            observations=data.get("observations", ""),
-            sample_ids=data.get("sample_ids", []),
-            characterization_ids=data.get("characterization_ids", []),
-            optical_images=data.get("optical_images", []),
-            raman_files=data.get("raman_files", []),
-            tags=data.get("tags", []),
-        )
+        return {name: getattr(self, name) for name in self.__fields_tuple__}
 
     def set_override(self, field_path: str, value: Any, reason: str = "") -> None:
         """Set a parameter override with optional reason."""
@@ -124,33 +102,32 @@ class Experiment:
         self.overrides.pop(field_path, None)
         self.override_reasons.pop(field_path, None)
 
-    def is_overridden(self, field_path: str) -> bool:
-        """Check if a parameter is overridden."""
-        return field_path in self.overrides
-
-    def get_override(self, field_path: str) -> Any | None:
-        """Get override value if exists, else None."""
-        return self.overrides.get(field_path)
-
     def start_experiment(self) -> None:
         """Mark experiment as started."""
         self.status = ExperimentStatus.IN_PROGRESS
-        self.run_date = datetime.now().isoformat()
+        self.run_date = fast_iso_now()
 
     def complete_experiment(self, outcome: str = ExperimentOutcome.SUCCESS) -> None:
         """Mark experiment as completed."""
         self.status = ExperimentStatus.COMPLETED
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at = fast_iso_now()
         self.outcome = outcome
 
     def fail_experiment(self, notes: str = "") -> None:
         """Mark experiment as failed."""
         self.status = ExperimentStatus.FAILED
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at = fast_iso_now()
         self.outcome = ExperimentOutcome.FAILED
         if notes:
             self.notes = notes
 
+    def add_tag(self, tag: str) -> None:
+        """Append a tag, upgrading the shared empty default."""
+        if self.tags is _EMPTY:
+            self.tags = []
+        if tag not in self.tags:
+            self.tags.append(tag)
+
     # Image and file management helpers
     def add_optical_image(self, image_path: str) -> None:
         """Add an optical image path."""
@@ -171,3 +148,36 @@ class Experiment:
         """Remove a Raman file path."""
         if file_path in self.raman_files:
             self.raman_files.remove(file_path)
+
+
+# Generated deserializer (see _serde): inlines every key as a literal so
+# bulk loads skip per-call reflection
+Experiment.from_dict = make_from_dict(
+    Experiment,
+    {
+        "id": "data.get('id') or new_id()",
+        "name": "data.get('name', '')",
+        "template_id": "data.get('template_id', '')",
+        "created_at": "data.get('created_at') or fast_iso_now()",
+        "run_date": "data.get('run_date')",
+        "completed_at": "data.get('completed_at')",
+        "status": "data.get('status', ExperimentStatus.PLANNED)",
+        "overrides": "data.get('overrides', {})",
+        "override_reasons": "data.get('override_reasons', {})",
+        "outcome": "data.get('outcome', ExperimentOutcome.UNKNOWN)",
+        "notes": "data.get('notes', '')",
+        "observations": "data.get('observations', '')",
+        "sample_ids": "data.get('sample_ids', [])",
+        "characterization_ids": "data.get('characterization_ids', [])",
+        "optical_images": "data.get('optical_images', [])",
+        "raman_files": "data.get('raman_files', [])",
+        "tags": "data.get('tags') or _EMPTY",
+    },
+    namespace={
+        "new_id": new_id,
+        "fast_iso_now": fast_iso_now,
+        "ExperimentStatus": ExperimentStatus,
+        "ExperimentOutcome": ExperimentOutcome,
+        "_EMPTY": _EMPTY,
+    },
+)
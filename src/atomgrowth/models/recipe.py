@@ -1,12 +1,22 @@
 """Recipe and Template data models for CVD synthesis"""
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any, Optional
-from uuid import uuid4
 
+from atomgrowth.models._ids import new_id
+from atomgrowth.models._time import fast_iso_now
+from atomgrowth.models._serde import (
+    cache_fields,
+    make_from_dict,
+    make_to_dict,
+    section_dict_expr,
+    section_expr,
+)
 
-@dataclass
+
+@cache_fields
+@dataclass(slots=True)
 class TemperatureProfile:
     """Temperature profile for CVD synthesis."""
     ramp_rate_1: float = 10.0          # C/min to first hold
@@ -19,7 +29,8 @@ class TemperatureProfile:
     controlled_cool_rate: float = 10.0 # C/min if controlled
 
 
-@dataclass
+@cache_fields
+@dataclass(slots=True)
 class GasFlow:
     """Gas flow parameters."""
     ar_flow: float = 100.0             # sccm - Argon flow
@@ -27,7 +38,8 @@ class GasFlow:
     total_flow: float = 100.0          # sccm - Total flow
 
 
-@dataclass
+@cache_fields
+@dataclass(slots=True)
 class PrecursorSetup:
     """Precursor configuration for MoS2 CVD."""
     moo3_amount: float = 5.0           # mg - MoO3 precursor amount
@@ -38,7 +50,8 @@ class PrecursorSetup:
     s_boat_material: str = "quartz"
 
 
-@dataclass
+@cache_fields
+@dataclass(slots=True)
 class SubstrateInfo:
     """Substrate details."""
     material: str = "SiO2/Si"
@@ -48,7 +61,8 @@ class SubstrateInfo:
     size: str = "1cm x 1cm"
 
 
-@dataclass
+@cache_fields
+@dataclass(slots=True)
 class RecipeTemplate:
     """
     Base recipe template that can be inherited.
@@ -56,14 +70,14 @@ class RecipeTemplate:
     Key concept: Templates store EXPLICIT values.
     Experiments inherit from templates and only store OVERRIDES.
     """
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     name: str = ""
     description: str = ""
     parent_template_id: Optional[str] = None  # For template inheritance
 
     # Creation metadata
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    modified_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=fast_iso_now)
+    modified_at: str = field(default_factory=fast_iso_now)
 
     # Recipe parameters (all have defaults)
     temperature: TemperatureProfile = field(default_factory=TemperatureProfile)
@@ -77,98 +91,80 @@ class RecipeTemplate:
     # Tags for organization
     tags: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "parent_template_id": self.parent_template_id,
-            "created_at": self.created_at,
-            "modified_at": self.modified_at,
-            "temperature": {
-                "ramp_rate_1": self.temperature.ramp_rate_1,
-                "hold_temp_1": self.temperature.hold_temp_1,
-                "hold_time_1": self.temperature.hold_time_1,
-                "ramp_rate_2": self.temperature.ramp_rate_2,
-                "peak_temp": self.temperature.peak_temp,
-                "peak_hold_time": self.temperature.peak_hold_time,
-                "cooling_method": self.temperature.cooling_method,
-                "controlled_cool_rate": self.temperature.controlled_cool_rate,
-            },
-            "gas_flow": {
-                "ar_flow": self.gas_flow.ar_flow,
-                "h2_flow": self.gas_flow.h2_flow,
-                "total_flow": self.gas_flow.total_flow,
-            },
-            "precursor": {
-                "moo3_amount": self.precursor.moo3_amount,
-                "s_amount": self.precursor.s_amount,
-                "moo3_position": self.precursor.moo3_position,
-                "s_position": self.precursor.s_position,
-                "moo3_boat_material": self.precursor.moo3_boat_material,
-                "s_boat_material": self.precursor.s_boat_material,
-            },
-            "substrate": {
-                "material": self.substrate.material,
-                "oxide_thickness": self.substrate.oxide_thickness,
-                "prep_method": self.substrate.prep_method,
-                "orientation": self.substrate.orientation,
-                "size": self.substrate.size,
-            },
-            "custom_fields": self.custom_fields,
-            "tags": self.tags,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "RecipeTemplate":
-        """Create from dictionary (JSON deserialization)."""
-        temp_data = data.get("temperature", {})
-        gas_data = data.get("gas_flow", {})
-        precursor_data = data.get("precursor", {})
-        substrate_data = data.get("substrate", {})
-
-        return cls(
-            id=data.get("id", str(uuid4())),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            parent_template_id=data.get("parent_template_id"),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            modified_at=data.get("modified_at", datetime.now().isoformat()),
-            temperature=TemperatureProfile(
-                ramp_rate_1=temp_data.get("ramp_rate_1", 10.0),
-                hold_temp_1=temp_data.get("hold_temp_1", 300.0),
-                hold_time_1=temp_data.get("hold_time_1", 10.0),
-                ramp_rate_2=temp_data.get("ramp_rate_2", 5.0),
-                peak_temp=temp_data.get("peak_temp", 750.0),
-                peak_hold_time=temp_data.get("peak_hold_time", 15.0),
-                cooling_method=temp_data.get("cooling_method", "natural"),
-                controlled_cool_rate=temp_data.get("controlled_cool_rate", 10.0),
-            ),
-            gas_flow=GasFlow(
-                ar_flow=gas_data.get("ar_flow", 100.0),
-                h2_flow=gas_data.get("h2_flow", 0.0),
-                total_flow=gas_data.get("total_flow", 100.0),
-            ),
-            precursor=PrecursorSetup(
-                moo3_amount=precursor_data.get("moo3_amount", 5.0),
-                s_amount=precursor_data.get("s_amount", 100.0),
-                moo3_position=precursor_data.get("moo3_position", 0.0),
-                s_position=precursor_data.get("s_position", -15.0),
-                moo3_boat_material=precursor_data.get("moo3_boat_material", "alumina"),
-                s_boat_material=precursor_data.get("s_boat_material", "quartz"),
-            ),
-            substrate=SubstrateInfo(
-                material=substrate_data.get("material", "SiO2/Si"),
-                oxide_thickness=substrate_data.get("oxide_thickness", 300.0),
-                prep_method=substrate_data.get("prep_method", "piranha"),
-                orientation=substrate_data.get("orientation", "(100)"),
-                size=substrate_data.get("size", "1cm x 1cm"),
-            ),
-            custom_fields=data.get("custom_fields", {}),
-            tags=data.get("tags", []),
-        )
-
     def update_modified(self) -> None:
         """Update the modified timestamp."""
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = fast_iso_now()
+
+
+# Generated serializer (see _serde): the nested section dicts are inlined
+# from the cached field-name tuples, with each section hoisted to a local,
+# so a call is a single dict-literal build with no loop or getattr dispatch
+RecipeTemplate.to_dict = make_to_dict(
+    RecipeTemplate,
+    {
+        "id": "self.id",
+        "name": "self.name",
+        "description": "self.description",
+        "parent_template_id": "self.parent_template_id",
+        "created_at": "self.created_at",
+        "modified_at": "self.modified_at",
+        "temperature": section_dict_expr(TemperatureProfile, "t"),
+        "gas_flow": section_dict_expr(GasFlow, "g"),
+        "precursor": section_dict_expr(PrecursorSetup, "p"),
+        "substrate": section_dict_expr(SubstrateInfo, "s"),
+        "custom_fields": "self.custom_fields",
+        "tags": "self.tags",
+    },
+    prelude=(
+        "t = self.temperature",
+        "g = self.gas_flow",
+        "p = self.precursor",
+        "s = self.substrate",
+    ),
+)
+
+# Generated deserializer (see _serde): the nested section constructors are
+# inlined with their declared defaults, so bulk loads skip per-call
+# reflection and repeated dict lookups
+RecipeTemplate.from_dict = make_from_dict(
+    RecipeTemplate,
+    {
+        "id": "data.get('id') or new_id()",
+        "name": "data.get('name', '')",
+        "description": "data.get('description', '')",
+        "parent_template_id": "data.get('parent_template_id')",
+        "created_at": "data.get('created_at') or fast_iso_now()",
+        "modified_at": "data.get('modified_at') or fast_iso_now()",
+        "temperature": section_expr(
+            TemperatureProfile, "temp_data", intern=("cooling_method",)
+        ),
+        "gas_flow": section_expr(GasFlow, "gas_data"),
+        "precursor": section_expr(
+            PrecursorSetup,
+            "precursor_data",
+            intern=("moo3_boat_material", "s_boat_material"),
+        ),
+        "substrate": section_expr(
+            SubstrateInfo,
+            "substrate_data",
+            intern=("material", "prep_method", "orientation"),
+        ),
+        "custom_fields": "data.get('custom_fields', {})",
+        "tags": "data.get('tags', [])",
+    },
+    namespace={
+        "sys": sys,
+        "new_id": new_id,
+        "fast_iso_now": fast_iso_now,
+        "TemperatureProfile": TemperatureProfile,
+        "GasFlow": GasFlow,
+        "PrecursorSetup": PrecursorSetup,
+        "SubstrateInfo": SubstrateInfo,
+    },
+    prelude=(
+        "temp_data = data.get('temperature') or {}",
+        "gas_data = data.get('gas_flow') or {}",
+        "precursor_data = data.get('precursor') or {}",
+        "substrate_data = data.get('substrate') or {}",
+    ),
+)
@@ -1,12 +1,21 @@
 """Sample data model for tracking physical samples"""
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from enum import StrEnum
 from typing import Optional
-from uuid import uuid4
 
+from atomgrowth.models._ids import new_id
+from atomgrowth.models._time import fast_iso_now
+from atomgrowth.models._serde import (
+    cache_fields,
+    make_from_dict,
+    make_to_dict,
+    section_dict_expr,
+)
 
-class SampleStatus:
+
+class SampleStatus(StrEnum):
     """Status constants for samples."""
     ACTIVE = "active"
     CONSUMED = "consumed"
@@ -14,7 +23,17 @@ class SampleStatus:
     ARCHIVED = "archived"
 
 
-@dataclass
+# Intern the values so == against loaded strings hits the pointer fast path
+for _member in SampleStatus:
+    sys.intern(_member.value)
+
+# Shared empty default - most samples have no characterization links, so
+# they all point at this one tuple instead of each allocating an empty list
+_EMPTY: tuple = ()
+
+
+@cache_fields
+@dataclass(slots=True)
 class SampleLocation:
     """Where the sample is currently stored."""
     storage_type: str = ""             # wafer_box, sem_holder, tem_grid, drawer, etc.
@@ -23,35 +42,36 @@ class SampleLocation:
     notes: str = ""
 
     def to_dict(self) -> dict:
-        return {
-            "storage_type": self.storage_type,
-            "location_id": self.location_id,
-            "position": self.position,
-            "notes": self.notes,
-        }
+        return {name: getattr(self, name) for name in self.__fields_tuple__}
 
     @classmethod
     def from_dict(cls, data: dict) -> "SampleLocation":
+        # Intern the low-cardinality fields so N samples in the same box
+        # share one string object
+        storage_type = data.get("storage_type", "")
+        position = data.get("position", "")
         return cls(
-            storage_type=data.get("storage_type", ""),
+            storage_type=sys.intern(storage_type) if storage_type else storage_type,
             location_id=data.get("location_id", ""),
-            position=data.get("position", ""),
+            position=sys.intern(position) if position else position,
             notes=data.get("notes", ""),
         )
 
     def __str__(self) -> str:
         """Human-readable location string."""
-        parts = []
-        if self.storage_type:
-            parts.append(self.storage_type)
-        if self.location_id:
-            parts.append(self.location_id)
-        if self.position:
-            parts.append(f"pos: {self.position}")
-        return " / ".join(parts) if parts else "Unknown"
-
-
-@dataclass
+        # Single BUILD_STRING instead of list-append-join; str() runs on
+        # every log %s and list redraw, even when the output is discarded
+        return (
+            f"{self.storage_type}"
+            f"{' / ' if self.storage_type and self.location_id else ''}"
+            f"{self.location_id}"
+            f"{' / ' if (self.storage_type or self.location_id) and self.position else ''}"
+            f"{f'pos: {self.position}' if self.position else ''}"
+        ) or "Unknown"
+
+
+@cache_fields
+@dataclass(slots=True)
 class LocationHistoryEntry:
     """Record of a sample location change."""
     location: SampleLocation
@@ -77,13 +97,14 @@ class LocationHistoryEntry:
         )
 
 
-@dataclass
+@cache_fields
+@dataclass(slots=True)
 class Sample:
     """
     A physical sample produced from an experiment.
     One experiment can produce multiple samples (e.g., different substrate regions).
     """
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     experiment_id: str = ""            # Which experiment produced this
 
     # Identification
@@ -103,55 +124,19 @@ class Sample:
     status: str = SampleStatus.ACTIVE
 
     # Links to characterization
-    characterization_ids: list[str] = field(default_factory=list)
+    characterization_ids: list[str] = _EMPTY
 
     # Notes
     notes: str = ""
 
     # Timestamps
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    modified_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=fast_iso_now)
+    modified_at: str = field(default_factory=fast_iso_now)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "experiment_id": self.experiment_id,
-            "name": self.name,
-            "label": self.label,
-            "substrate_region": self.substrate_region,
-            "current_location": self.current_location.to_dict() if self.current_location else None,
-            "location_history": [entry.to_dict() for entry in self.location_history],
-            "status": self.status,
-            "characterization_ids": self.characterization_ids,
-            "notes": self.notes,
-            "created_at": self.created_at,
-            "modified_at": self.modified_at,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "Sample":
-        """Create from dictionary (JSON deserialization)."""
-        current_loc_data = data.get("current_location")
-        current_location = SampleLocation.from_dict(current_loc_data) if current_loc_data else None
-
-        history_data = data.get("location_history", [])
-        location_history = [LocationHistoryEntry.from_dict(entry) for entry in history_data]
-
-        return cls(
-            id=data.get("id", str(uuid4())),
-            experiment_id=data.get("experiment_id", ""),
-            name=data.get("name", ""),
-            label=data.get("label", ""),
-            substrate_region=data.get("substrate_region", ""),
-            current_location=current_location,
-            location_history=location_history,
-            status=data.get("status", SampleStatus.ACTIVE),
-            characterization_ids=data.get("characterization_ids", []),
-            notes=data.get("notes", ""),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            modified_at=data.get("modified_at", datetime.now().isoformat()),
-        )
+    def __repr__(self) -> str:
+        # Short id slice; the dataclass default would format all twelve
+        # fields (full UUID, history list, ...) on every debug/log line
+        return f"Sample(id={self.id[:8]}, name={self.name!r}, status={self.status})"
 
     def move_to(self, new_location: SampleLocation, moved_by: str = "", reason: str = "") -> None:
         """Move sample to a new location, recording history."""
@@ -159,7 +144,7 @@ class Sample:
         if self.current_location:
             history_entry = LocationHistoryEntry(
                 location=self.current_location,
-                moved_at=datetime.now().isoformat(),
+                moved_at=fast_iso_now(),
                 moved_by=moved_by,
                 reason=reason,
             )
@@ -167,23 +152,93 @@ class Sample:
 
         # Update current location
         self.current_location = new_location
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = fast_iso_now()
+
+    def add_characterization(self, characterization_id: str) -> None:
+        """Link a characterization record, upgrading the shared empty default."""
+        if self.characterization_ids is _EMPTY:
+            self.characterization_ids = []
+        if characterization_id not in self.characterization_ids:
+            self.characterization_ids.append(characterization_id)
+        self.modified_at = fast_iso_now()
 
     def mark_consumed(self, notes: str = "") -> None:
         """Mark sample as consumed (used up)."""
         self.status = SampleStatus.CONSUMED
         if notes:
             self.notes = f"{self.notes}\nConsumed: {notes}".strip()
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = fast_iso_now()
 
     def mark_lost(self, notes: str = "") -> None:
         """Mark sample as lost."""
         self.status = SampleStatus.LOST
         if notes:
             self.notes = f"{self.notes}\nLost: {notes}".strip()
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = fast_iso_now()
 
     def archive(self) -> None:
         """Archive the sample."""
         self.status = SampleStatus.ARCHIVED
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = fast_iso_now()
+
+
+# Generated serializer (see _serde): the location dicts and the history
+# list are fused into one expression, so a 100-move sample skips the
+# per-entry to_dict calls and intermediate dict allocations
+Sample.to_dict = make_to_dict(
+    Sample,
+    {
+        "id": "self.id",
+        "experiment_id": "self.experiment_id",
+        "name": "self.name",
+        "label": "self.label",
+        "substrate_region": "self.substrate_region",
+        "current_location": (
+            f"{section_dict_expr(SampleLocation, 'loc')} if loc else None"
+        ),
+        "location_history": (
+            "[{'location': "
+            + section_dict_expr(SampleLocation, "e.location")
+            + ", 'moved_at': e.moved_at, 'moved_by': e.moved_by,"
+            " 'reason': e.reason} for e in self.location_history]"
+        ),
+        "status": "self.status",
+        "characterization_ids": "self.characterization_ids",
+        "notes": "self.notes",
+        "created_at": "self.created_at",
+        "modified_at": "self.modified_at",
+    },
+    prelude=("loc = self.current_location",),
+)
+
+# Generated deserializer (see _serde): inlines every key as a literal so
+# bulk loads skip per-call reflection
+Sample.from_dict = make_from_dict(
+    Sample,
+    {
+        "id": "data.get('id') or new_id()",
+        "experiment_id": "data.get('experiment_id', '')",
+        "name": "data.get('name', '')",
+        "label": "data.get('label', '')",
+        "substrate_region": "data.get('substrate_region', '')",
+        "current_location": "SampleLocation.from_dict(loc) if loc else None",
+        "location_history": (
+            "[LocationHistoryEntry.from_dict(entry)"
+            " for entry in data.get('location_history', ())]"
+        ),
+        "status": "data.get('status', SampleStatus.ACTIVE)",
+        "characterization_ids": "data.get('characterization_ids') or _EMPTY",
+        "notes": "data.get('notes', '')",
+        "created_at": "data.get('created_at') or fast_iso_now()",
+        "modified_at": "data.get('modified_at') or fast_iso_now()",
+    },
+    namespace={
+        "new_id": new_id,
+        "fast_iso_now": fast_iso_now,
+        "SampleLocation": SampleLocation,
+        "LocationHistoryEntry": LocationHistoryEntry,
+        "SampleStatus": SampleStatus,
+        "_EMPTY": _EMPTY,
+    },
+    prelude=("loc = data.get('current_location')",),
+)
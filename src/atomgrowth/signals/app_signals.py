@@ -10,6 +10,7 @@ class AppSignals(QObject):
     """
 
     _instance = None
+    _init_done = False
 
     # ===== Template signals =====
     template_created = Signal(str)           # template_id
@@ -50,20 +51,20 @@ class AppSignals(QObject):
     status_message = Signal(str, int)        # (message, timeout_ms)
     busy_state_changed = Signal(bool)
 
+    def __new__(cls) -> "AppSignals":
+        # Duplicate construction is a pointer return - stray AppSignals()
+        # calls must not allocate a second QObject with its signal tables
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
-        # Only initialize once
-        if not hasattr(self, '_initialized'):
+        # __init__ runs on every AppSignals() call; only init the QObject once
+        if not AppSignals._init_done:
             super().__init__()
-            self._initialized = True
-
-
-# Module-level singleton instance
-_app_signals_instance: AppSignals | None = None
+            AppSignals._init_done = True
 
 
 def get_app_signals() -> AppSignals:
     """Get the singleton AppSignals instance"""
-    global _app_signals_instance
-    if _app_signals_instance is None:
-        _app_signals_instance = AppSignals()
-    return _app_signals_instance
+    return AppSignals()
@@ -80,3 +80,24 @@ class NotionColors:
     SECTION_PRECURSOR_BG = "#DBEDDB"
     SECTION_SUBSTRATE = "#9B59B6"
     SECTION_SUBSTRATE_BG = "#F3E5F5"
+
+    # Parsed-QColor cache for palette/paint paths; "#RRGGBB" -> QColor
+    # parsing is a measurable per-call cost inside paint loops
+    _qcolor_cache: dict = {}
+
+    @classmethod
+    def qcolor(cls, name: str):
+        """
+        Return a memoized QColor for a named palette entry, e.g.
+        ``NotionColors.qcolor("PRIMARY")``.
+
+        Paint and palette code should prefer this over ``QColor(cls.PRIMARY)``
+        so each hex string is parsed exactly once per process. The Qt import
+        is deferred so this module stays importable without a GUI stack.
+        """
+        color = cls._qcolor_cache.get(name)
+        if color is None:
+            from PySide6.QtGui import QColor
+            color = QColor(getattr(cls, name))
+            cls._qcolor_cache[name] = color
+        return color
@@ -6,10 +6,117 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QWidget, QScrollArea
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QKeyEvent
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QKeyEvent
 
-from atomgrowth.styles.colors import NotionColors
+from atomgrowth.ui.thumb_cache import ThumbCache, get_thumb_cache
+
+# Default cache is ~10 MB - a couple of camera images; 256 MB keeps a whole
+# preview session's decoded pixmaps resident
+QPixmapCache.setCacheLimit(256 * 1024)
+
+
+def _scale_to_fit(source, max_width, max_height, mode=Qt.SmoothTransformation):
+    """
+    Scale a QImage/QPixmap down to fit, via a two-stage pyramid.
+
+    A single SmoothTransformation pass on a far-larger source runs the
+    bilinear filter over every source pixel. Box-downsampling by the
+    integer ratio with FastTransformation first (to ~2x the target) cuts
+    that to a fraction, and the final smooth pass from 2x keeps quality.
+    """
+    ratio = max(
+        source.width() // (2 * max_width),
+        source.height() // (2 * max_height),
+        1,
+    )
+    if ratio > 1:
+        source = source.scaled(
+            source.width() // ratio, source.height() // ratio,
+            Qt.KeepAspectRatio, Qt.FastTransformation
+        )
+    return source.scaled(max_width, max_height, Qt.KeepAspectRatio, mode)
+
+
+class _DecodeTaskSignals(QObject):
+    """Signal holder for decode tasks (QRunnable can't carry signals)."""
+    decoded = Signal(QImage, QImage, int)  # (original, scaled, token)
+    preloaded = Signal(QImage, str)        # (original, cache key)
+
+
+class _DecodeTask(QRunnable):
+    """
+    Decode an image at (or below) the viewport size on a pool thread.
+
+    QImage/QImageReader are safe off the GUI thread; QPixmap is not, so
+    the conversion happens in the dialog's slot on the main thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_width: int,
+        max_height: int,
+        token: int,
+        signals: _DecodeTaskSignals,
+        thumb_path: Optional[Path] = None,
+        thumb_cache: Optional[ThumbCache] = None,
+    ):
+        super().__init__()
+        self._path = path
+        self._max_width = max_width
+        self._max_height = max_height
+        self._token = token
+        self._signals = signals
+        self._thumb_path = thumb_path
+        self._thumb_cache = thumb_cache
+
+    def run(self):
+        reader = QImageReader(self._path)
+        reader.setAutoTransform(True)
+        src = reader.size()
+        if (src.isValid()
+                and (src.width() > self._max_width
+                     or src.height() > self._max_height)):
+            # Decode straight at the target size - JPEG/PNG decoders can
+            # skip work, and the full-res intermediate never exists. No
+            # original to cache in this case, so emit a null placeholder.
+            reader.setScaledSize(
+                src.scaled(self._max_width, self._max_height, Qt.KeepAspectRatio)
+            )
+            scaled = reader.read()
+            if self._thumb_cache is not None and self._thumb_path is not None:
+                # Persist the scaled result so a warm restart skips the
+                # full decode entirely (still on the pool thread)
+                self._thumb_cache.store(scaled, self._thumb_path)
+            self._signals.decoded.emit(QImage(), scaled, self._token)
+        elif not (image := reader.read()).isNull() and (
+            image.width() > self._max_width
+            or image.height() > self._max_height
+        ):
+            # The decoder couldn't report a size up front, so the full
+            # frame got decoded anyway; pyramid-scale it down here
+            scaled = _scale_to_fit(image, self._max_width, self._max_height)
+            self._signals.decoded.emit(image, scaled, self._token)
+        else:
+            # Already fits - one decode serves as both the original and
+            # the displayed image
+            self._signals.decoded.emit(image, image, self._token)
+
+
+class _PreloadTask(QRunnable):
+    """Decode a neighbor image into the cache without touching the UI."""
+
+    def __init__(self, path: str, key: str, signals: _DecodeTaskSignals):
+        super().__init__()
+        self._path = path
+        self._key = key
+        self._signals = signals
+
+    def run(self):
+        reader = QImageReader(self._path)
+        reader.setAutoTransform(True)
+        self._signals.preloaded.emit(reader.read(), self._key)
 
 
 class ImagePreviewDialog(QDialog):
@@ -35,6 +142,19 @@ class ImagePreviewDialog(QDialog):
         self.images_dir = images_dir
         self.current_index = initial_index
 
+        # Monotonic token so late decode results for a superseded image
+        # (fast next/next/next clicking) are dropped instead of displayed
+        self._load_token = 0
+        self._pending_keys: dict[int, tuple[str, str]] = {}
+        self._decode_signals = _DecodeTaskSignals()
+        self._decode_signals.decoded.connect(self._on_image_decoded)
+        self._decode_signals.preloaded.connect(self._on_image_preloaded)
+        self._preload_inflight: set[str] = set()
+        self._thumb_cache = get_thumb_cache()
+        # (index, max_w, max_h, smooth?) of the last render, to skip
+        # reloads triggered by events that changed none of them
+        self._last_render_state: tuple = ()
+
         self.setWindowTitle("Image Preview")
         self.setMinimumSize(800, 600)
         self.resize(1000, 750)
@@ -45,78 +165,59 @@ class ImagePreviewDialog(QDialog):
 
     def _setup_ui(self):
         """Set up the UI."""
+        # Coalesce resize bursts: a drag fires dozens of resizeEvents per
+        # second and each reload is a decode + smooth scale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        self._is_resizing = False
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Header with filename and close button
+        # Header with filename and close button. All chrome styling lives
+        # in the application-level sheet (notion_light.qss) keyed by object
+        # names, so Qt parses and caches it once instead of once per widget
         header = QWidget()
-        header.setStyleSheet(f"""
-            background-color: {NotionColors.SIDEBAR_BG};
-            border-bottom: 1px solid {NotionColors.BORDER};
-        """)
+        header.setObjectName("previewHeader")
         header.setFixedHeight(48)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(16, 0, 16, 0)
 
         self.filename_label = QLabel()
-        self.filename_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 500;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        self.filename_label.setObjectName("previewFilename")
         header_layout.addWidget(self.filename_label)
 
         header_layout.addStretch()
 
         # Image counter
         self.counter_label = QLabel()
-        self.counter_label.setStyleSheet(f"""
-            font-size: 13px;
-            color: {NotionColors.TEXT_SECONDARY};
-        """)
+        self.counter_label.setObjectName("previewCounter")
         header_layout.addWidget(self.counter_label)
 
         layout.addWidget(header)
 
         # Image area
         image_container = QWidget()
-        image_container.setStyleSheet(f"background-color: {NotionColors.BACKGROUND};")
+        image_container.setObjectName("previewImageArea")
         image_layout = QHBoxLayout(image_container)
         image_layout.setContentsMargins(16, 16, 16, 16)
 
         # Left navigation button
         self.prev_btn = QPushButton("<")
+        self.prev_btn.setObjectName("navButton")
         self.prev_btn.setFixedSize(40, 40)
         self.prev_btn.setCursor(Qt.PointingHandCursor)
         self.prev_btn.clicked.connect(self._show_previous)
-        self.prev_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.SIDEBAR_BG};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 20px;
-                font-size: 18px;
-                font-weight: bold;
-                color: {NotionColors.TEXT_SECONDARY};
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-                color: {NotionColors.TEXT_PRIMARY};
-            }}
-            QPushButton:disabled {{
-                color: {NotionColors.BORDER};
-            }}
-        """)
         image_layout.addWidget(self.prev_btn)
 
         # Scrollable image area
         scroll = QScrollArea()
+        scroll.setObjectName("previewScroll")
         scroll.setWidgetResizable(True)
         scroll.setAlignment(Qt.AlignCenter)
-        scroll.setStyleSheet("""
-            QScrollArea { border: none; background: transparent; }
-            QScrollArea > QWidget > QWidget { background: transparent; }
-        """)
 
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
@@ -127,20 +228,17 @@ class ImagePreviewDialog(QDialog):
 
         # Right navigation button
         self.next_btn = QPushButton(">")
+        self.next_btn.setObjectName("navButton")
         self.next_btn.setFixedSize(40, 40)
         self.next_btn.setCursor(Qt.PointingHandCursor)
         self.next_btn.clicked.connect(self._show_next)
-        self.next_btn.setStyleSheet(self.prev_btn.styleSheet())
         image_layout.addWidget(self.next_btn)
 
         layout.addWidget(image_container, 1)
 
         # Footer with actions
         footer = QWidget()
-        footer.setStyleSheet(f"""
-            background-color: {NotionColors.SIDEBAR_BG};
-            border-top: 1px solid {NotionColors.BORDER};
-        """)
+        footer.setObjectName("previewFooter")
         footer.setFixedHeight(56)
         footer_layout = QHBoxLayout(footer)
         footer_layout.setContentsMargins(16, 0, 16, 0)
@@ -152,19 +250,6 @@ class ImagePreviewDialog(QDialog):
         close_btn.setFixedSize(100, 36)
         close_btn.setCursor(Qt.PointingHandCursor)
         close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.PRIMARY_HOVER};
-            }}
-        """)
         footer_layout.addWidget(close_btn)
 
         layout.addWidget(footer)
@@ -183,34 +268,160 @@ class ImagePreviewDialog(QDialog):
         else:
             full_path = Path(image_path)
 
+        # Scale to fit while maintaining aspect ratio
+        # Get available size (approximate)
+        max_width = self.width() - 150
+        max_height = self.height() - 150
+
+        # Same image at the same size and quality is already on screen -
+        # resizeEvent also fires for moves/activation, and the debounced
+        # smooth pass may land after a drag that changed nothing
+        state = (self.current_index, max_width, max_height, not self._is_resizing)
+        if state == self._last_render_state:
+            return
+        self._last_render_state = state
+
+        # Every render supersedes whatever decode may still be in flight,
+        # including renders served straight from the cache - otherwise a
+        # stale worker result would pass the token check in
+        # _on_image_decoded and overwrite the newer image
+        self._load_token += 1
+
         # Update labels
         self.filename_label.setText(Path(image_path).name)
         self.counter_label.setText(f"{self.current_index + 1} / {len(self.image_paths)}")
 
-        # Load image
-        if full_path.exists():
-            pixmap = QPixmap(str(full_path))
-            if not pixmap.isNull():
-                # Scale to fit while maintaining aspect ratio
-                # Get available size (approximate)
-                max_width = self.width() - 150
-                max_height = self.height() - 150
-
-                scaled = pixmap.scaled(
-                    max_width, max_height,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
+        # Load image. The mtime stat below doubles as the existence probe -
+        # a separate exists() would be a second syscall per navigation
+        try:
+            mtime_ns = full_path.stat().st_mtime_ns
+        except OSError:
+            self.image_label.setText(f"File not found:\n{full_path}")
+        else:
+            # Cache both the decoded original and the scaled variant, keyed
+            # on path + mtime so an edited file isn't served stale. Flipping
+            # back to an image or resizing to a known size skips the decode
+            # (and often the scale) entirely.
+            key = f"{full_path}|{mtime_ns}"
+
+            scaled_key = f"{key}|{max_width}x{max_height}"
+            scaled = QPixmap()
+            pixmap = QPixmap()
+            if not self._is_resizing and QPixmapCache.find(scaled_key, scaled):
+                self.image_label.setPixmap(scaled)
+            elif QPixmapCache.find(key, pixmap):
+                # Decoded original is cached; only the (cheap) rescale
+                # happens on the GUI thread - and typical microscopy
+                # exports already fit, skipping even that. Mid-drag frames
+                # use the ~4x cheaper nearest-neighbor filter; the smooth
+                # pass runs once the resize settles.
+                if (pixmap.width() <= max_width
+                        and pixmap.height() <= max_height):
+                    scaled = pixmap
+                else:
+                    scaled = _scale_to_fit(
+                        pixmap, max_width, max_height,
+                        Qt.FastTransformation if self._is_resizing
+                        else Qt.SmoothTransformation
+                    )
+                if not self._is_resizing:
+                    # Never cache the fast-filtered frames
+                    QPixmapCache.insert(scaled_key, scaled)
                 self.image_label.setPixmap(scaled)
+            elif self._is_resizing:
+                # Cold decode mid-drag: keep the current frame; the
+                # debounced smooth pass will fetch it
+                pass
             else:
-                self.image_label.setText("Failed to load image")
-        else:
-            self.image_label.setText(f"File not found:\n{full_path}")
+                # Warm restart: a previous session may have left the scaled
+                # PNG in the disk cache - loading ~100 KB beats re-decoding
+                # the multi-MB original
+                thumb = self._thumb_cache.lookup(
+                    str(full_path), mtime_ns, max_width, max_height
+                )
+                if thumb is not None and not (
+                    scaled := QPixmap(str(thumb))
+                ).isNull():
+                    QPixmapCache.insert(scaled_key, scaled)
+                    self.image_label.setPixmap(scaled)
+                else:
+                    # Cold: decode + scale on a pool thread so navigation
+                    # stays responsive; the previous image stays up until
+                    # the result arrives in _on_image_decoded
+                    self._pending_keys[self._load_token] = (key, scaled_key)
+                    QThreadPool.globalInstance().start(_DecodeTask(
+                        str(full_path),
+                        max_width, max_height,
+                        self._load_token,
+                        self._decode_signals,
+                        thumb_path=self._thumb_cache.thumb_path(
+                            str(full_path), mtime_ns, max_width, max_height
+                        ),
+                        thumb_cache=self._thumb_cache,
+                    ))
 
         # Update button states
         self.prev_btn.setEnabled(self.current_index > 0)
         self.next_btn.setEnabled(self.current_index < len(self.image_paths) - 1)
 
+        # Warm the cache for the neighbors so sequential browsing never
+        # waits on a cold decode
+        self._preload_neighbors()
+
+    def _preload_neighbors(self):
+        """Queue background decodes of the previous/next images."""
+        for index in (self.current_index - 1, self.current_index + 1):
+            if not 0 <= index < len(self.image_paths):
+                continue
+
+            image_path = self.image_paths[index]
+            if self.images_dir:
+                full_path = self.images_dir / image_path
+            else:
+                full_path = Path(image_path)
+            # Single stat doubles as existence check and cache-key input
+            try:
+                mtime_ns = full_path.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            key = f"{full_path}|{mtime_ns}"
+            if key in self._preload_inflight:
+                continue
+            probe = QPixmap()
+            if QPixmapCache.find(key, probe):
+                continue
+
+            self._preload_inflight.add(key)
+            QThreadPool.globalInstance().start(
+                _PreloadTask(str(full_path), key, self._decode_signals)
+            )
+
+    def _on_image_preloaded(self, image: QImage, key: str):
+        """Insert a finished neighbor decode into the pixmap cache."""
+        self._preload_inflight.discard(key)
+        if not image.isNull():
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+
+    def _on_image_decoded(self, image: QImage, scaled: QImage, token: int):
+        """Receive a worker decode result on the GUI thread."""
+        keys = self._pending_keys.pop(token, None)
+        if keys is None or token != self._load_token:
+            return  # superseded by a later navigation/resize
+
+        if scaled.isNull():
+            self.image_label.setText("Failed to load image")
+            return
+
+        key, scaled_key = keys
+        if not image.isNull():
+            # Only present when the worker did a full-res decode; a
+            # size-limited decode has no original to cache
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+        scaled_pixmap = QPixmap.fromImage(scaled)
+        QPixmapCache.insert(scaled_key, scaled_pixmap)
+        self.image_label.setPixmap(scaled_pixmap)
+
     def _show_previous(self):
         """Show the previous image."""
         if self.current_index > 0:
@@ -234,7 +445,16 @@ class ImagePreviewDialog(QDialog):
         else:
             super().keyPressEvent(event)
 
+    def _on_resize_settled(self):
+        """Run the final smooth-quality reload after a resize burst."""
+        self._is_resizing = False
+        self._load_current_image()
+
     def resizeEvent(self, event):
-        """Reload image on resize to fit new size."""
+        """Rescale cheaply while dragging; smooth reload once settled."""
         super().resizeEvent(event)
+        if event.size() == event.oldSize():
+            return  # move/activation, not an actual size change
+        self._is_resizing = True
+        self._resize_timer.start()
         self._load_current_image()
@@ -9,7 +9,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from atomgrowth.core.template_manager import TemplateManager
-from atomgrowth.styles.colors import NotionColors
 
 
 class NewExperimentDialog(QDialog):
@@ -37,12 +36,11 @@ class NewExperimentDialog(QDialog):
         layout.setSpacing(20)
 
         # Title
+        # Styling lives in the application-level sheet (notion_light.qss)
+        # keyed by object names, so Qt parses and caches it once instead of
+        # once per widget
         title = QLabel("Create New Experiment")
-        title.setStyleSheet(f"""
-            font-size: 20px;
-            font-weight: 600;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("dialogTitle")
         layout.addWidget(title)
 
         # Form
@@ -53,59 +51,27 @@ class NewExperimentDialog(QDialog):
 
         # Template selection
         template_label = QLabel("Template")
-        template_label.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 500;
-            color: {NotionColors.TEXT_SECONDARY};
-        """)
+        template_label.setObjectName("fieldLabel")
         form_layout.addWidget(template_label)
 
         self.template_combo = QComboBox()
         self.template_combo.setMinimumHeight(40)
-        self.template_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {NotionColors.BACKGROUND};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: {NotionColors.TEXT_PRIMARY};
-            }}
-            QComboBox:focus {{
-                border-color: {NotionColors.PRIMARY};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 30px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid {NotionColors.TEXT_SECONDARY};
-                margin-right: 10px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {NotionColors.BACKGROUND};
-                border: 1px solid {NotionColors.BORDER};
-                selection-background-color: {NotionColors.BACKGROUND_HOVER};
-            }}
-        """)
-
-        # Populate templates
+
+        # Populate templates in one batch with signals suppressed -
+        # per-addItem model signals (and popup relayouts) would make dialog
+        # open time grow with the template count
         templates = self.template_manager.list_templates()
-        for template in templates:
-            self.template_combo.addItem(template.name, template.id)
+        self.template_combo.blockSignals(True)
+        self.template_combo.addItems([t.name for t in templates])
+        for i, template in enumerate(templates):
+            self.template_combo.setItemData(i, template.id)
+        self.template_combo.blockSignals(False)
 
         form_layout.addWidget(self.template_combo)
 
         # Experiment name
         name_label = QLabel("Experiment Name")
-        name_label.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 500;
-            color: {NotionColors.TEXT_SECONDARY};
-        """)
+        name_label.setObjectName("fieldLabel")
         form_layout.addWidget(name_label)
 
         self.name_input = QLineEdit()
@@ -113,19 +79,6 @@ class NewExperimentDialog(QDialog):
         # Default name with date
         default_name = f"Experiment {datetime.now().strftime('%Y-%m-%d')}"
         self.name_input.setText(default_name)
-        self.name_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {NotionColors.BACKGROUND};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: {NotionColors.TEXT_PRIMARY};
-            }}
-            QLineEdit:focus {{
-                border-color: {NotionColors.PRIMARY};
-            }}
-        """)
         form_layout.addWidget(self.name_input)
 
         layout.addWidget(form)
@@ -142,38 +95,13 @@ class NewExperimentDialog(QDialog):
         cancel_btn.setFixedSize(100, 40)
         cancel_btn.setCursor(Qt.PointingHandCursor)
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.BACKGROUND};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 6px;
-                font-size: 14px;
-                color: {NotionColors.TEXT_SECONDARY};
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-                border-color: {NotionColors.TEXT_TERTIARY};
-            }}
-        """)
         button_row.addWidget(cancel_btn)
 
         create_btn = QPushButton("Create")
+        create_btn.setObjectName("primaryButton")
         create_btn.setFixedSize(100, 40)
         create_btn.setCursor(Qt.PointingHandCursor)
         create_btn.clicked.connect(self._on_create)
-        create_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.PRIMARY};
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: 500;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.PRIMARY_HOVER};
-            }}
-        """)
         button_row.addWidget(create_btn)
 
         layout.addLayout(button_row)
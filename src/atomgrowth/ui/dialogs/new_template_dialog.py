@@ -8,7 +8,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from atomgrowth.core.template_manager import TemplateManager
-from atomgrowth.styles.colors import NotionColors
 
 
 class NewTemplateDialog(QDialog):
@@ -41,12 +40,9 @@ class NewTemplateDialog(QDialog):
         layout.setSpacing(16)
 
         # Title
+        # Styled from the application-level sheet by object name
         title = QLabel("Create New Template")
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 700;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("dialogTitleSmall")
         layout.addWidget(title)
 
         # Name field
@@ -60,10 +56,16 @@ class NewTemplateDialog(QDialog):
         parent_label = QLabel("Inherit From:")
         layout.addWidget(parent_label)
         self.parent_combo = QComboBox()
-        self.parent_combo.addItem("(None - Base Template)", None)
 
-        for template in self.template_manager.list_templates():
-            self.parent_combo.addItem(template.name, template.id)
+        # Batch-populate with signals suppressed so open time stays flat
+        # as the template count grows
+        templates = self.template_manager.list_templates()
+        self.parent_combo.blockSignals(True)
+        self.parent_combo.addItem("(None - Base Template)", None)
+        self.parent_combo.addItems([t.name for t in templates])
+        for i, template in enumerate(templates, start=1):
+            self.parent_combo.setItemData(i, template.id)
+        self.parent_combo.blockSignals(False)
 
         # Set default parent if provided
         if self._parent_id:
@@ -5,18 +5,64 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QListWidget, QListWidgetItem,
     QStackedWidget, QSplitter, QFrame, QLineEdit,
-    QStatusBar
+    QStatusBar, QStyle, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QBrush, QFont, QPainter, QPen
 
 from atomgrowth.signals.app_signals import get_app_signals
+from atomgrowth.styles.colors import NotionColors
 from atomgrowth.core.template_manager import TemplateManager
 from atomgrowth.core.experiment_manager import ExperimentManager
 from atomgrowth.ui.views.template_list import TemplateListView
 from atomgrowth.ui.views.experiment_list import ExperimentListView
 
 
+class NavItemDelegate(QStyledItemDelegate):
+    """
+    Paints sidebar navigation rows with cached pens and brushes.
+
+    Per-row QSS styling makes Qt walk the CSS cascade on every repaint;
+    the delegate reduces a row to fill + text draw with QColors parsed
+    once via the NotionColors cache.
+    """
+
+    _RADIUS = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._selected_bg = QBrush(NotionColors.qcolor("SIDEBAR_ITEM_SELECTED"))
+        self._hover_bg = QBrush(NotionColors.qcolor("SIDEBAR_ITEM_HOVER"))
+        self._selected_pen = QPen(NotionColors.qcolor("PRIMARY"))
+        self._text_pen = QPen(NotionColors.qcolor("TEXT_PRIMARY"))
+
+    def paint(self, painter: QPainter, option, index):
+        painter.save()
+        rect = option.rect.adjusted(0, 2, 0, -2)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        if option.state & QStyle.State_Selected:
+            painter.setBrush(self._selected_bg)
+            painter.drawRoundedRect(rect, self._RADIUS, self._RADIUS)
+            painter.setPen(self._selected_pen)
+        else:
+            if option.state & QStyle.State_MouseOver:
+                painter.setBrush(self._hover_bg)
+                painter.drawRoundedRect(rect, self._RADIUS, self._RADIUS)
+            painter.setPen(self._text_pen)
+        painter.drawText(
+            rect.adjusted(14, 0, -14, 0),
+            Qt.AlignVCenter | Qt.AlignLeft,
+            index.data(),
+        )
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        hint = super().sizeHint(option, index)
+        hint.setHeight(hint.height() + 20)
+        return hint
+
+
 class SidebarWidget(QWidget):
     """Notion-style sidebar with navigation"""
 
@@ -53,6 +99,8 @@ class SidebarWidget(QWidget):
         # Navigation list
         self.nav_list = QListWidget()
         self.nav_list.setObjectName("navList")
+        self.nav_list.setItemDelegate(NavItemDelegate(self.nav_list))
+        self.nav_list.setMouseTracking(True)  # hover state for the delegate
 
         # Add navigation items
         nav_items = [
@@ -85,7 +133,12 @@ class SidebarWidget(QWidget):
         if current:
             key = current.data(Qt.UserRole)
             self.navigation_changed.emit(key)
-            get_app_signals().navigation_changed.emit(key)
+            # Defer the app-wide broadcast so heavy subscriber work (view
+            # materialization, refreshes) runs after the list-selection
+            # event returns instead of nested inside it
+            QTimer.singleShot(
+                0, lambda k=key: get_app_signals().navigation_changed.emit(k)
+            )
 
 
 class PlaceholderView(QWidget):
@@ -98,11 +151,11 @@ class PlaceholderView(QWidget):
         layout.setAlignment(Qt.AlignCenter)
 
         label = QLabel(title)
-        label.setStyleSheet("font-size: 24px; color: #9B9A97; font-weight: 500;")
+        label.setObjectName("placeholderTitle")
         layout.addWidget(label)
 
         subtitle = QLabel("Coming soon...")
-        subtitle.setStyleSheet("font-size: 14px; color: #B0B0B0;")
+        subtitle.setObjectName("placeholderSubtitle")
         layout.addWidget(subtitle)
 
 
@@ -149,20 +202,21 @@ class MainWindow(QMainWindow):
         self.content_stack = QStackedWidget()
         self.content_stack.setObjectName("contentStack")
 
-        # Create views
-        self.views = {
-            "templates": TemplateListView(self.template_manager),
-            "experiments": ExperimentListView(
+        # View factories - each view is only constructed (and added to the
+        # stack) the first time the user navigates to it, so launch doesn't
+        # pay for every view up front
+        self._view_factories = {
+            "templates": lambda: TemplateListView(self.template_manager),
+            "experiments": lambda: ExperimentListView(
                 experiment_manager=self.experiment_manager,
                 template_manager=self.template_manager,
                 images_dir=self.images_dir
             ),
-            "samples": PlaceholderView("Samples"),
-            "gallery": PlaceholderView("Gallery"),
+            "samples": lambda: PlaceholderView("Samples"),
+            "gallery": lambda: PlaceholderView("Gallery"),
         }
-
-        for key, view in self.views.items():
-            self.content_stack.addWidget(view)
+        # view key -> stack index, filled in as views materialize
+        self._view_index: dict[str, int] = {}
 
         content_layout.addWidget(self.content_stack)
 
@@ -176,6 +230,9 @@ class MainWindow(QMainWindow):
         # Connect signals
         self._connect_signals()
 
+        # The landing view is the only one built eagerly
+        self.content_stack.setCurrentIndex(self._ensure_view("templates"))
+
     def _init_managers(self):
         """Initialize data managers"""
         # Get user data directory
@@ -254,10 +311,18 @@ class MainWindow(QMainWindow):
         signals = get_app_signals()
         signals.status_message.connect(self._show_status_message)
 
+    def _ensure_view(self, view_name: str) -> int:
+        """Materialize a view on first use; return its stack index."""
+        index = self._view_index.get(view_name)
+        if index is None:
+            view = self._view_factories[view_name]()
+            index = self.content_stack.addWidget(view)
+            self._view_index[view_name] = index
+        return index
+
     def _on_navigation_changed(self, view_name: str):
         """Handle navigation changes"""
-        view_index = list(self.views.keys()).index(view_name)
-        self.content_stack.setCurrentIndex(view_index)
+        self.content_stack.setCurrentIndex(self._ensure_view(view_name))
         self.status_bar.showMessage(f"Viewing: {view_name.title()}")
 
     def _show_status_message(self, message: str, timeout: int):
@@ -0,0 +1,93 @@
+"""Persistent disk cache of pre-scaled preview images"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtGui import QImage
+
+# Keep roughly a browsing session's worth of ~100 KB scaled PNGs
+_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class ThumbCache:
+    """
+    Disk cache of viewport-scaled images under ~/.cache/atomgrowth/thumbs.
+
+    Entries are keyed on source path + mtime + target size, so an edited
+    file or a different window size misses cleanly. A warm restart then
+    reads a small PNG instead of re-decoding the multi-MB original.
+
+    All methods are safe to call from pool threads; the only shared state
+    is the filesystem.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = _MAX_CACHE_BYTES,
+    ):
+        self._dir = cache_dir or Path.home() / ".cache" / "atomgrowth" / "thumbs"
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    def thumb_path(
+        self, source: str, mtime_ns: int, width: int, height: int
+    ) -> Path:
+        """Compute the cache file path for a source image + target size."""
+        digest = hashlib.sha1(
+            f"{source}|{mtime_ns}|{width}x{height}".encode()
+        ).hexdigest()
+        return self._dir / f"{digest}.png"
+
+    def lookup(
+        self, source: str, mtime_ns: int, width: int, height: int
+    ) -> Optional[Path]:
+        """Return the cached thumbnail path, or None on a miss."""
+        path = self.thumb_path(source, mtime_ns, width, height)
+        return path if path.exists() else None
+
+    def store(self, image: QImage, path: Path) -> None:
+        """Write a scaled image to the cache and trim to the size cap."""
+        if image.isNull():
+            return
+        if image.save(str(path), "PNG"):
+            self._trim()
+
+    def _trim(self) -> None:
+        """Evict least-recently-read entries until under the byte cap."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self._dir) as it:
+                for entry in it:
+                    st = entry.stat()
+                    total += st.st_size
+                    entries.append((st.st_atime, st.st_size, entry.path))
+        except OSError:
+            return
+
+        if total <= self._max_bytes:
+            return
+
+        entries.sort()  # oldest access time first
+        for _atime, size, path in entries:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self._max_bytes:
+                break
+
+
+_instance: Optional[ThumbCache] = None
+
+
+def get_thumb_cache() -> ThumbCache:
+    """Get the shared ThumbCache instance."""
+    global _instance
+    if _instance is None:
+        _instance = ThumbCache()
+    return _instance
@@ -1,13 +1,17 @@
 """Experiment editor view for viewing and editing experiment details"""
 
+import functools
+import math
 from pathlib import Path
 from typing import Optional, Any
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QTextEdit, QScrollArea, QFrame, QFileDialog,
-    QMessageBox, QDoubleSpinBox, QSpinBox, QGridLayout
+    QLineEdit, QTextEdit, QScrollArea, QFrame,
+    QDoubleSpinBox, QSpinBox, QGridLayout
+)
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QSignalBlocker, QThreadPool, QTimer, Signal
 )
-from PySide6.QtCore import Qt, Signal
 
 from atomgrowth.core.experiment_manager import ExperimentManager
 from atomgrowth.core.template_manager import TemplateManager
@@ -15,11 +19,72 @@ from atomgrowth.models.experiment import Experiment
 from atomgrowth.signals.app_signals import get_app_signals
 from atomgrowth.styles.colors import NotionColors
 from atomgrowth.ui.widgets.image_drop_zone import ImageDropZone
-from atomgrowth.ui.dialogs.image_preview_dialog import ImagePreviewDialog
 
+# QFileDialog, QMessageBox and ImagePreviewDialog are imported inside the
+# handlers that open them - they're only needed after user interaction and
+# keeping them out of the module import shortens cold start
+
+
+# Editable parameters, grouped by recipe section: (section title,
+# section-title object name for QSS, ((label, field_path, type, unit,
+# min, max, decimals), ...)). Adding a parameter means adding a row
+# here, not another hand-written construction block.
+_PARAM_SPEC = (
+    ("Temperature", "sectionTitleTemperature", (
+        ("Peak Temp", "temperature.peak_temp", "float", "°C", 0, 1200, 0),
+        ("Hold Time", "temperature.peak_hold_time", "float", "min", 0, 120, 0),
+        ("Ramp Rate", "temperature.ramp_rate_2", "float", "°C/min", 0, 50, 1),
+    )),
+    ("Gas Flow", "sectionTitleGasFlow", (
+        ("Ar Flow", "gas_flow.ar_flow", "float", "sccm", 0, 500, 0),
+        ("H2 Flow", "gas_flow.h2_flow", "float", "sccm", 0, 100, 0),
+    )),
+    ("Precursor", "sectionTitlePrecursor", (
+        ("MoO3", "precursor.moo3_amount", "float", "mg", 0, 100, 1),
+        ("Sulfur", "precursor.s_amount", "float", "mg", 0, 500, 0),
+    )),
+)
+
+@functools.lru_cache(maxsize=2048)
+def _basename(path: str) -> str:
+    """Memoized Path(path).name - list refreshes re-see the same paths."""
+    return Path(path).name
+
+
+class _SaveTaskSignals(QObject):
+    """Signals for _SaveTask; emitted from a pool thread."""
+
+    finished = Signal(bool, str)  # success, error message
+
+
+class _SaveTask(QRunnable):
+    """Serializes the experiment store to disk off the UI thread."""
+
+    def __init__(self, experiment_manager: ExperimentManager,
+                 signals: _SaveTaskSignals):
+        super().__init__()
+        self._manager = experiment_manager
+        self._signals = signals
+
+    def run(self):
+        try:
+            self._manager.save()
+        except Exception as e:
+            self._signals.finished.emit(False, str(e))
+        else:
+            self._signals.finished.emit(True, "")
+
+
+class ParameterField(QObject):
+    """
+    A single parameter row with inherited value display and override
+    capability.
 
-class ParameterField(QWidget):
-    """A single parameter field with inherited value display and override capability."""
+    Creates the row's widgets (label, input, unit, inherited indicator,
+    reset button) but leaves placement to the caller, which lays all rows
+    out in one QGridLayout - a flat grid invalidates far cheaper on
+    resize than a per-row QHBoxLayout nested in a QVBoxLayout.
+    """
 
     value_changed = Signal(str, object)  # field_path, new_value
 
@@ -39,110 +104,117 @@ class ParameterField(QWidget):
         self.field_type = field_type
         self._inherited_value: Any = None
         self._is_overridden = False
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
+        self._style_overridden: Optional[bool] = None
 
         # Label
         self.label = QLabel(label)
         self.label.setFixedWidth(120)
-        self.label.setStyleSheet(f"font-size: 13px; color: {NotionColors.TEXT_SECONDARY};")
-        layout.addWidget(self.label)
+        self.label.setObjectName("paramFieldLabel")
 
         # Input field
+        # Per-keystroke signals only drive the cheap style preview; the
+        # value itself is committed on editingFinished (enter / focus-out),
+        # which fires once per edit instead of once per digit
         if field_type == "float":
             self.input = QDoubleSpinBox()
             self.input.setRange(min_val, max_val)
             self.input.setDecimals(decimals)
-            self.input.valueChanged.connect(self._on_value_changed)
+            self.input.valueChanged.connect(self._on_value_preview)
         elif field_type == "int":
             self.input = QSpinBox()
             self.input.setRange(int(min_val), int(max_val))
-            self.input.valueChanged.connect(self._on_value_changed)
+            self.input.valueChanged.connect(self._on_value_preview)
         else:
             self.input = QLineEdit()
-            self.input.textChanged.connect(self._on_value_changed)
+            self.input.textChanged.connect(self._on_value_preview)
+        self.input.editingFinished.connect(self._on_editing_finished)
 
+        self.input.setObjectName("paramInput")
         self.input.setFixedWidth(100)
         self._apply_input_style(False)
-        layout.addWidget(self.input)
 
         # Unit label
+        self.unit_label: Optional[QLabel] = None
         if unit:
-            unit_label = QLabel(unit)
-            unit_label.setStyleSheet(f"font-size: 12px; color: {NotionColors.TEXT_TERTIARY};")
-            layout.addWidget(unit_label)
+            self.unit_label = QLabel(unit)
+            self.unit_label.setObjectName("paramFieldUnit")
 
         # Inherited value indicator
         self.inherited_label = QLabel()
-        self.inherited_label.setStyleSheet(f"font-size: 11px; color: {NotionColors.TEXT_TERTIARY}; font-style: italic;")
-        layout.addWidget(self.inherited_label)
+        self.inherited_label.setObjectName("paramFieldInherited")
 
         # Reset button (to revert to inherited value)
         self.reset_btn = QPushButton("Reset")
+        self.reset_btn.setObjectName("paramResetButton")
         self.reset_btn.setFixedSize(50, 24)
         self.reset_btn.setCursor(Qt.PointingHandCursor)
         self.reset_btn.clicked.connect(self._on_reset)
         self.reset_btn.setVisible(False)
-        self.reset_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 4px;
-                font-size: 11px;
-                color: {NotionColors.TEXT_TERTIARY};
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-            }}
-        """)
-        layout.addWidget(self.reset_btn)
-
-        layout.addStretch()
 
     def _apply_input_style(self, is_overridden: bool):
         """Apply styling based on override state."""
-        if is_overridden:
-            border_color = NotionColors.PRIMARY
-            bg_color = NotionColors.PRIMARY_LIGHT
-        else:
-            border_color = NotionColors.BORDER
-            bg_color = NotionColors.BACKGROUND
-
-        self.input.setStyleSheet(f"""
-            QDoubleSpinBox, QSpinBox, QLineEdit {{
-                background-color: {bg_color};
-                border: 1px solid {border_color};
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 13px;
-            }}
-            QDoubleSpinBox:focus, QSpinBox:focus, QLineEdit:focus {{
-                border-color: {NotionColors.PRIMARY};
-            }}
-        """)
+        if is_overridden == self._style_overridden:
+            return  # already applied - skip the repolish entirely
+        self._style_overridden = is_overridden
+        # Flip the dynamic property the app stylesheet selects on and
+        # repolish just this widget - no stylesheet re-parse, no cascade
+        # over the rest of the window
+        self.input.setProperty("overridden", is_overridden)
+        style = self.input.style()
+        style.unpolish(self.input)
+        style.polish(self.input)
 
     def set_inherited_value(self, value: Any):
         """Set the inherited value from template."""
         self._inherited_value = value
         self.inherited_label.setText(f"(template: {value})")
 
+    def _input_matches(self, value: Any) -> bool:
+        """Whether the input widget already displays the given value."""
+        if self.field_type == "float":
+            return value is not None and math.isclose(
+                self.input.value(), float(value)
+            )
+        if self.field_type == "int":
+            return value is not None and self.input.value() == int(value)
+        return self.input.text() == (str(value) if value is not None else "")
+
     def set_value(self, value: Any, is_override: bool = False):
         """Set the current value."""
+        if is_override == self._is_overridden and self._input_matches(value):
+            return  # widget already shows this exact state
         self._is_overridden = is_override
-        self.input.blockSignals(True)
+        with QSignalBlocker(self.input):
+            if self.field_type == "float":
+                self.input.setValue(float(value) if value is not None else 0.0)
+            elif self.field_type == "int":
+                self.input.setValue(int(value) if value is not None else 0)
+            else:
+                self.input.setText(str(value) if value is not None else "")
+        self._apply_input_style(is_override)
+        self.reset_btn.setVisible(is_override)
 
-        if self.field_type == "float":
-            self.input.setValue(float(value) if value is not None else 0.0)
-        elif self.field_type == "int":
-            self.input.setValue(int(value) if value is not None else 0)
-        else:
-            self.input.setText(str(value) if value is not None else "")
+    def set_inherited_and_value(
+        self, inherited: Any, value: Any, is_override: bool = False
+    ):
+        """
+        Set inherited and current value in one pass.
 
-        self.input.blockSignals(False)
+        Bulk loads call this instead of set_inherited_value + set_value:
+        one signal-block window, one style application, one label update.
+        """
+        self._inherited_value = inherited
+        self._is_overridden = is_override
+        with QSignalBlocker(self.input):
+            if self.field_type == "float":
+                self.input.setValue(float(value) if value is not None else 0.0)
+            elif self.field_type == "int":
+                self.input.setValue(int(value) if value is not None else 0)
+            else:
+                self.input.setText(str(value) if value is not None else "")
         self._apply_input_style(is_override)
         self.reset_btn.setVisible(is_override)
+        self.inherited_label.setText(f"(template: {inherited})")
 
     def get_value(self) -> Any:
         """Get the current value."""
@@ -155,8 +227,14 @@ class ParameterField(QWidget):
         """Check if value is overridden from template."""
         return self._is_overridden
 
-    def _on_value_changed(self):
-        """Handle value change."""
+    def _on_value_preview(self):
+        """Cheap per-tick feedback while the user is still editing."""
+        if self.get_value() != self._inherited_value:
+            self._apply_input_style(True)
+            self.reset_btn.setVisible(True)
+
+    def _on_editing_finished(self):
+        """Commit the value once editing settles."""
         current = self.get_value()
         # Check if different from inherited
         if current != self._inherited_value:
@@ -201,9 +279,43 @@ class ExperimentEditorView(QWidget):
         self._current_experiment: Optional[Experiment] = None
         self._signals = get_app_signals()
         self._param_fields: dict[str, ParameterField] = {}
+        # (field_path, field) pairs frozen after construction; bulk loops
+        # walk this tuple instead of rehashing dict keys
+        self._all_fields: tuple[tuple[str, ParameterField], ...] = ()
+        # {field_path: inherited value} for the loaded experiment's
+        # template - _on_param_changed fires per keystroke/spin tick, and
+        # re-resolving the inheritance chain each time is wasted work
+        self._inherited_values: dict[str, Any] = {}
+
+        # Spinbox ticks arrive many times a second while the user holds an
+        # arrow or types; buffer them and apply once on the trailing edge
+        self._pending_changes: dict[str, Any] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(75)
+        self._flush_timer.timeout.connect(self._flush_param_changes)
+
+        # Disk writes run on the global pool; the cross-thread emit comes
+        # back to the UI thread as a queued connection
+        self._save_signals = _SaveTaskSignals()
+        self._save_signals.finished.connect(self._on_save_finished)
+        self._saving_experiment_id: Optional[str] = None
+
+        # {image path: position}, rebuilt whenever images are set, so a
+        # thumbnail click is a dict hit instead of a list scan
+        self._image_index_map: dict[str, int] = {}
+
+        # Signature of the experiment as last loaded/saved; repeated Save
+        # clicks with nothing changed skip the serialization entirely
+        self._last_saved_signature: Optional[int] = None
+        self._pending_save_signature: Optional[int] = None
 
         self._setup_ui()
 
+        # Template edits can change inherited values under a loaded
+        # experiment; refresh the cached map when that happens
+        self._signals.template_modified.connect(self._on_template_modified)
+
     def _setup_ui(self):
         """Set up the UI."""
         layout = QVBoxLayout(self)
@@ -216,52 +328,29 @@ class ExperimentEditorView(QWidget):
 
         # Scrollable content area
         scroll = QScrollArea()
+        scroll.setObjectName("editorScroll")
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: {NotionColors.BACKGROUND};
-            }}
-        """)
 
         content = QWidget()
-        content.setStyleSheet(f"background-color: {NotionColors.BACKGROUND};")
+        content.setObjectName("editorContent")
         self.content_layout = QVBoxLayout(content)
         self.content_layout.setContentsMargins(32, 24, 32, 24)
         self.content_layout.setSpacing(24)
 
         # Placeholder when no experiment selected
         self.placeholder = QLabel("Select an experiment to view details")
+        self.placeholder.setObjectName("editorPlaceholder")
         self.placeholder.setAlignment(Qt.AlignCenter)
-        self.placeholder.setStyleSheet(f"""
-            font-size: 16px;
-            color: {NotionColors.TEXT_TERTIARY};
-            padding: 60px;
-        """)
         self.content_layout.addWidget(self.placeholder)
 
-        # Parameters section (editable)
-        self.params_section = self._create_params_section()
-        self.params_section.setVisible(False)
-        self.content_layout.addWidget(self.params_section)
-
-        # Images section
-        self.image_drop_zone = ImageDropZone(images_dir=self.images_dir)
-        self.image_drop_zone.images_dropped.connect(self._on_images_dropped)
-        self.image_drop_zone.image_clicked.connect(self._on_image_clicked)
-        self.image_drop_zone.setVisible(False)
-        self.content_layout.addWidget(self.image_drop_zone)
-
-        # Raman section
-        self.raman_section = self._create_raman_section()
-        self.raman_section.setVisible(False)
-        self.content_layout.addWidget(self.raman_section)
-
-        # Notes section
-        self.notes_section = self._create_notes_section()
-        self.notes_section.setVisible(False)
-        self.content_layout.addWidget(self.notes_section)
+        # The heavy sections (parameters, images, raman, notes) are built
+        # by _ensure_sections on the first load_experiment call; until
+        # then the view is just the header, placeholder and footer
+        self.params_section: Optional[QWidget] = None
+        self.image_drop_zone: Optional[ImageDropZone] = None
+        self.raman_section: Optional[QWidget] = None
+        self.notes_section: Optional[QWidget] = None
 
         self.content_layout.addStretch()
 
@@ -272,16 +361,30 @@ class ExperimentEditorView(QWidget):
         footer = self._create_footer()
         layout.addWidget(footer)
 
+    def _ensure_sections(self):
+        """Build the editor sections the first time they are needed."""
+        if self.params_section is not None:
+            return
+
+        # Insert after the placeholder (index 0), before the stretch
+        self.params_section = self._create_params_section()
+        self.content_layout.insertWidget(1, self.params_section)
+
+        self.image_drop_zone = ImageDropZone(images_dir=self.images_dir)
+        self.image_drop_zone.images_dropped.connect(self._on_images_dropped)
+        self.image_drop_zone.image_clicked.connect(self._on_image_clicked)
+        self.content_layout.insertWidget(2, self.image_drop_zone)
+
+        self.raman_section = self._create_raman_section()
+        self.content_layout.insertWidget(3, self.raman_section)
+
+        self.notes_section = self._create_notes_section()
+        self.content_layout.insertWidget(4, self.notes_section)
+
     def _create_header(self) -> QWidget:
         """Create the header with experiment name and date."""
         header = QWidget()
         header.setObjectName("experimentEditorHeader")
-        header.setStyleSheet(f"""
-            QWidget#experimentEditorHeader {{
-                background-color: {NotionColors.BACKGROUND};
-                border-bottom: 1px solid {NotionColors.BORDER};
-            }}
-        """)
         header.setFixedHeight(80)
 
         layout = QVBoxLayout(header)
@@ -290,30 +393,13 @@ class ExperimentEditorView(QWidget):
 
         # Name input
         self.name_input = QLineEdit()
+        self.name_input.setObjectName("experimentNameInput")
         self.name_input.setPlaceholderText("Experiment name")
-        self.name_input.setStyleSheet(f"""
-            QLineEdit {{
-                border: none;
-                background: transparent;
-                font-size: 24px;
-                font-weight: 600;
-                color: {NotionColors.TEXT_PRIMARY};
-                padding: 0;
-            }}
-            QLineEdit:focus {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-        """)
         layout.addWidget(self.name_input)
 
         # Date and template info
         self.info_label = QLabel()
-        self.info_label.setStyleSheet(f"""
-            font-size: 13px;
-            color: {NotionColors.TEXT_SECONDARY};
-        """)
+        self.info_label.setObjectName("editorInfoLabel")
         layout.addWidget(self.info_label)
 
         return header
@@ -321,13 +407,7 @@ class ExperimentEditorView(QWidget):
     def _create_params_section(self) -> QWidget:
         """Create the editable parameters section."""
         section = QFrame()
-        section.setStyleSheet(f"""
-            QFrame {{
-                background-color: {NotionColors.SIDEBAR_BG};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 8px;
-            }}
-        """)
+        section.setObjectName("paramsCard")
 
         layout = QVBoxLayout(section)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -336,92 +416,47 @@ class ExperimentEditorView(QWidget):
         # Section title
         title_row = QHBoxLayout()
         title = QLabel("CVD Parameters")
-        title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("paramsTitle")
         title_row.addWidget(title)
 
         # Template name
         self.template_name_label = QLabel()
-        self.template_name_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {NotionColors.TEXT_TERTIARY};
-        """)
+        self.template_name_label.setObjectName("templateNameLabel")
         title_row.addWidget(self.template_name_label)
         title_row.addStretch()
 
         layout.addLayout(title_row)
 
-        # Temperature section
-        temp_title = QLabel("Temperature")
-        temp_title.setStyleSheet(f"""
-            font-size: 12px;
-            font-weight: 600;
-            color: {NotionColors.SECTION_TEMPERATURE};
-            margin-top: 8px;
-        """)
-        layout.addWidget(temp_title)
-
-        self._param_fields["temperature.peak_temp"] = ParameterField(
-            "Peak Temp", "temperature.peak_temp", "float", "°C", 0, 1200, 0
-        )
-        layout.addWidget(self._param_fields["temperature.peak_temp"])
-
-        self._param_fields["temperature.peak_hold_time"] = ParameterField(
-            "Hold Time", "temperature.peak_hold_time", "float", "min", 0, 120, 0
-        )
-        layout.addWidget(self._param_fields["temperature.peak_hold_time"])
-
-        self._param_fields["temperature.ramp_rate_2"] = ParameterField(
-            "Ramp Rate", "temperature.ramp_rate_2", "float", "°C/min", 0, 50, 1
-        )
-        layout.addWidget(self._param_fields["temperature.ramp_rate_2"])
-
-        # Gas Flow section
-        gas_title = QLabel("Gas Flow")
-        gas_title.setStyleSheet(f"""
-            font-size: 12px;
-            font-weight: 600;
-            color: {NotionColors.SECTION_GAS_FLOW};
-            margin-top: 8px;
-        """)
-        layout.addWidget(gas_title)
-
-        self._param_fields["gas_flow.ar_flow"] = ParameterField(
-            "Ar Flow", "gas_flow.ar_flow", "float", "sccm", 0, 500, 0
-        )
-        layout.addWidget(self._param_fields["gas_flow.ar_flow"])
-
-        self._param_fields["gas_flow.h2_flow"] = ParameterField(
-            "H2 Flow", "gas_flow.h2_flow", "float", "sccm", 0, 100, 0
-        )
-        layout.addWidget(self._param_fields["gas_flow.h2_flow"])
-
-        # Precursor section
-        precursor_title = QLabel("Precursor")
-        precursor_title.setStyleSheet(f"""
-            font-size: 12px;
-            font-weight: 600;
-            color: {NotionColors.SECTION_PRECURSOR};
-            margin-top: 8px;
-        """)
-        layout.addWidget(precursor_title)
-
-        self._param_fields["precursor.moo3_amount"] = ParameterField(
-            "MoO3", "precursor.moo3_amount", "float", "mg", 0, 100, 1
-        )
-        layout.addWidget(self._param_fields["precursor.moo3_amount"])
+        # One flat grid for all rows; section titles span every column
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(8)
+        grid.setVerticalSpacing(12)
+        grid.setColumnStretch(5, 1)  # trailing stretch column
+
+        row = 0
+        for section_title, object_name, field_specs in _PARAM_SPEC:
+            section_label = QLabel(section_title)
+            section_label.setObjectName(object_name)
+            grid.addWidget(section_label, row, 0, 1, 6)
+            row += 1
+
+            for label, path, ftype, unit, lo, hi, decimals in field_specs:
+                field = ParameterField(
+                    label, path, ftype, unit, lo, hi, decimals, parent=self
+                )
+                field.value_changed.connect(self._on_param_changed)
+                self._param_fields[path] = field
+                grid.addWidget(field.label, row, 0)
+                grid.addWidget(field.input, row, 1)
+                if field.unit_label is not None:
+                    grid.addWidget(field.unit_label, row, 2)
+                grid.addWidget(field.inherited_label, row, 3)
+                grid.addWidget(field.reset_btn, row, 4)
+                row += 1
 
-        self._param_fields["precursor.s_amount"] = ParameterField(
-            "Sulfur", "precursor.s_amount", "float", "mg", 0, 500, 0
-        )
-        layout.addWidget(self._param_fields["precursor.s_amount"])
+        self._all_fields = tuple(self._param_fields.items())
 
-        # Connect all fields
-        for field in self._param_fields.values():
-            field.value_changed.connect(self._on_param_changed)
+        layout.addLayout(grid)
 
         return section
 
@@ -435,31 +470,14 @@ class ExperimentEditorView(QWidget):
         # Title with add button
         title_row = QHBoxLayout()
         title = QLabel("Raman Files")
-        title.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 600;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("editorSectionTitle")
         title_row.addWidget(title)
         title_row.addStretch()
 
         add_btn = QPushButton("+ Add")
+        add_btn.setObjectName("linkButton")
         add_btn.setCursor(Qt.PointingHandCursor)
         add_btn.clicked.connect(self._on_add_raman_clicked)
-        add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {NotionColors.PRIMARY};
-                font-size: 13px;
-                font-weight: 500;
-                padding: 4px 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-                border-radius: 4px;
-            }}
-        """)
         title_row.addWidget(add_btn)
 
         layout.addLayout(title_row)
@@ -473,13 +491,12 @@ class ExperimentEditorView(QWidget):
 
         # Placeholder
         self.raman_placeholder = QLabel("No Raman files added")
-        self.raman_placeholder.setStyleSheet(f"""
-            font-size: 13px;
-            color: {NotionColors.TEXT_TERTIARY};
-            padding: 16px;
-        """)
+        self.raman_placeholder.setObjectName("ramanPlaceholder")
         self.raman_list_layout.addWidget(self.raman_placeholder)
 
+        # Pool of row labels, reused across refreshes
+        self._raman_rows: list[QLabel] = []
+
         return section
 
     def _create_notes_section(self) -> QWidget:
@@ -490,29 +507,13 @@ class ExperimentEditorView(QWidget):
         layout.setSpacing(8)
 
         title = QLabel("Notes & Observations")
-        title.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 600;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("editorSectionTitle")
         layout.addWidget(title)
 
         self.notes_edit = QTextEdit()
+        self.notes_edit.setObjectName("notesEdit")
         self.notes_edit.setPlaceholderText("Add your experiment notes here...")
         self.notes_edit.setMinimumHeight(150)
-        self.notes_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {NotionColors.SIDEBAR_BG};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 14px;
-                color: {NotionColors.TEXT_PRIMARY};
-            }}
-            QTextEdit:focus {{
-                border-color: {NotionColors.PRIMARY};
-            }}
-        """)
         layout.addWidget(self.notes_edit)
 
         return section
@@ -521,12 +522,6 @@ class ExperimentEditorView(QWidget):
         """Create the footer with save button."""
         footer = QWidget()
         footer.setObjectName("experimentEditorFooter")
-        footer.setStyleSheet(f"""
-            QWidget#experimentEditorFooter {{
-                background-color: {NotionColors.SIDEBAR_BG};
-                border-top: 1px solid {NotionColors.BORDER};
-            }}
-        """)
         footer.setFixedHeight(64)
 
         layout = QHBoxLayout(footer)
@@ -539,19 +534,6 @@ class ExperimentEditorView(QWidget):
         self.save_btn.setFixedSize(100, 36)
         self.save_btn.setCursor(Qt.PointingHandCursor)
         self.save_btn.clicked.connect(self._on_save)
-        self.save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.PRIMARY_HOVER};
-            }}
-        """)
         layout.addWidget(self.save_btn)
 
         return footer
@@ -564,9 +546,14 @@ class ExperimentEditorView(QWidget):
         if not experiment:
             return
 
+        # Apply edits still sitting in the debounce buffer to the outgoing
+        # experiment before swapping in the new one
+        self._flush_param_changes()
+
         self._current_experiment = experiment
 
-        # Show all sections
+        # Build (on first use) and show all sections
+        self._ensure_sections()
         self.placeholder.setVisible(False)
         self.params_section.setVisible(True)
         self.image_drop_zone.setVisible(True)
@@ -577,31 +564,43 @@ class ExperimentEditorView(QWidget):
         self.name_input.setText(experiment.name)
 
         # Format date
-        date_str = experiment.created_at[:10] if experiment.created_at else "Unknown date"
-        self.info_label.setText(f"Created: {date_str}")
+        self.info_label.setText(
+            f"Created: {experiment.date_str or 'Unknown date'}"
+        )
 
         # Load template and populate parameter fields
         template = self.template_manager.get_template(experiment.template_id)
         if template:
             self.template_name_label.setText(f"(based on: {template.name})")
-            resolved = self.template_manager.resolve_template(template.id)
 
-            # Set inherited values and current values for each field
-            for field_path, field in self._param_fields.items():
-                # Get inherited value from template
-                inherited = self.template_manager._get_field_value(resolved, field_path)
-                field.set_inherited_value(inherited)
+            # Resolve the chain once and cache every field's inherited
+            # value; param-change handlers read the map instead
+            self._load_inherited_values(template.id)
 
-                # Check if overridden in experiment
-                if field_path in experiment.overrides:
-                    field.set_value(experiment.overrides[field_path], is_override=True)
-                else:
-                    field.set_value(inherited, is_override=False)
+            # Populate every field with repaints suspended so Qt coalesces
+            # the style recomputes and layout churn into one frame
+            overrides = experiment.overrides
+            self.params_section.setUpdatesEnabled(False)
+            try:
+                for field_path, field in self._all_fields:
+                    inherited = self._inherited_values[field_path]
+                    if field_path in overrides:
+                        field.set_inherited_and_value(
+                            inherited, overrides[field_path], is_override=True
+                        )
+                    else:
+                        field.set_inherited_and_value(
+                            inherited, inherited, is_override=False
+                        )
+            finally:
+                self.params_section.setUpdatesEnabled(True)
+            self.params_section.update()
         else:
             self.template_name_label.setText("(template not found)")
+            self._inherited_values = {}
 
         # Update images
-        self.image_drop_zone.set_images(experiment.optical_images)
+        self._set_images(experiment.optical_images)
 
         # Update raman files
         self._refresh_raman_list()
@@ -609,44 +608,99 @@ class ExperimentEditorView(QWidget):
         # Update notes
         self.notes_edit.setText(experiment.notes or "")
 
+        # Baseline for the no-change save short-circuit
+        self._last_saved_signature = self._experiment_signature(experiment)
+
+    @staticmethod
+    def _experiment_signature(experiment: Experiment) -> int:
+        """Hash of the savable state of an experiment."""
+        return hash((
+            experiment.name,
+            experiment.notes,
+            tuple(sorted(experiment.overrides.items())),
+            tuple(experiment.optical_images),
+            tuple(experiment.raman_files),
+        ))
+
+    def _set_images(self, images: list[str]):
+        """Push images to the drop zone and rebuild the index map."""
+        self.image_drop_zone.set_images(images)
+        self._image_index_map = {path: i for i, path in enumerate(images)}
+
+    def _load_inherited_values(self, template_id: str):
+        """Build the {field_path: inherited value} map for a template."""
+        resolved = self.template_manager.resolve_template(template_id)
+        get_value = self.template_manager._get_field_value
+        self._inherited_values = {
+            field_path: get_value(resolved, field_path)
+            for field_path in self._param_fields
+        }
+
     def clear(self):
         """Clear the editor."""
+        self._flush_param_changes()
         self._current_experiment = None
+        self._inherited_values = {}
         self.placeholder.setVisible(True)
-        self.params_section.setVisible(False)
-        self.image_drop_zone.setVisible(False)
-        self.raman_section.setVisible(False)
-        self.notes_section.setVisible(False)
+        if self.params_section is not None:
+            self.params_section.setVisible(False)
+            self.image_drop_zone.setVisible(False)
+            self.raman_section.setVisible(False)
+            self.notes_section.setVisible(False)
+            self.notes_edit.clear()
         self.name_input.clear()
         self.info_label.clear()
-        self.notes_edit.clear()
 
     # ==================== Event Handlers ====================
 
     def _on_param_changed(self, field_path: str, value: Any):
-        """Handle parameter value change."""
+        """Buffer a parameter change; applied after the input settles."""
         if not self._current_experiment:
             return
+        self._pending_changes[field_path] = value
+        self._flush_timer.start()
 
-        if value is None:
-            # Remove override
-            self._current_experiment.remove_override(field_path)
-        else:
-            # Get inherited value to check if actually different
-            template = self.template_manager.get_template(self._current_experiment.template_id)
-            if template:
-                resolved = self.template_manager.resolve_template(template.id)
-                inherited = self.template_manager._get_field_value(resolved, field_path)
-                if value != inherited:
+    def _flush_param_changes(self):
+        """Apply buffered parameter changes to the experiment."""
+        self._flush_timer.stop()
+        if not self._pending_changes:
+            return
+        changes, self._pending_changes = self._pending_changes, {}
+        if not self._current_experiment:
+            return
+
+        for field_path, value in changes.items():
+            if value is None:
+                # Remove override
+                self._current_experiment.remove_override(field_path)
+            elif field_path in self._inherited_values:
+                # Compare against the cached inherited value instead of
+                # re-resolving the template chain on every keystroke
+                if value != self._inherited_values[field_path]:
                     self._current_experiment.set_override(field_path, value)
                 else:
                     self._current_experiment.remove_override(field_path)
 
+    def _on_template_modified(self, _template_id: str):
+        """Rebuild the inherited-value cache after a template edit."""
+        if not self._current_experiment:
+            return
+        template = self.template_manager.get_template(
+            self._current_experiment.template_id
+        )
+        if not template:
+            return
+        self._load_inherited_values(template.id)
+        for field_path, field in self._all_fields:
+            field.set_inherited_value(self._inherited_values[field_path])
+
     def _on_images_dropped(self, paths: list[Path]):
         """Handle dropped image files."""
         if not self._current_experiment:
             return
 
+        from PySide6.QtWidgets import QMessageBox
+
         for path in paths:
             try:
                 self.experiment_manager.add_image_to_experiment(
@@ -656,22 +710,19 @@ class ExperimentEditorView(QWidget):
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to add image: {e}")
 
-        # Refresh the display
-        experiment = self.experiment_manager.get_experiment(self._current_experiment.id)
-        if experiment:
-            self._current_experiment = experiment
-            self.image_drop_zone.set_images(experiment.optical_images)
+        # The manager mutates our Experiment instance in place, so refresh
+        # straight from it - no need to re-fetch from the store
+        self._set_images(self._current_experiment.optical_images)
 
     def _on_image_clicked(self, image_path: str):
         """Handle image thumbnail click - open preview."""
         if not self._current_experiment:
             return
 
+        from atomgrowth.ui.dialogs.image_preview_dialog import ImagePreviewDialog
+
         images = self._current_experiment.optical_images
-        try:
-            index = images.index(image_path)
-        except ValueError:
-            index = 0
+        index = self._image_index_map.get(image_path, 0)
 
         dialog = ImagePreviewDialog(
             image_paths=images,
@@ -686,6 +737,8 @@ class ExperimentEditorView(QWidget):
         if not self._current_experiment:
             return
 
+        from PySide6.QtWidgets import QFileDialog, QMessageBox
+
         file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Select Raman Files",
@@ -702,54 +755,78 @@ class ExperimentEditorView(QWidget):
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to add file: {e}")
 
-        # Refresh
-        experiment = self.experiment_manager.get_experiment(self._current_experiment.id)
-        if experiment:
-            self._current_experiment = experiment
-            self._refresh_raman_list()
+        # The manager mutates our Experiment instance in place, so refresh
+        # straight from it - no need to re-fetch from the store
+        self._refresh_raman_list()
 
     def _refresh_raman_list(self):
         """Refresh the Raman files list display."""
-        # Clear existing items (except placeholder)
-        while self.raman_list_layout.count() > 1:
-            item = self.raman_list_layout.takeAt(1)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if not self._current_experiment or not self._current_experiment.raman_files:
-            self.raman_placeholder.setVisible(True)
-            return
-
-        self.raman_placeholder.setVisible(False)
-
-        for file_path in self._current_experiment.raman_files:
-            item = QLabel(f"  {Path(file_path).name}")
-            item.setStyleSheet(f"""
-                font-size: 13px;
-                color: {NotionColors.TEXT_SECONDARY};
-                padding: 8px 12px;
-                background-color: {NotionColors.SIDEBAR_BG};
-                border-radius: 4px;
-            """)
-            self.raman_list_layout.addWidget(item)
+        files = (
+            self._current_experiment.raman_files
+            if self._current_experiment else []
+        )
+        self.raman_placeholder.setVisible(not files)
+
+        # Update pooled rows in place instead of tearing the widgets down
+        # and rebuilding them - adding one file only touches one label
+        for i, file_path in enumerate(files):
+            if i < len(self._raman_rows):
+                row = self._raman_rows[i]
+            else:
+                row = QLabel()
+                row.setObjectName("ramanItem")
+                self.raman_list_layout.addWidget(row)
+                self._raman_rows.append(row)
+            row.setText(f"  {_basename(file_path)}")
+            row.setVisible(True)
+
+        # Hide (don't destroy) surplus rows from a previous experiment
+        for row in self._raman_rows[len(files):]:
+            row.setVisible(False)
 
     def _on_save(self):
         """Save the experiment."""
         if not self._current_experiment:
             return
 
+        # Make sure debounced parameter edits land before serializing
+        self._flush_param_changes()
+
         # Update from UI
         self._current_experiment.name = self.name_input.text().strip()
         self._current_experiment.notes = self.notes_edit.toPlainText()
 
         # Validate
         if not self._current_experiment.name:
+            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Validation Error", "Experiment name is required.")
             return
 
-        # Save
+        # Skip the write when nothing changed since load/last save
+        signature = self._experiment_signature(self._current_experiment)
+        if signature == self._last_saved_signature:
+            self._signals.status_message.emit("No changes to save", 1500)
+            return
+
+        # Apply in memory on the UI thread, then push the JSON write to a
+        # pool thread so the event loop never blocks on disk
         self.experiment_manager.update_experiment(self._current_experiment)
-        self.experiment_manager.save()
+        self._saving_experiment_id = self._current_experiment.id
+        self._pending_save_signature = signature
+        self.save_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            _SaveTask(self.experiment_manager, self._save_signals)
+        )
 
+    def _on_save_finished(self, success: bool, error: str):
+        """Handle completion of the background save."""
+        self.save_btn.setEnabled(True)
+        if not success:
+            from PySide6.QtWidgets import QMessageBox
+            QMessageBox.warning(self, "Error", f"Failed to save: {error}")
+            return
+        self._last_saved_signature = self._pending_save_signature
         self._signals.status_message.emit("Experiment saved", 3000)
-        self.experiment_saved.emit(self._current_experiment.id)
+        if self._saving_experiment_id:
+            self.experiment_saved.emit(self._saving_experiment_id)
+            self._saving_experiment_id = None
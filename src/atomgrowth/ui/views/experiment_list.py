@@ -1,20 +1,201 @@
 """Experiment list view with date/template sorting options"""
 
+import functools
 from pathlib import Path
 from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem,
+    QButtonGroup, QListView, QTreeView,
     QStackedWidget, QSplitter, QFrame, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, QAbstractItemModel, QAbstractListModel, QModelIndex, QObject,
+    QSignalBlocker, QThreadPool, QTimer, Signal
+)
 
 from atomgrowth.core.experiment_manager import ExperimentManager
 from atomgrowth.core.template_manager import TemplateManager
-from atomgrowth.models.experiment import Experiment
 from atomgrowth.signals.app_signals import get_app_signals
-from atomgrowth.styles.colors import NotionColors
-from atomgrowth.ui.views.experiment_editor import ExperimentEditorView
+from atomgrowth.ui.views.experiment_editor import (
+    ExperimentEditorView, _SaveTask, _SaveTaskSignals
+)
+
+
+@functools.cache
+def _new_experiment_dialog_cls():
+    """Import NewExperimentDialog on first use; repeat clicks skip the
+    sys.modules probe and pay a single cached lookup."""
+    from atomgrowth.ui.dialogs.new_experiment_dialog import NewExperimentDialog
+    return NewExperimentDialog
+
+
+class ExperimentListModel(QAbstractListModel):
+    """
+    List model over (experiment id, name, date) rows.
+
+    set_rows diffs the incoming rows against the current ones and emits
+    dataChanged / insert / remove for just the delta, so a save or create
+    touches the changed rows instead of rebuilding N widget items.
+
+    Rows materialize lazily: only the first _FETCH_CHUNK are exposed
+    up-front and the view pulls further chunks through canFetchMore /
+    fetchMore as the user scrolls, so initial view time is constant no
+    matter how many experiments exist.
+    """
+
+    _FETCH_CHUNK = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Full sorted row set; _rows is the prefix exposed to the view
+        self._all_rows: list[tuple[str, str, str]] = []
+        self._rows: list[tuple[str, str, str]] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < len(self._all_rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = len(self._rows)
+        end = min(start + self._FETCH_CHUNK, len(self._all_rows))
+        if end <= start:
+            return
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._rows.extend(self._all_rows[start:end])
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        exp_id, name, date_str = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{name}\n{date_str}"
+        if role == Qt.UserRole:
+            return exp_id
+        return None
+
+    def set_rows(self, rows: list[tuple[str, str, str]]):
+        """Apply new rows, emitting change signals only for the delta.
+
+        The diff runs against the fetched prefix only; rows the user has
+        never scrolled to stay unmaterialized.
+        """
+        self._all_rows = rows
+        target = rows[:max(len(self._rows), self._FETCH_CHUNK)]
+        new_ids = {row[0] for row in target}
+
+        # Drop vanished rows first (backwards so indices stay valid)
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self._rows[i][0] not in new_ids:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+
+        remaining = {row[0] for row in self._rows}
+        for i, row in enumerate(target):
+            if i < len(self._rows) and self._rows[i][0] == row[0]:
+                # Same row; refresh its text if the payload changed
+                if self._rows[i] != row:
+                    self._rows[i] = row
+                    index = self.index(i)
+                    self.dataChanged.emit(index, index)
+            elif row[0] in remaining:
+                # Surviving rows changed relative order (a re-sort); a
+                # reset is cheaper and rarer than computing row moves
+                self.beginResetModel()
+                self._rows = list(target)
+                self.endResetModel()
+                return
+            else:
+                self.beginInsertRows(QModelIndex(), i, i)
+                self._rows.insert(i, row)
+                self.endInsertRows()
+
+    def row_of(self, exp_id: str) -> int:
+        """Row index of an experiment id, or -1."""
+        for i, row in enumerate(self._rows):
+            if row[0] == exp_id:
+                return i
+        return -1
+
+
+class ExperimentTreeModel(QAbstractItemModel):
+    """
+    Two-level model for the template-grouped view: template groups on
+    top, experiments underneath.
+
+    Rows live in plain tuples - (template_id, header, ((exp_id, label),
+    ...)) - and set_groups swaps them in with a single model reset, so a
+    refresh costs one signal instead of a QTreeWidgetItem allocation per
+    experiment. The view only calls data() for visible rows.
+
+    Index bookkeeping uses internalId: 0 marks a group row, child rows
+    carry their group's position + 1.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups: list[tuple[str, str, tuple[tuple[str, str], ...]]] = []
+
+    def set_groups(
+        self, groups: list[tuple[str, str, tuple[tuple[str, str], ...]]]
+    ):
+        """Replace the grouped rows wholesale."""
+        self.beginResetModel()
+        self._groups = groups
+        self.endResetModel()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row < len(self._groups):
+                return self.createIndex(row, 0, 0)
+            return QModelIndex()
+        if parent.internalId() == 0 and row < len(self._groups[parent.row()][2]):
+            return self.createIndex(row, 0, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.internalId() == 0:
+            return len(self._groups[parent.row()][2])
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.internalId() == 0:
+            if role == Qt.DisplayRole:
+                return self._groups[index.row()][1]
+            return None  # no experiment id on group rows
+        exp_id, label = self._groups[index.internalId() - 1][2][index.row()]
+        if role == Qt.DisplayRole:
+            return label
+        if role == Qt.UserRole:
+            return exp_id
+        return None
+
+    def index_of(self, exp_id: str) -> QModelIndex:
+        """Child index of an experiment id, or an invalid index."""
+        for g, (_tid, _header, rows) in enumerate(self._groups):
+            for r, (eid, _label) in enumerate(rows):
+                if eid == exp_id:
+                    return self.index(r, 0, self.index(g, 0))
+        return QModelIndex()
 
 
 class ExperimentListView(QWidget):
@@ -42,6 +223,33 @@ class ExperimentListView(QWidget):
 
         self._view_mode = "date"  # "date" or "template"
 
+        # Experiment currently shown in the editor; re-selections of the
+        # same id (e.g. restored after a refresh) skip the reload
+        self._loaded_experiment_id: Optional[str] = None
+
+        # Queued-connection bridge for the post-create disk save, which
+        # runs on the thread pool so the editor opens without waiting on
+        # I/O
+        self._save_signals = _SaveTaskSignals()
+        self._save_signals.finished.connect(self._on_save_finished)
+
+        # {template_id: name}, filled on demand during tree refreshes and
+        # dropped whenever a template changes; experiment_modified fires
+        # far more often than template edits, so the cache is almost
+        # always warm
+        self._template_name_cache: dict[str, str] = {}
+
+        # Per-view staleness; only the visible view is rebuilt on refresh
+        # and toggling to an up-to-date hidden view costs nothing
+        self._dirty = {"date": True, "template": True}
+
+        # One save can fan out through several app signals in the same
+        # event-loop turn; funnel them into a single deferred refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_list)
+
         self._setup_ui()
         self._connect_signals()
         self._refresh_list()
@@ -71,82 +279,48 @@ class ExperimentListView(QWidget):
         # Stacked widget for different views
         self.view_stack = QStackedWidget()
 
-        # Date-sorted list view
-        self.date_list = QListWidget()
+        # Date-sorted list view, backed by a model so refreshes only touch
+        # changed rows
+        self.date_list = QListView()
         self.date_list.setObjectName("experimentList")
-        self.date_list.itemSelectionChanged.connect(self._on_date_list_selection_changed)
-        self.date_list.setStyleSheet(f"""
-            QListWidget#experimentList {{
-                background-color: {NotionColors.SIDEBAR_BG};
-                border: none;
-                border-right: 1px solid {NotionColors.BORDER};
-                outline: none;
-            }}
-            QListWidget::item {{
-                padding: 12px 16px;
-                border-bottom: 1px solid {NotionColors.BORDER};
-            }}
-            QListWidget::item:selected {{
-                background-color: {NotionColors.SIDEBAR_ITEM_SELECTED};
-            }}
-            QListWidget::item:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-            }}
-        """)
+        # All rows are the same two-line height; the hint lets Qt skip
+        # per-row measurement, and batched layout paints the first page
+        # before the rest of a large model is laid out
+        self.date_list.setUniformItemSizes(True)
+        self.date_list.setLayoutMode(QListView.Batched)
+        self.date_list.setBatchSize(64)
+        self._date_model = ExperimentListModel(self)
+        self.date_list.setModel(self._date_model)
+        self.date_list.selectionModel().selectionChanged.connect(
+            self._on_date_list_selection_changed
+        )
         self.view_stack.addWidget(self.date_list)
 
-        # Template-grouped tree view
-        self.template_tree = QTreeWidget()
+        # Template-grouped tree view, model-backed for the same reason as
+        # the date list
+        self.template_tree = QTreeView()
         self.template_tree.setObjectName("experimentTree")
         self.template_tree.setHeaderHidden(True)
-        self.template_tree.itemSelectionChanged.connect(self._on_tree_selection_changed)
-        self.template_tree.setStyleSheet(f"""
-            QTreeWidget#experimentTree {{
-                background-color: {NotionColors.SIDEBAR_BG};
-                border: none;
-                border-right: 1px solid {NotionColors.BORDER};
-                outline: none;
-            }}
-            QTreeWidget::item {{
-                padding: 8px 12px;
-            }}
-            QTreeWidget::item:selected {{
-                background-color: {NotionColors.SIDEBAR_ITEM_SELECTED};
-            }}
-            QTreeWidget::item:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-            }}
-        """)
+        self.template_tree.setUniformRowHeights(True)
+        self._tree_model = ExperimentTreeModel(self)
+        self.template_tree.setModel(self._tree_model)
+        self.template_tree.selectionModel().selectionChanged.connect(
+            self._on_tree_selection_changed
+        )
         self.view_stack.addWidget(self.template_tree)
 
         left_layout.addWidget(self.view_stack)
 
         # New experiment button
         new_btn_container = QWidget()
-        new_btn_container.setStyleSheet(f"""
-            background-color: {NotionColors.SIDEBAR_BG};
-            border-right: 1px solid {NotionColors.BORDER};
-        """)
+        new_btn_container.setObjectName("listFooter")
         new_btn_layout = QHBoxLayout(new_btn_container)
         new_btn_layout.setContentsMargins(12, 12, 12, 12)
 
         self.new_btn = QPushButton("+ New Experiment")
+        self.new_btn.setObjectName("primaryButton")
         self.new_btn.setCursor(Qt.PointingHandCursor)
         self.new_btn.clicked.connect(self._on_new_experiment)
-        self.new_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 16px;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.PRIMARY_HOVER};
-            }}
-        """)
         new_btn_layout.addWidget(self.new_btn)
 
         left_layout.addWidget(new_btn_container)
@@ -159,7 +333,7 @@ class ExperimentListView(QWidget):
             template_manager=self.template_manager,
             images_dir=self.images_dir
         )
-        self.editor.experiment_saved.connect(self._refresh_list)
+        self.editor.experiment_saved.connect(self._schedule_refresh)
         splitter.addWidget(self.editor)
 
         # Set initial sizes (30% / 70%)
@@ -170,11 +344,7 @@ class ExperimentListView(QWidget):
     def _create_list_header(self) -> QWidget:
         """Create the list header with view toggle buttons."""
         header = QWidget()
-        header.setStyleSheet(f"""
-            background-color: {NotionColors.SIDEBAR_BG};
-            border-bottom: 1px solid {NotionColors.BORDER};
-            border-right: 1px solid {NotionColors.BORDER};
-        """)
+        header.setObjectName("listHeader")
         header.setFixedHeight(48)
 
         layout = QHBoxLayout(header)
@@ -183,47 +353,29 @@ class ExperimentListView(QWidget):
 
         # Title
         title = QLabel("Experiments")
-        title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 600;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("listTitle")
         layout.addWidget(title)
 
         layout.addStretch()
 
-        # View toggle buttons
+        # View toggle buttons - an exclusive group keeps the checked state
+        # consistent, so mode switches only touch the target button
         self.date_btn = QPushButton("Date")
+        self.date_btn.setObjectName("viewToggle")
         self.date_btn.setCheckable(True)
         self.date_btn.setChecked(True)
         self.date_btn.setCursor(Qt.PointingHandCursor)
-        self.date_btn.clicked.connect(lambda: self._set_view_mode("date"))
 
         self.template_btn = QPushButton("Template")
+        self.template_btn.setObjectName("viewToggle")
         self.template_btn.setCheckable(True)
         self.template_btn.setCursor(Qt.PointingHandCursor)
-        self.template_btn.clicked.connect(lambda: self._set_view_mode("template"))
-
-        toggle_style = f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                padding: 4px 8px;
-                font-size: 12px;
-                color: {NotionColors.TEXT_SECONDARY};
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-            }}
-            QPushButton:checked {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-                color: {NotionColors.TEXT_PRIMARY};
-                font-weight: 500;
-            }}
-        """
-        self.date_btn.setStyleSheet(toggle_style)
-        self.template_btn.setStyleSheet(toggle_style)
+
+        self.view_toggle_group = QButtonGroup(self)
+        self.view_toggle_group.setExclusive(True)
+        self.view_toggle_group.addButton(self.date_btn)
+        self.view_toggle_group.addButton(self.template_btn)
+        self.view_toggle_group.buttonClicked.connect(self._on_view_toggle)
 
         layout.addWidget(self.date_btn)
         layout.addWidget(self.template_btn)
@@ -232,94 +384,183 @@ class ExperimentListView(QWidget):
 
     def _connect_signals(self):
         """Connect to app signals."""
-        self._signals.experiment_created.connect(self._refresh_list)
-        self._signals.experiment_modified.connect(self._refresh_list)
-        self._signals.experiment_deleted.connect(self._refresh_list)
+        signals = self._signals
+        # UniqueConnection guards against a refactor wiring the same slot
+        # twice (each duplicate multiplies refresh work); the app-signals
+        # singleton outlives this view, so the handles are severed on
+        # destruction rather than left dangling
+        unique = Qt.UniqueConnection
+        connections = [
+            signals.experiment_created.connect(self._schedule_refresh, unique),
+            signals.experiment_modified.connect(self._schedule_refresh, unique),
+            signals.experiment_deleted.connect(
+                self._on_experiment_deleted, unique
+            ),
+            # Any template change may rename a tree group
+            signals.template_created.connect(
+                self._invalidate_template_names, unique
+            ),
+            signals.template_modified.connect(
+                self._invalidate_template_names, unique
+            ),
+            signals.template_deleted.connect(
+                self._invalidate_template_names, unique
+            ),
+        ]
+        self._app_connections = connections
+        self.destroyed.connect(
+            lambda: [QObject.disconnect(c) for c in connections]
+        )
+
+    def _schedule_refresh(self, *_args):
+        """Queue a refresh; repeated calls in one burst collapse to one."""
+        self._dirty["date"] = True
+        self._dirty["template"] = True
+        self._refresh_timer.start()
+
+    def _on_experiment_deleted(self, experiment_id: str):
+        """Forget the loaded id when its experiment is deleted."""
+        if experiment_id == self._loaded_experiment_id:
+            self._loaded_experiment_id = None
+        self._schedule_refresh()
+
+    def _invalidate_template_names(self, _template_id: str):
+        """Drop cached template names after a template change."""
+        self._template_name_cache.clear()
+        self._dirty["template"] = True
+        if self._view_mode == "template":
+            self._refresh_list()
+
+    def _template_name(self, template_id: str) -> str:
+        """Cached template-name lookup for tree group headers."""
+        name = self._template_name_cache.get(template_id)
+        if name is None:
+            template = self.template_manager.get_template(template_id)
+            name = template.name if template else "Unknown Template"
+            self._template_name_cache[template_id] = name
+        return name
+
+    def _on_view_toggle(self, button):
+        """Route the toggle-group click to the matching view mode."""
+        self._set_view_mode("date" if button is self.date_btn else "template")
 
     def _set_view_mode(self, mode: str):
         """Switch between date and template view modes."""
         self._view_mode = mode
-        self.date_btn.setChecked(mode == "date")
-        self.template_btn.setChecked(mode == "template")
+        # Block the toggled emissions so the programmatic check doesn't
+        # force a double :checked restyle of both buttons
+        target = self.date_btn if mode == "date" else self.template_btn
+        with QSignalBlocker(self.date_btn), QSignalBlocker(self.template_btn):
+            target.setChecked(True)
 
         if mode == "date":
             self.view_stack.setCurrentWidget(self.date_list)
         else:
             self.view_stack.setCurrentWidget(self.template_tree)
 
-        self._refresh_list()
+        # The hidden view tracked changes via its dirty bit; if nothing
+        # happened since its last rebuild the toggle is O(1)
+        if self._dirty[mode]:
+            self._refresh_list()
 
     def _refresh_list(self):
-        """Refresh the experiment list/tree."""
+        """Refresh the visible experiment list/tree."""
         if self._view_mode == "date":
             self._refresh_date_list()
         else:
             self._refresh_template_tree()
+        self._dirty[self._view_mode] = False
 
     def _refresh_date_list(self):
         """Refresh the date-sorted list."""
-        self.date_list.clear()
-
-        experiments = self.experiment_manager.list_experiments_by_date()
-
-        for exp in experiments:
-            # Format: "Name - Date"
-            date_str = exp.created_at[:10] if exp.created_at else ""
-            item = QListWidgetItem(f"{exp.name}\n{date_str}")
-            item.setData(Qt.UserRole, exp.id)
-            self.date_list.addItem(item)
+        rows = self.experiment_manager.list_date_rows()
+        # Coalesce repaints and keep row removals from bouncing a spurious
+        # selection change into editor.load_experiment mid-rebuild
+        selection_model = self.date_list.selectionModel()
+        indexes = selection_model.selectedIndexes()
+        selected_id = indexes[0].data(Qt.UserRole) if indexes else None
+
+        self.date_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(selection_model):
+                self._date_model.set_rows(rows)
+                # Re-point the selection silently; the editor already has
+                # this experiment loaded
+                if selected_id is not None:
+                    row = self._date_model.row_of(selected_id)
+                    if row >= 0:
+                        self.date_list.setCurrentIndex(
+                            self._date_model.index(row)
+                        )
+        finally:
+            self.date_list.setUpdatesEnabled(True)
 
     def _refresh_template_tree(self):
         """Refresh the template-grouped tree."""
-        self.template_tree.clear()
-
-        grouped = self.experiment_manager.list_experiments_by_template()
-
-        for template_id, experiments in grouped.items():
-            # Get template name
-            template = self.template_manager.get_template(template_id)
-            template_name = template.name if template else "Unknown Template"
-
-            # Create template parent item
-            parent_item = QTreeWidgetItem([f"{template_name} ({len(experiments)})"])
-            parent_item.setData(0, Qt.UserRole, None)  # No experiment ID for parent
-            parent_item.setExpanded(True)
-
-            # Add experiments as children
-            for exp in experiments:
-                date_str = exp.created_at[:10] if exp.created_at else ""
-                child_item = QTreeWidgetItem([f"{exp.name} - {date_str}"])
-                child_item.setData(0, Qt.UserRole, exp.id)
-                parent_item.addChild(child_item)
-
-            self.template_tree.addTopLevelItem(parent_item)
+        grouped = self.experiment_manager.list_template_rows()
+
+        groups = []
+        for template_id, exp_rows in grouped.items():
+            template_name = self._template_name(template_id)
+            rows = tuple(
+                (exp_id, f"{name} - {date_str}")
+                for exp_id, name, date_str in exp_rows
+            )
+            groups.append(
+                (template_id, f"{template_name} ({len(exp_rows)})", rows)
+            )
+
+        selection_model = self.template_tree.selectionModel()
+        indexes = selection_model.selectedIndexes()
+        selected_id = indexes[0].data(Qt.UserRole) if indexes else None
+
+        # One repaint for the whole swap, and no selectionChanged re-entry
+        # into the editor while the model resets
+        self.template_tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(selection_model):
+                self._tree_model.set_groups(groups)
+                self.template_tree.expandAll()
+                # Restore the selection silently; the editor already has
+                # this experiment loaded
+                if selected_id is not None:
+                    index = self._tree_model.index_of(selected_id)
+                    if index.isValid():
+                        self.template_tree.setCurrentIndex(index)
+        finally:
+            self.template_tree.setUpdatesEnabled(True)
+
+    def _load_selected(self, experiment_id: str):
+        """Load an experiment into the editor unless it's already there."""
+        if experiment_id == self._loaded_experiment_id:
+            return
+        self._loaded_experiment_id = experiment_id
+        self.editor.load_experiment(experiment_id)
+        self._signals.experiment_selected.emit(experiment_id)
 
     def _on_date_list_selection_changed(self):
         """Handle selection change in date list."""
-        items = self.date_list.selectedItems()
-        if items:
-            experiment_id = items[0].data(Qt.UserRole)
+        indexes = self.date_list.selectionModel().selectedIndexes()
+        if indexes:
+            experiment_id = indexes[0].data(Qt.UserRole)
             if experiment_id:
-                self.editor.load_experiment(experiment_id)
-                self._signals.experiment_selected.emit(experiment_id)
+                self._load_selected(experiment_id)
 
     def _on_tree_selection_changed(self):
         """Handle selection change in template tree."""
-        items = self.template_tree.selectedItems()
-        if items:
-            experiment_id = items[0].data(0, Qt.UserRole)
+        indexes = self.template_tree.selectionModel().selectedIndexes()
+        if indexes:
+            experiment_id = indexes[0].data(Qt.UserRole)
             if experiment_id:
-                self.editor.load_experiment(experiment_id)
-                self._signals.experiment_selected.emit(experiment_id)
+                self._load_selected(experiment_id)
             else:
                 # Template parent selected, clear editor
+                self._loaded_experiment_id = None
                 self.editor.clear()
 
     def _on_new_experiment(self):
         """Handle new experiment button click."""
-        from atomgrowth.ui.dialogs.new_experiment_dialog import NewExperimentDialog
-
-        dialog = NewExperimentDialog(
+        dialog = _new_experiment_dialog_cls()(
             template_manager=self.template_manager,
             parent=self
         )
@@ -334,8 +575,20 @@ class ExperimentListView(QWidget):
                         name=name,
                         template_id=template_id
                     )
-                    self.experiment_manager.save()
-                    self._refresh_list()
+                    # Persist off-thread; the editor reads the in-memory
+                    # model, so it doesn't need the file flushed first
+                    QThreadPool.globalInstance().start(
+                        _SaveTask(self.experiment_manager, self._save_signals)
+                    )
+                    self._schedule_refresh()
+                    self._loaded_experiment_id = experiment.id
                     self.editor.load_experiment(experiment.id)
                 except Exception as e:
                     QMessageBox.warning(self, "Error", f"Failed to create experiment: {e}")
+
+    def _on_save_finished(self, success: bool, error: str):
+        """Report a failed background save of the experiment store."""
+        if not success:
+            QMessageBox.warning(
+                self, "Save Error", f"Failed to save experiments: {error}"
+            )
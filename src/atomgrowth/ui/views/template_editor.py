@@ -1,12 +1,12 @@
 """Template editor view with all CVD parameter sections"""
 
-from typing import Optional
+from typing import Any, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea,
-    QLabel, QLineEdit, QTextEdit, QPushButton, QComboBox,
+    QLabel, QLineEdit, QPlainTextEdit, QPushButton, QComboBox,
     QFrame, QSizePolicy, QMessageBox
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import QSignalBlocker, Signal, Qt
 
 from atomgrowth.models.recipe import RecipeTemplate
 from atomgrowth.core.template_manager import TemplateManager
@@ -16,6 +16,48 @@ from atomgrowth.ui.widgets.parameter_field import (
 from atomgrowth.styles.colors import NotionColors
 from atomgrowth.signals.app_signals import get_app_signals
 
+# The full parameter schema as data: (section title, accent color, field
+# rows), each row (path, label, type, unit, min, max, decimals, choices).
+# One generic builder iterates this instead of four near-identical
+# section methods
+_SECTION_SPEC = (
+    ("Temperature Profile", NotionColors.SECTION_TEMPERATURE, (
+        ("temperature.ramp_rate_1", "Ramp Rate 1", "float", "°C/min", 1, 50, 1, None),
+        ("temperature.hold_temp_1", "Hold Temp 1", "float", "°C", 0, 1000, 0, None),
+        ("temperature.hold_time_1", "Hold Time 1", "float", "min", 0, 120, 1, None),
+        ("temperature.ramp_rate_2", "Ramp Rate 2", "float", "°C/min", 1, 50, 1, None),
+        ("temperature.peak_temp", "Peak Temperature", "float", "°C", 400, 1000, 0, None),
+        ("temperature.peak_hold_time", "Peak Hold Time", "float", "min", 0, 120, 1, None),
+        ("temperature.cooling_method", "Cooling Method", "choice", "", None, None, None,
+         ("natural", "controlled", "quench")),
+        ("temperature.controlled_cool_rate", "Cool Rate", "float", "°C/min", 1, 50, 1, None),
+    )),
+    ("Gas Flow", NotionColors.SECTION_GAS_FLOW, (
+        ("gas_flow.ar_flow", "Ar Flow", "float", "sccm", 0, 500, 1, None),
+        ("gas_flow.h2_flow", "H₂ Flow", "float", "sccm", 0, 100, 1, None),
+        ("gas_flow.total_flow", "Total Flow", "float", "sccm", 0, 500, 1, None),
+    )),
+    ("Precursor Setup", NotionColors.SECTION_PRECURSOR, (
+        ("precursor.moo3_amount", "MoO₃ Amount", "float", "mg", 0, 50, 1, None),
+        ("precursor.s_amount", "S Amount", "float", "mg", 0, 500, 1, None),
+        ("precursor.moo3_position", "MoO₃ Position", "float", "cm", -30, 30, 1, None),
+        ("precursor.s_position", "S Position", "float", "cm", -30, 30, 1, None),
+        ("precursor.moo3_boat_material", "MoO₃ Boat", "choice", "", None, None, None,
+         ("alumina", "quartz", "graphite")),
+        ("precursor.s_boat_material", "S Boat", "choice", "", None, None, None,
+         ("alumina", "quartz", "graphite")),
+    )),
+    ("Substrate", NotionColors.SECTION_SUBSTRATE, (
+        ("substrate.material", "Material", "choice", "", None, None, None,
+         ("SiO2/Si", "Sapphire", "Quartz", "Mica", "hBN")),
+        ("substrate.oxide_thickness", "Oxide Thickness", "float", "nm", 0, 1000, 0, None),
+        ("substrate.prep_method", "Prep Method", "choice", "", None, None, None,
+         ("piranha", "O2_plasma", "acetone_IPA", "sonication", "none")),
+        ("substrate.orientation", "Orientation", "str", "", None, None, None, None),
+        ("substrate.size", "Size", "str", "", None, None, None, None),
+    )),
+)
+
 
 class TemplateEditorView(QWidget):
     """
@@ -36,6 +78,25 @@ class TemplateEditorView(QWidget):
         self.template_manager = template_manager
         self._current_template: Optional[RecipeTemplate] = None
         self._signals = get_app_signals()
+        # {template_id: combo index} rebuilt with the combo, so selecting
+        # a parent is an O(1) lookup instead of an itemData scan
+        self._parent_index_by_id: dict[Optional[str], int] = {None: 0}
+        # Parameter sections in _SECTION_SPEC order, filled lazily
+        self._sections: list[ParameterSection] = []
+        # (field_path, field) pairs across all sections, frozen once the
+        # sections are built so load/save don't re-collect per call
+        self._all_fields: tuple[
+            tuple[str, InheritableParameterField], ...
+        ] = ()
+        # Set on any field edit; _on_save pushes the overridden values,
+        # so nothing is written to the template until then
+        self._dirty = False
+        # (value, source id) per field path from the last full load, so a
+        # parent change can patch only the fields that actually resolved
+        # differently
+        self._last_resolved: Optional[
+            dict[str, tuple[Any, Optional[str]]]
+        ] = None
 
         self._setup_ui()
 
@@ -53,25 +114,19 @@ class TemplateEditorView(QWidget):
 
         # Scroll area for parameters
         scroll = QScrollArea()
+        scroll.setObjectName("templateEditorScroll")
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
 
-        # Parameters container
+        # Parameters container; the sections themselves are deferred to
+        # _ensure_sections so constructing the view doesn't pay for ~20
+        # parameter-field widgets before a template is even opened
         params_widget = QWidget()
-        params_widget.setStyleSheet(f"background-color: {NotionColors.BACKGROUND_SECONDARY};")
+        params_widget.setObjectName("templateEditorParams")
         self._params_layout = QVBoxLayout(params_widget)
         self._params_layout.setContentsMargins(20, 20, 20, 20)
         self._params_layout.setSpacing(16)
-
-        # Create parameter sections
-        self._create_temperature_section()
-        self._create_gas_flow_section()
-        self._create_precursor_section()
-        self._create_substrate_section()
-
-        # Add stretch at bottom
-        self._params_layout.addStretch()
+        self._sections_built = False
 
         scroll.setWidget(params_widget)
         layout.addWidget(scroll)
@@ -84,13 +139,6 @@ class TemplateEditorView(QWidget):
         """Create the header with name, description, parent selector"""
         header = QFrame()
         header.setObjectName("templateEditorHeader")
-        header.setStyleSheet(f"""
-            QFrame#templateEditorHeader {{
-                background-color: {NotionColors.BACKGROUND};
-                border-bottom: 1px solid {NotionColors.BORDER};
-                padding: 16px;
-            }}
-        """)
 
         layout = QVBoxLayout(header)
         layout.setSpacing(12)
@@ -98,11 +146,7 @@ class TemplateEditorView(QWidget):
         # Title row
         title_row = QHBoxLayout()
         title_label = QLabel("Template Editor")
-        title_label.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 700;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title_label.setObjectName("templateEditorTitle")
         title_row.addWidget(title_label)
         title_row.addStretch()
         layout.addLayout(title_row)
@@ -131,7 +175,9 @@ class TemplateEditorView(QWidget):
         # Description
         desc_label = QLabel("Description:")
         layout.addWidget(desc_label)
-        self.desc_input = QTextEdit()
+        # Descriptions are short plain text; QPlainTextEdit skips the
+        # rich-text document machinery QTextEdit drags in
+        self.desc_input = QPlainTextEdit()
         self.desc_input.setMaximumHeight(80)
         self.desc_input.setPlaceholderText("Optional description...")
         layout.addWidget(self.desc_input)
@@ -141,13 +187,7 @@ class TemplateEditorView(QWidget):
     def _create_footer(self) -> QWidget:
         """Create footer with save/cancel buttons"""
         footer = QFrame()
-        footer.setStyleSheet(f"""
-            QFrame {{
-                background-color: {NotionColors.BACKGROUND};
-                border-top: 1px solid {NotionColors.BORDER};
-                padding: 12px 20px;
-            }}
-        """)
+        footer.setObjectName("templateEditorFooter")
 
         layout = QHBoxLayout(footer)
         layout.addStretch()
@@ -165,142 +205,40 @@ class TemplateEditorView(QWidget):
 
         return footer
 
-    def _create_temperature_section(self):
-        """Create temperature profile parameter section"""
-        section = ParameterSection(
-            "Temperature Profile",
-            color=NotionColors.SECTION_TEMPERATURE
-        )
-
-        fields = [
-            ("temperature.ramp_rate_1", "Ramp Rate 1", "float", "°C/min", 1, 50, 1),
-            ("temperature.hold_temp_1", "Hold Temp 1", "float", "°C", 0, 1000, 0),
-            ("temperature.hold_time_1", "Hold Time 1", "float", "min", 0, 120, 1),
-            ("temperature.ramp_rate_2", "Ramp Rate 2", "float", "°C/min", 1, 50, 1),
-            ("temperature.peak_temp", "Peak Temperature", "float", "°C", 400, 1000, 0),
-            ("temperature.peak_hold_time", "Peak Hold Time", "float", "min", 0, 120, 1),
-            ("temperature.cooling_method", "Cooling Method", "choice", "", None, None, None),
-            ("temperature.controlled_cool_rate", "Cool Rate", "float", "°C/min", 1, 50, 1),
-        ]
-
-        for field_path, label, ftype, unit, min_v, max_v, dec in fields:
-            if ftype == "choice":
-                field = InheritableParameterField(
-                    field_path, label, ftype,
-                    choices=["natural", "controlled", "quench"]
-                )
-            else:
-                field = InheritableParameterField(
-                    field_path, label, ftype, unit,
-                    min_val=min_v, max_val=max_v, decimals=dec
-                )
-            field.value_changed.connect(self._on_field_changed)
-            field.inheritance_changed.connect(self._on_inheritance_changed)
-            section.add_field(field)
-
-        self._params_layout.addWidget(section)
-        self._temp_section = section
-
-    def _create_gas_flow_section(self):
-        """Create gas flow parameter section"""
-        section = ParameterSection(
-            "Gas Flow",
-            color=NotionColors.SECTION_GAS_FLOW
-        )
-
-        fields = [
-            ("gas_flow.ar_flow", "Ar Flow", "float", "sccm", 0, 500, 1),
-            ("gas_flow.h2_flow", "H₂ Flow", "float", "sccm", 0, 100, 1),
-            ("gas_flow.total_flow", "Total Flow", "float", "sccm", 0, 500, 1),
-        ]
-
-        for field_path, label, ftype, unit, min_v, max_v, dec in fields:
-            field = InheritableParameterField(
-                field_path, label, ftype, unit,
-                min_val=min_v, max_val=max_v, decimals=dec
-            )
-            field.value_changed.connect(self._on_field_changed)
-            field.inheritance_changed.connect(self._on_inheritance_changed)
-            section.add_field(field)
-
-        self._params_layout.addWidget(section)
-        self._gas_section = section
-
-    def _create_precursor_section(self):
-        """Create precursor setup parameter section"""
-        section = ParameterSection(
-            "Precursor Setup",
-            color=NotionColors.SECTION_PRECURSOR
-        )
-
-        fields = [
-            ("precursor.moo3_amount", "MoO₃ Amount", "float", "mg", 0, 50, 1),
-            ("precursor.s_amount", "S Amount", "float", "mg", 0, 500, 1),
-            ("precursor.moo3_position", "MoO₃ Position", "float", "cm", -30, 30, 1),
-            ("precursor.s_position", "S Position", "float", "cm", -30, 30, 1),
-            ("precursor.moo3_boat_material", "MoO₃ Boat", "choice", "", None, None, None),
-            ("precursor.s_boat_material", "S Boat", "choice", "", None, None, None),
-        ]
-
-        for field_path, label, ftype, unit, min_v, max_v, dec in fields:
-            if ftype == "choice":
-                field = InheritableParameterField(
-                    field_path, label, ftype,
-                    choices=["alumina", "quartz", "graphite"]
-                )
-            else:
-                field = InheritableParameterField(
-                    field_path, label, ftype, unit,
-                    min_val=min_v, max_val=max_v, decimals=dec
-                )
-            field.value_changed.connect(self._on_field_changed)
-            field.inheritance_changed.connect(self._on_inheritance_changed)
-            section.add_field(field)
-
-        self._params_layout.addWidget(section)
-        self._precursor_section = section
-
-    def _create_substrate_section(self):
-        """Create substrate info parameter section"""
-        section = ParameterSection(
-            "Substrate",
-            color=NotionColors.SECTION_SUBSTRATE
+    def _ensure_sections(self):
+        """Build the parameter sections from _SECTION_SPEC on first use."""
+        if self._sections_built:
+            return
+        self._sections_built = True
+
+        for title, color, field_rows in _SECTION_SPEC:
+            section = ParameterSection(title, color=color)
+            for path, label, ftype, unit, min_v, max_v, dec, choices in field_rows:
+                if choices is not None:
+                    field = InheritableParameterField(
+                        path, label, ftype, choices=list(choices)
+                    )
+                elif ftype == "float":
+                    field = InheritableParameterField(
+                        path, label, ftype, unit,
+                        min_val=min_v, max_val=max_v, decimals=dec
+                    )
+                else:
+                    field = InheritableParameterField(path, label, ftype, unit)
+                section.add_field(field)
+
+            section.field_changed.connect(self._on_field_changed)
+            self._params_layout.addWidget(section)
+            self._sections.append(section)
+
+        self._all_fields = tuple(
+            pair
+            for section in self._sections
+            for pair in section.get_all_fields().items()
         )
 
-        fields = [
-            ("substrate.material", "Material", "choice", "", None, None, None),
-            ("substrate.oxide_thickness", "Oxide Thickness", "float", "nm", 0, 1000, 0),
-            ("substrate.prep_method", "Prep Method", "choice", "", None, None, None),
-            ("substrate.orientation", "Orientation", "str", "", None, None, None),
-            ("substrate.size", "Size", "str", "", None, None, None),
-        ]
-
-        for field_path, label, ftype, unit, min_v, max_v, dec in fields:
-            if field_path == "substrate.material":
-                field = InheritableParameterField(
-                    field_path, label, ftype,
-                    choices=["SiO2/Si", "Sapphire", "Quartz", "Mica", "hBN"]
-                )
-            elif field_path == "substrate.prep_method":
-                field = InheritableParameterField(
-                    field_path, label, ftype,
-                    choices=["piranha", "O2_plasma", "acetone_IPA", "sonication", "none"]
-                )
-            elif ftype == "float":
-                field = InheritableParameterField(
-                    field_path, label, ftype, unit,
-                    min_val=min_v, max_val=max_v, decimals=dec
-                )
-            else:
-                field = InheritableParameterField(
-                    field_path, label, ftype, unit
-                )
-            field.value_changed.connect(self._on_field_changed)
-            field.inheritance_changed.connect(self._on_inheritance_changed)
-            section.add_field(field)
-
-        self._params_layout.addWidget(section)
-        self._substrate_section = section
+        # Add stretch at bottom
+        self._params_layout.addStretch()
 
     # ==================== Public API ====================
 
@@ -310,103 +248,139 @@ class TemplateEditorView(QWidget):
         if not template:
             return
 
+        self._ensure_sections()
         self._current_template = template
+        self._dirty = False
 
-        # Update header fields
-        self.name_input.setText(template.name)
-        self.desc_input.setText(template.description)
+        # Update header fields (no-op setters skipped so nothing
+        # downstream re-fires for unchanged text)
+        if self.name_input.text() != template.name:
+            self.name_input.setText(template.name)
+        if self.desc_input.toPlainText() != template.description:
+            self.desc_input.setPlainText(template.description)
 
-        # Update parent combo
+        # Update parent combo; the explicit full load below covers the
+        # change, so _on_parent_changed must not resolve a second time
         self._refresh_parent_combo()
-        if template.parent_template_id:
-            for i in range(self.parent_combo.count()):
-                if self.parent_combo.itemData(i) == template.parent_template_id:
-                    self.parent_combo.setCurrentIndex(i)
-                    break
+        index = self._parent_index_by_id.get(template.parent_template_id, 0)
+        if self.parent_combo.currentIndex() != index:
+            with QSignalBlocker(self.parent_combo):
+                self.parent_combo.setCurrentIndex(index)
 
         # Load parameter values
         self._load_parameter_values()
 
     def new_template(self, parent_id: Optional[str] = None):
         """Start editing a new template"""
+        self._ensure_sections()
         self._current_template = RecipeTemplate(name="New Template")
+        self._dirty = False
         if parent_id:
             self._current_template.parent_template_id = parent_id
 
         self.name_input.setText("")
-        self.desc_input.setText("")
+        self.desc_input.setPlainText("")
 
         self._refresh_parent_combo()
-        if parent_id:
-            for i in range(self.parent_combo.count()):
-                if self.parent_combo.itemData(i) == parent_id:
-                    self.parent_combo.setCurrentIndex(i)
-                    break
+        index = self._parent_index_by_id.get(parent_id, 0)
+        if self.parent_combo.currentIndex() != index:
+            with QSignalBlocker(self.parent_combo):
+                self.parent_combo.setCurrentIndex(index)
 
         self._load_parameter_values()
 
     def _refresh_parent_combo(self):
         """Refresh the parent template dropdown"""
-        current_data = self.parent_combo.currentData()
-        self.parent_combo.clear()
-        self.parent_combo.addItem("(None - Base Template)", None)
-
-        for template in self.template_manager.list_templates():
-            # Don't show current template as an option
-            if self._current_template and template.id == self._current_template.id:
-                continue
-            self.parent_combo.addItem(template.name, template.id)
-
-        # Restore selection
-        for i in range(self.parent_combo.count()):
-            if self.parent_combo.itemData(i) == current_data:
-                self.parent_combo.setCurrentIndex(i)
-                break
+        # The clear/addItem/restore churn below moves currentIndex
+        # several times; none of it is a real parent change, so keep
+        # _on_parent_changed out of it entirely
+        with QSignalBlocker(self.parent_combo):
+            current_data = self.parent_combo.currentData()
+            self.parent_combo.clear()
+            self.parent_combo.addItem("(None - Base Template)", None)
+            self._parent_index_by_id = {None: 0}
+
+            current_id = self._current_template.id if self._current_template else None
+            for template in self.template_manager.list_templates():
+                # Don't show current template as an option
+                if template.id == current_id:
+                    continue
+                self._parent_index_by_id[template.id] = self.parent_combo.count()
+                self.parent_combo.addItem(template.name, template.id)
+
+            # Restore selection
+            index = self._parent_index_by_id.get(current_data)
+            if index is not None:
+                self.parent_combo.setCurrentIndex(index)
 
     def _load_parameter_values(self):
         """Load parameter values into all fields"""
         if not self._current_template:
             return
 
-        # Get resolved values (with inheritance)
-        if self._current_template.id in [t.id for t in self.template_manager.list_templates()]:
-            resolved = self.template_manager.resolve_template(self._current_template.id)
+        # One O(N) scan up front for names; the per-field work below is
+        # then pure dict lookups instead of chain re-walks
+        tid = self._current_template.id
+        names = {t.id: t.name for t in self.template_manager.list_templates()}
+
+        # Resolve the whole inheritance chain once; each field then reads
+        # its (value, source) out of the map
+        if tid in self.template_manager:
+            resolved_map = self.template_manager.resolve_with_sources(tid)
         else:
-            resolved = self._current_template
-
-        # Load all sections
-        for section in [self._temp_section, self._gas_section,
-                        self._precursor_section, self._substrate_section]:
-            for field_path, field in section.get_all_fields().items():
-                value, source_id = self.template_manager.get_effective_value(
-                    self._current_template.id, field_path
-                ) if self._current_template.id in [t.id for t in self.template_manager.list_templates()] else (
-                    self.template_manager._get_field_value(resolved, field_path), None
+            resolved_map = None  # Unsaved template; read it directly
+
+        # Load all fields
+        for field_path, field in self._all_fields:
+            if resolved_map is not None:
+                value, source_id = resolved_map.get(field_path, (None, None))
+            else:
+                value = self.template_manager._get_field_value(
+                    self._current_template, field_path
                 )
+                source_id = None
 
-                source_name = None
-                if source_id:
-                    source_template = self.template_manager.get_template(source_id)
-                    source_name = source_template.name if source_template else None
+            source_name = names.get(source_id) if source_id else None
+            field.set_inherited_value(value, source_name)
 
-                field.set_inherited_value(value, source_name)
+        self._last_resolved = resolved_map
 
     # ==================== Event Handlers ====================
 
     def _on_parent_changed(self, index):
         """Handle parent template selection change"""
-        if self._current_template:
-            self._current_template.parent_template_id = self.parent_combo.currentData()
+        if not self._current_template:
+            return
+        self._current_template.parent_template_id = self.parent_combo.currentData()
+
+        tid = self._current_template.id
+        previous = self._last_resolved
+        if previous is None or tid not in self.template_manager:
+            # No prior resolution to diff against (unsaved template or
+            # first load); take the full pass
             self._load_parameter_values()
+            return
+
+        # Re-resolve once, then touch only the fields whose (value,
+        # source) pair changed; values resolved below the swapped parent
+        # are untouched
+        resolved_map = self.template_manager.resolve_with_sources(tid)
+        names = {t.id: t.name for t in self.template_manager.list_templates()}
+        for field_path, field in self._all_fields:
+            entry = resolved_map.get(field_path, (None, None))
+            if previous.get(field_path) == entry:
+                continue
+            value, source_id = entry
+            source_name = names.get(source_id) if source_id else None
+            field.set_inherited_value(value, source_name)
+
+        self._last_resolved = resolved_map
 
     def _on_field_changed(self, field_path: str, value):
         """Handle parameter field value change"""
-        if self._current_template:
-            self.template_manager._set_field_value(self._current_template, field_path, value)
-
-    def _on_inheritance_changed(self, field_path: str, is_inherited: bool):
-        """Handle inheritance toggle"""
-        pass  # For now, the field handles its own state
+        # Just flag the edit; _on_save collects every overridden field in
+        # one pass, so there is no per-keystroke path walk into the model
+        self._dirty = True
 
     def _on_save(self):
         """Save the current template"""
@@ -423,23 +397,21 @@ class TemplateEditorView(QWidget):
         self._current_template.parent_template_id = self.parent_combo.currentData()
 
         # Collect overridden values from fields
-        for section in [self._temp_section, self._gas_section,
-                        self._precursor_section, self._substrate_section]:
-            for field_path, field in section.get_all_fields().items():
-                if field.is_overridden():
-                    value = field.get_value()
-                    self.template_manager._set_field_value(
-                        self._current_template, field_path, value
-                    )
+        for field_path, field in self._all_fields:
+            if field.is_overridden():
+                self.template_manager._set_field_value(
+                    self._current_template, field_path, field.get_value()
+                )
 
-        # Save to manager
-        if self._current_template.id in [t.id for t in self.template_manager.list_templates()]:
+        # Save to manager (O(1) existence check, no id-list rebuild)
+        if self._current_template.id in self.template_manager:
             self.template_manager.update_template(self._current_template)
         else:
-            # It's a new template - add it
-            self.template_manager._templates[self._current_template.id] = self._current_template
-            self._signals.template_created.emit(self._current_template.id)
+            # It's a new template - register keeps the manager's child
+            # index and caches consistent and emits template_created
+            self.template_manager.register_template(self._current_template)
 
+        self._dirty = False
         self.template_saved.emit(self._current_template.id)
         self._signals.status_message.emit(f"Template '{name}' saved", 3000)
 
@@ -1,11 +1,13 @@
 """Template list view with tree hierarchy"""
 
+from collections import deque
+from functools import partial
 from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
     QPushButton, QLabel, QMenu, QMessageBox, QSplitter
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import QSignalBlocker, QTimer, Signal, Qt
 
 from atomgrowth.core.template_manager import TemplateManager
 from atomgrowth.models.recipe import RecipeTemplate
@@ -25,6 +27,21 @@ class TemplateListView(QWidget):
 
         self.template_manager = template_manager
         self._signals = get_app_signals()
+        # {template_id: tree item}, rebuilt with the tree so selection
+        # jumps don't recurse over every item
+        self._item_by_id: dict[str, QTreeWidgetItem] = {}
+        # {template_id: parent id} as of the last rebuild; a mismatch on
+        # save means the tree shape changed and needs a full refresh
+        self._known_parent_of: dict[str, Optional[str]] = {}
+        # Item to re-select once the next (deferred) refresh has run
+        self._pending_select_id: Optional[str] = None
+
+        # A burst of template signals (e.g. a multi-template import)
+        # collapses into one tree rebuild per event-loop tick
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_tree)
 
         self._setup_ui()
         self._connect_signals()
@@ -67,6 +84,9 @@ class TemplateListView(QWidget):
         self.tree = QTreeWidget()
         self.tree.setHeaderHidden(True)
         self.tree.setIndentation(20)
+        # All rows are one-line labels; lets Qt skip per-row height
+        # measurement when expandAll lays out the whole tree
+        self.tree.setUniformRowHeights(True)
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._show_context_menu)
         self.tree.itemSelectionChanged.connect(self._on_selection_changed)
@@ -104,45 +124,127 @@ class TemplateListView(QWidget):
 
     def _connect_signals(self):
         """Connect application signals"""
-        self._signals.template_created.connect(self._refresh_tree)
-        self._signals.template_modified.connect(self._refresh_tree)
-        self._signals.template_deleted.connect(self._refresh_tree)
+        self._signals.template_created.connect(self._on_template_changed)
+        self._signals.template_modified.connect(self._on_template_changed)
+        self._signals.template_deleted.connect(self._schedule_refresh)
+
+    def _schedule_refresh(self, *_args):
+        """Queue a refresh; repeated calls in one burst collapse to one."""
+        self._refresh_timer.start()
+
+    def _on_template_changed(self, template_id: str):
+        """Patch a single create/rename in place; rebuild only if needed."""
+        if not self._apply_incremental_update(template_id):
+            self._schedule_refresh()
+
+    def _apply_incremental_update(self, template_id: str) -> bool:
+        """
+        Try to absorb one template change without rebuilding the tree.
+
+        Handles the common cases - a rename, or a new template appearing
+        under an existing parent - as O(1) item edits. Returns False when
+        the parent relationship changed (or the parent item is missing),
+        in which case the caller falls back to a full refresh.
+        """
+        template = self.template_manager.get_template(template_id)
+        if template is None:
+            return False
+        parent_id = template.parent_template_id
+
+        item = self._item_by_id.get(template_id)
+        if item is not None:
+            # Existing row: only a rename can be patched in place
+            if self._known_parent_of.get(template_id) != parent_id:
+                return False
+            item.setText(0, self._item_label(template.name, item.childCount()))
+            return True
+
+        # New template: attach it under its parent (or at top level)
+        item = QTreeWidgetItem([template.name])
+        item.setData(0, Qt.UserRole, template_id)
+        if parent_id is None:
+            self.tree.addTopLevelItem(item)
+        else:
+            parent_item = self._item_by_id.get(parent_id)
+            if parent_item is None:
+                return False
+            parent_item.addChild(item)
+            parent_item.setExpanded(True)
+            # The parent's child-count suffix just grew
+            parent_template = self.template_manager.get_template(parent_id)
+            if parent_template is not None:
+                parent_item.setText(0, self._item_label(
+                    parent_template.name, parent_item.childCount()
+                ))
+        self._item_by_id[template_id] = item
+        self._known_parent_of[template_id] = parent_id
+        return True
+
+    @staticmethod
+    def _item_label(name: str, count: int) -> str:
+        """Item text with the child-count suffix when there are children."""
+        return f"{name} ({count})" if count else name
 
     def _refresh_tree(self):
         """Refresh the template tree"""
-        self.tree.clear()
-
-        # Build tree from root templates
-        root_templates = self.template_manager.get_root_templates()
-
-        for template in root_templates:
-            item = self._create_tree_item(template)
-            self.tree.addTopLevelItem(item)
-            self._add_children(item, template.id)
-
-        self.tree.expandAll()
-
-    def _create_tree_item(self, template: RecipeTemplate) -> QTreeWidgetItem:
+        self._item_by_id = {}
+        self._known_parent_of = {}
+
+        # One linear scan buckets children by parent; the build below is
+        # then O(1) dict lookups per node instead of a get_children call
+        # (and fresh list) per item plus another for its count
+        children_by_parent: dict[Optional[str], list[RecipeTemplate]] = {}
+        for template in self.template_manager.list_templates():
+            children_by_parent.setdefault(
+                template.parent_template_id, []
+            ).append(template)
+
+        # Assemble the item forest detached from the tree, then hand it
+        # over in one call. Breadth-first with an explicit queue: no
+        # Python frame per node, and no RecursionError on deep chains
+        items = []
+        queue: deque[tuple[str, QTreeWidgetItem]] = deque()
+        for template in children_by_parent.get(None, ()):
+            item = self._create_tree_item(template, children_by_parent)
+            items.append(item)
+            queue.append((template.id, item))
+        while queue:
+            parent_id, parent_item = queue.popleft()
+            for child in children_by_parent.get(parent_id, ()):
+                item = self._create_tree_item(child, children_by_parent)
+                parent_item.addChild(item)
+                queue.append((child.id, item))
+
+        # One repaint for the whole swap, and no itemSelectionChanged
+        # re-entry into the editor while clear() drops the selection
+        self.tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.tree):
+                self.tree.clear()
+                self.tree.addTopLevelItems(items)
+                self.tree.expandAll()
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+        pending = self._pending_select_id
+        if pending is not None:
+            self._pending_select_id = None
+            self._select_template_in_tree(pending)
+
+    def _create_tree_item(
+        self,
+        template: RecipeTemplate,
+        children_by_parent: dict[Optional[str], list[RecipeTemplate]]
+    ) -> QTreeWidgetItem:
         """Create a tree item for a template"""
-        item = QTreeWidgetItem([template.name])
+        count = len(children_by_parent.get(template.id, ()))
+        item = QTreeWidgetItem([self._item_label(template.name, count)])
         item.setData(0, Qt.UserRole, template.id)
-
-        # Add child count indicator
-        children = self.template_manager.get_children(template.id)
-        if children:
-            item.setText(0, f"{template.name} ({len(children)})")
+        self._item_by_id[template.id] = item
+        self._known_parent_of[template.id] = template.parent_template_id
 
         return item
 
-    def _add_children(self, parent_item: QTreeWidgetItem, parent_id: str):
-        """Recursively add child templates"""
-        children = self.template_manager.get_children(parent_id)
-
-        for child in children:
-            item = self._create_tree_item(child)
-            parent_item.addChild(item)
-            self._add_children(item, child.id)
-
     def _show_context_menu(self, position):
         """Show context menu for template item"""
         item = self.tree.itemAt(position)
@@ -156,19 +258,20 @@ class TemplateListView(QWidget):
 
         menu = QMenu(self)
 
-        # Edit action
+        # Edit action (partial binds the id without a lambda frame per
+        # activation)
         edit_action = menu.addAction("Edit")
-        edit_action.triggered.connect(lambda: self._on_edit_template(template_id))
+        edit_action.triggered.connect(partial(self._on_edit_template, template_id))
 
         # New child action
         new_child_action = menu.addAction("New Child Template")
-        new_child_action.triggered.connect(lambda: self._on_new_child(template_id))
+        new_child_action.triggered.connect(partial(self._on_new_child, template_id))
 
         menu.addSeparator()
 
         # Delete action
         delete_action = menu.addAction("Delete")
-        delete_action.triggered.connect(lambda: self._on_delete_template(template_id))
+        delete_action.triggered.connect(partial(self._on_delete_template, template_id))
 
         menu.exec(self.tree.viewport().mapToGlobal(position))
 
@@ -208,37 +311,24 @@ class TemplateListView(QWidget):
 
         if result == QMessageBox.Yes:
             try:
+                # template_deleted schedules the refresh
                 self.template_manager.delete_template(template_id)
-                self._refresh_tree()
             except ValueError as e:
                 QMessageBox.warning(self, "Cannot Delete", str(e))
 
     def _on_template_saved(self, template_id: str):
         """Handle template saved"""
-        self._refresh_tree()
-
-        # Select the saved template in tree
-        self._select_template_in_tree(template_id)
+        # The created/modified signal has already run: either the change
+        # was patched in place (select now) or a rebuild is queued
+        # (select once it lands)
+        if self._refresh_timer.isActive() or template_id not in self._item_by_id:
+            self._pending_select_id = template_id
+            self._schedule_refresh()
+        else:
+            self._select_template_in_tree(template_id)
 
     def _select_template_in_tree(self, template_id: str):
         """Select a template in the tree by ID"""
-        def find_item(parent_item, tid):
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                if child.data(0, Qt.UserRole) == tid:
-                    return child
-                found = find_item(child, tid)
-                if found:
-                    return found
-            return None
-
-        # Search top level items
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if item.data(0, Qt.UserRole) == template_id:
-                self.tree.setCurrentItem(item)
-                return
-            found = find_item(item, template_id)
-            if found:
-                self.tree.setCurrentItem(found)
-                return
+        item = self._item_by_id.get(template_id)
+        if item is not None:
+            self.tree.setCurrentItem(item)
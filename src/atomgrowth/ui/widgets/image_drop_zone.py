@@ -3,82 +3,197 @@
 from pathlib import Path
 from typing import Optional
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
-    QFrame, QGridLayout, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListView, QFrame
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QModelIndex, QObject, QRunnable,
+    QSize, QThreadPool
+)
+from PySide6.QtGui import (
+    QIcon, QImage, QImageReader, QPixmap, QPixmapCache,
+    QDragEnterEvent, QDropEvent
 )
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QPixmap, QDragEnterEvent, QDropEvent, QMouseEvent
 
-from atomgrowth.styles.colors import NotionColors
+from atomgrowth.ui.thumb_cache import get_thumb_cache
 
+# Scaled thumbnails are shared across refreshes through QPixmapCache;
+# 128 MB (the limit is in KB) comfortably holds a large image grid
+QPixmapCache.setCacheLimit(128 * 1024)
 
-class ImageThumbnail(QFrame):
-    """A clickable image thumbnail widget."""
 
-    clicked = Signal(str)  # Emits image path
-    delete_requested = Signal(str)  # Emits image path
+class _ThumbnailSignals(QObject):
+    """Signal holder for _ThumbnailTask (QRunnable cannot emit)."""
+    loaded = Signal(str, QImage)  # (cache key, scaled image)
 
-    def __init__(self, image_path: str, full_path: Path, parent=None):
-        super().__init__(parent)
-        self.image_path = image_path
-        self.full_path = full_path
 
-        self.setObjectName("imageThumbnail")
-        self.setFixedSize(120, 120)
-        self.setCursor(Qt.PointingHandCursor)
+class _ThumbnailTask(QRunnable):
+    """
+    Decode and scale one image in a pool thread.
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(2)
-
-        # Image label
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setFixedSize(112, 90)
-        layout.addWidget(self.image_label)
-
-        # Filename label
-        self.name_label = QLabel(Path(image_path).name[:15])
-        self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setStyleSheet(f"font-size: 10px; color: {NotionColors.TEXT_SECONDARY};")
-        layout.addWidget(self.name_label)
-
-        # Load thumbnail
-        self._load_thumbnail()
-
-        # Apply styling
-        self.setStyleSheet(f"""
-            QFrame#imageThumbnail {{
-                background-color: {NotionColors.BACKGROUND};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 8px;
-            }}
-            QFrame#imageThumbnail:hover {{
-                border-color: {NotionColors.PRIMARY};
-                background-color: {NotionColors.BACKGROUND_HOVER};
-            }}
-        """)
-
-    def _load_thumbnail(self):
-        """Load and display the thumbnail."""
-        if self.full_path.exists():
-            pixmap = QPixmap(str(self.full_path))
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    112, 90,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled)
-            else:
-                self.image_label.setText("Invalid")
-        else:
-            self.image_label.setText("Not found")
+    QImage is reentrant, unlike QPixmap, so the expensive decode and
+    smooth scale run off the GUI thread; the receiver converts to
+    QPixmap back on the GUI thread.
+    """
 
-    def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.image_path)
-        super().mousePressEvent(event)
+    def __init__(
+        self, path: str, mtime_ns: int, key: str, signals: _ThumbnailSignals
+    ):
+        super().__init__()
+        self._path = path
+        self._mtime_ns = mtime_ns
+        self._key = key
+        self._signals = signals
+
+    def run(self):
+        # Warm restarts read the small pre-scaled PNG from the disk
+        # cache instead of re-decoding the original
+        cache = get_thumb_cache()
+        cached = cache.lookup(self._path, self._mtime_ns, 112, 90)
+        if cached is not None:
+            image = QImage(str(cached))
+            if not image.isNull():
+                self._signals.loaded.emit(self._key, image)
+                return
+
+        # Two-stage downscale: let the decoder produce roughly 2x the
+        # target (JPEG/PNG plugins honor setScaledSize with fast paths),
+        # then one smooth scale. Avoids materializing a multi-megapixel
+        # image just to shrink it to 112x90.
+        reader = QImageReader(self._path)
+        source_size = reader.size()
+        if source_size.isValid() and (
+            source_size.width() > 224 or source_size.height() > 180
+        ):
+            reader.setScaledSize(
+                source_size.scaled(224, 180, Qt.KeepAspectRatio)
+            )
+        image = reader.read()
+        if not image.isNull():
+            image = image.scaled(
+                112, 90,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            cache.store(
+                image, cache.thumb_path(self._path, self._mtime_ns, 112, 90)
+            )
+        self._signals.loaded.emit(self._key, image)
+
+
+class _ImageListModel(QAbstractListModel):
+    """
+    Model behind the thumbnail view.
+
+    Rows are cheap (path, mtime) tuples; the view only asks for
+    DecorationRole on visible rows, so a grid of hundreds of images
+    decodes just the thumbnails actually on screen. Misses are handed
+    to the thread pool once per row and patched in via dataChanged.
+    """
+
+    # Rows batch-submitted to the pool as soon as set_images runs, so
+    # the first screenful decodes in parallel instead of trickling in
+    # one data() call at a time
+    _PREFETCH_ROWS = 24
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # (relative path, full path, mtime_ns or None if unreadable)
+        self._rows: list[tuple[str, Path, Optional[int]]] = []
+        self._keys: list[Optional[str]] = []     # pixmap-cache key per row
+        self._icons: list[Optional[QIcon]] = []  # resolved icon per row
+        self._pending: set[str] = set()          # keys handed to the pool
+        self._signals = _ThumbnailSignals(self)
+        self._signals.loaded.connect(self._on_thumbnail_loaded)
+
+    def set_images(self, rows: list[tuple[str, Path]]):
+        """Replace the model contents with (relative, full) path pairs."""
+        self.beginResetModel()
+        self._rows = []
+        self._keys = []
+        self._icons = []
+        for rel, full in rows:
+            try:
+                mtime_ns = full.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            key = f"{full}:{mtime_ns}:112x90" if mtime_ns is not None else None
+            self._rows.append((rel, full, mtime_ns))
+            self._keys.append(key)
+            self._icons.append(None)
+        self.endResetModel()
+
+        # Warm the pool with the leading rows; decodes overlap the
+        # first layout/paint pass and spread across the pool's threads
+        for row in range(min(self._PREFETCH_ROWS, len(self._rows))):
+            self._request_thumbnail(row)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        rel, full, mtime_ns = self._rows[row]
+
+        if role == Qt.DisplayRole:
+            return Path(rel).name[:15]
+        if role == Qt.UserRole:
+            return rel
+        if role == Qt.ToolTipRole:
+            return rel
+        if role != Qt.DecorationRole:
+            return None
+
+        icon = self._icons[row]
+        if icon is not None:
+            return icon
+
+        key = self._keys[row]
+        if key is None:
+            return None  # Missing file; name still shows
+
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            icon = QIcon(pixmap)
+            self._icons[row] = icon
+            return icon
+
+        # First sight of this row on screen: decode in the pool exactly
+        # once; the loaded slot fills the icon and repaints the row
+        self._request_thumbnail(row)
+        return None
+
+    def _request_thumbnail(self, row: int):
+        """Post a pool decode for a row unless cached or in flight."""
+        key = self._keys[row]
+        if key is None or key in self._pending or self._icons[row] is not None:
+            return
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            self._icons[row] = QIcon(pixmap)
+            return
+        _rel, full, mtime_ns = self._rows[row]
+        self._pending.add(key)
+        QThreadPool.globalInstance().start(
+            _ThumbnailTask(str(full), mtime_ns, key, self._signals)
+        )
+
+    def _on_thumbnail_loaded(self, key: str, image: QImage):
+        """Receive a decoded thumbnail on the GUI thread."""
+        self._pending.discard(key)
+        if image.isNull():
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        # The rows may have been swapped while the task ran; only patch
+        # a row that still wants this key
+        for row, row_key in enumerate(self._keys):
+            if row_key == key:
+                self._icons[row] = QIcon(pixmap)
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.DecorationRole])
+                break
 
 
 class ImageDropZone(QWidget):
@@ -102,6 +217,14 @@ class ImageDropZone(QWidget):
         super().__init__(parent)
         self.images_dir = images_dir
         self._image_paths: list[str] = []
+        # Accept decision memoized per drag: Qt re-delivers enter events
+        # with the same QMimeData for the drag's lifetime, so the URL
+        # scan runs once instead of per mouse move. The memo MUST be
+        # cleared when the drag ends (leave/drop) - a freed QMimeData's
+        # address can be recycled for the next drag, so a stale id would
+        # replay the wrong verdict
+        self._last_mime_id: Optional[int] = None
+        self._last_accept = False
 
         self.setAcceptDrops(True)
         self.setMinimumHeight(150)
@@ -114,13 +237,9 @@ class ImageDropZone(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
-        # Section title
+        # Section title (same chrome as the editor's section headings)
         title = QLabel("Optical Images")
-        title.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 600;
-            color: {NotionColors.TEXT_PRIMARY};
-        """)
+        title.setObjectName("editorSectionTitle")
         layout.addWidget(title)
 
         # Drop zone frame
@@ -132,30 +251,31 @@ class ImageDropZone(QWidget):
 
         # Placeholder (shown when no images)
         self.placeholder = QLabel("Drag & drop images here")
+        self.placeholder.setObjectName("dropZonePlaceholder")
         self.placeholder.setAlignment(Qt.AlignCenter)
-        self.placeholder.setStyleSheet(f"""
-            font-size: 14px;
-            color: {NotionColors.TEXT_TERTIARY};
-            padding: 40px;
-        """)
         drop_layout.addWidget(self.placeholder)
 
-        # Scroll area for thumbnails
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.scroll_area.setVisible(False)
-        self.scroll_area.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-
-        # Grid container for thumbnails
-        self.grid_container = QWidget()
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
-        self.grid_layout.setSpacing(8)
-        self.scroll_area.setWidget(self.grid_container)
-
-        drop_layout.addWidget(self.scroll_area)
+        # Virtualized thumbnail view: Qt instantiates delegates for
+        # visible rows only, so off-screen images cost one tuple in the
+        # model rather than a widget plus a decode
+        self._model = _ImageListModel(self)
+        self.image_view = QListView()
+        self.image_view.setModel(self._model)
+        self.image_view.setViewMode(QListView.IconMode)
+        self.image_view.setMovement(QListView.Static)
+        self.image_view.setResizeMode(QListView.Adjust)
+        self.image_view.setIconSize(QSize(112, 90))
+        self.image_view.setGridSize(QSize(120, 120))
+        self.image_view.setUniformItemSizes(True)
+        # Lay out large drops in slices across event-loop ticks instead
+        # of positioning every row before the first paint
+        self.image_view.setLayoutMode(QListView.Batched)
+        self.image_view.setBatchSize(30)
+        self.image_view.setObjectName("dropZoneImageView")
+        self.image_view.setVisible(False)
+        self.image_view.clicked.connect(self._on_item_clicked)
+
+        drop_layout.addWidget(self.image_view)
 
         layout.addWidget(self.drop_frame)
 
@@ -164,22 +284,15 @@ class ImageDropZone(QWidget):
 
     def _update_drop_zone_style(self, is_drag_over: bool):
         """Update the drop zone visual style."""
-        if is_drag_over:
-            self.drop_frame.setStyleSheet(f"""
-                QFrame#dropZone {{
-                    background-color: {NotionColors.PRIMARY}15;
-                    border: 2px dashed {NotionColors.PRIMARY};
-                    border-radius: 8px;
-                }}
-            """)
-        else:
-            self.drop_frame.setStyleSheet(f"""
-                QFrame#dropZone {{
-                    background-color: {NotionColors.SIDEBAR_BG};
-                    border: 2px dashed {NotionColors.BORDER};
-                    border-radius: 8px;
-                }}
-            """)
+        # Both states live in notion_light.qss behind the dragOver
+        # property; toggling is a flip + repolish, not a QSS reparse at
+        # mouse-event rate
+        if self.drop_frame.property("dragOver") == is_drag_over:
+            return
+        self.drop_frame.setProperty("dragOver", is_drag_over)
+        style = self.drop_frame.style()
+        style.unpolish(self.drop_frame)
+        style.polish(self.drop_frame)
 
     def set_images(self, image_paths: list[str]):
         """Set the images to display."""
@@ -187,62 +300,71 @@ class ImageDropZone(QWidget):
         self._refresh_thumbnails()
 
     def _refresh_thumbnails(self):
-        """Refresh the thumbnail grid."""
-        # Clear existing thumbnails
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
+        """Refresh the thumbnail view."""
         if not self._image_paths:
+            self._model.set_images([])
             self.placeholder.setVisible(True)
-            self.scroll_area.setVisible(False)
+            self.image_view.setVisible(False)
             return
 
         self.placeholder.setVisible(False)
-        self.scroll_area.setVisible(True)
+        self.image_view.setVisible(True)
 
-        # Add thumbnails in a grid (3 columns)
-        columns = 3
-        for i, image_path in enumerate(self._image_paths):
-            row = i // columns
-            col = i % columns
-
-            # Get full path
+        rows = []
+        for image_path in self._image_paths:
             if self.images_dir:
                 full_path = self.images_dir / image_path
             else:
                 full_path = Path(image_path)
+            rows.append((image_path, full_path))
+        self._model.set_images(rows)
 
-            thumbnail = ImageThumbnail(image_path, full_path)
-            thumbnail.clicked.connect(self.image_clicked.emit)
-            self.grid_layout.addWidget(thumbnail, row, col)
-
-        # Add spacer at the end
-        self.grid_layout.setRowStretch(len(self._image_paths) // columns + 1, 1)
+    def _on_item_clicked(self, index: QModelIndex):
+        """Forward a thumbnail click as the relative image path."""
+        image_path = index.data(Qt.UserRole)
+        if image_path:
+            self.image_clicked.emit(image_path)
 
     # ==================== Drag and Drop ====================
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter - accept if it contains image files."""
-        if event.mimeData().hasUrls():
-            # Check if any URL is an image
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.suffix.lower() in self.SUPPORTED_FORMATS:
-                        event.acceptProposedAction()
-                        self._update_drop_zone_style(True)
-                        return
-        event.ignore()
+        mime = event.mimeData()
+        mime_id = id(mime)
+        if mime_id == self._last_mime_id:
+            accept = self._last_accept
+        else:
+            # First sight of this drag: stop at the first image suffix,
+            # splitting the string directly instead of building a Path
+            # per URL
+            accept = False
+            if mime.hasUrls():
+                for url in mime.urls():
+                    if url.isLocalFile():
+                        suffix = '.' + url.toLocalFile().rpartition('.')[2].lower()
+                        if suffix in self.SUPPORTED_FORMATS:
+                            accept = True
+                            break
+            self._last_mime_id = mime_id
+            self._last_accept = accept
+
+        if accept:
+            event.acceptProposedAction()
+            self._update_drop_zone_style(True)
+        else:
+            event.ignore()
 
     def dragLeaveEvent(self, event):
         """Handle drag leave - reset styling."""
+        self._last_mime_id = None
+        self._last_accept = False
         self._update_drop_zone_style(False)
         super().dragLeaveEvent(event)
 
     def dropEvent(self, event: QDropEvent):
         """Handle drop - emit signal with dropped image paths."""
+        self._last_mime_id = None
+        self._last_accept = False
         self._update_drop_zone_style(False)
 
         if event.mimeData().hasUrls():
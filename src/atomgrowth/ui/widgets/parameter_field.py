@@ -1,5 +1,6 @@
 """Inheritable parameter field widget - the key UI innovation"""
 
+from functools import lru_cache
 from typing import Any, Optional, Callable
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
@@ -12,6 +13,33 @@ from PySide6.QtGui import QFont
 from atomgrowth.styles.colors import NotionColors
 
 
+# Sections differ only in accent color, so the formatted sheets are
+# interned per color instead of rebuilt for every section instance
+@lru_cache(maxsize=None)
+def _section_frame_qss(color: str) -> str:
+    """Frame rules for one section accent color."""
+    return f"""
+        QFrame#parameterSection {{
+            background-color: {NotionColors.BACKGROUND};
+            border: 1px solid {NotionColors.BORDER};
+            border-left: 3px solid {color};
+            border-radius: 8px;
+            margin: 4px 0;
+        }}
+    """
+
+
+@lru_cache(maxsize=None)
+def _section_header_qss(color: str) -> str:
+    """Header label rules for one section accent color."""
+    return f"""
+        font-size: 13px;
+        font-weight: 600;
+        color: {color};
+        padding: 4px 0;
+    """
+
+
 class InheritableParameterField(QWidget):
     """
     A parameter field that can be inherited or overridden.
@@ -52,6 +80,9 @@ class InheritableParameterField(QWidget):
         self._inherited_value: Any = None
         self._inherited_source: Optional[str] = None
         self._current_value: Any = None
+        # Last state pushed to the stylesheet; styling is a no-op when
+        # it hasn't actually flipped
+        self._style_overridden: Optional[bool] = None
 
         self._setup_ui(label, unit, choices, min_val, max_val, decimals)
         self._apply_inherited_style()
@@ -72,12 +103,13 @@ class InheritableParameterField(QWidget):
 
         # Label
         self.label_widget = QLabel(label)
+        self.label_widget.setObjectName("inheritFieldLabel")
         self.label_widget.setMinimumWidth(120)
-        self.label_widget.setStyleSheet(f"color: {NotionColors.TEXT_PRIMARY};")
         layout.addWidget(self.label_widget)
 
         # Value input (type-dependent)
         self.input_widget = self._create_input(choices, min_val, max_val, decimals)
+        self.input_widget.setObjectName("inheritInput")
         self.input_widget.setMinimumWidth(100)
         self.input_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         layout.addWidget(self.input_widget)
@@ -85,17 +117,19 @@ class InheritableParameterField(QWidget):
         # Unit label (if provided)
         if unit:
             unit_label = QLabel(unit)
-            unit_label.setStyleSheet(f"color: {NotionColors.TEXT_SECONDARY};")
+            unit_label.setObjectName("inheritFieldUnit")
             layout.addWidget(unit_label)
 
         # Inheritance badge
         self.badge = QLabel()
+        self.badge.setObjectName("inheritBadge")
         self.badge.setMinimumWidth(80)
         self.badge.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.badge)
 
         # Lock/unlock button
         self.lock_btn = QPushButton()
+        self.lock_btn.setObjectName("inheritLockButton")
         self.lock_btn.setFixedSize(28, 28)
         self.lock_btn.setCursor(Qt.PointingHandCursor)
         self.lock_btn.clicked.connect(self._toggle_inheritance)
@@ -109,17 +143,33 @@ class InheritableParameterField(QWidget):
         max_val: float,
         decimals: int
     ) -> QWidget:
-        """Create the appropriate input widget based on field type"""
+        """
+        Create the appropriate input widget based on field type.
+
+        Also binds _get_impl/_set_impl to the widget's own accessors, so
+        every later value round-trip (template switches call
+        _set_input_value once per field) skips the isinstance ladder.
+        """
         if self.field_type == "choice" and choices:
             widget = QComboBox()
             widget.addItems(choices)
             widget.currentTextChanged.connect(self._on_value_changed)
+            self._get_impl = widget.currentText
+
+            def _set_combo(value, w=widget):
+                idx = w.findText(str(value))
+                if idx >= 0:
+                    w.setCurrentIndex(idx)
+
+            self._set_impl = _set_combo
             return widget
 
         elif self.field_type == "int":
             widget = QSpinBox()
             widget.setRange(int(min_val), int(max_val))
             widget.valueChanged.connect(self._on_value_changed)
+            self._get_impl = widget.value
+            self._set_impl = widget.setValue
             return widget
 
         elif self.field_type == "float":
@@ -127,11 +177,15 @@ class InheritableParameterField(QWidget):
             widget.setRange(min_val, max_val)
             widget.setDecimals(decimals)
             widget.valueChanged.connect(self._on_value_changed)
+            self._get_impl = widget.value
+            self._set_impl = widget.setValue
             return widget
 
         else:  # str
             widget = QLineEdit()
             widget.textChanged.connect(self._on_value_changed)
+            self._get_impl = widget.text
+            self._set_impl = lambda value, w=widget: w.setText(str(value))
             return widget
 
     def _on_value_changed(self, value):
@@ -161,110 +215,45 @@ class InheritableParameterField(QWidget):
 
     def _apply_inherited_style(self):
         """Apply visual style for inherited state"""
-        self.setObjectName("inheritedField")
-
-        # Gray out input
         self.input_widget.setEnabled(False)
-        self.input_widget.setStyleSheet(f"""
-            background-color: {NotionColors.INHERITED_BG};
-            color: {NotionColors.INHERITED};
-            border: 1px solid {NotionColors.BORDER};
-        """)
-
-        # Badge shows source
-        source_text = self._inherited_source or "Default"
-        self.badge.setText(source_text)
-        self.badge.setObjectName("inheritedBadge")
-        self.badge.setStyleSheet(f"""
-            background-color: {NotionColors.INHERITED_BG};
-            color: {NotionColors.INHERITED};
-            border-radius: 4px;
-            padding: 2px 8px;
-            font-size: 11px;
-        """)
-
-        # Lock icon (using text for now, could use actual icon)
+        self.badge.setText(self._inherited_source or "Default")
         self.lock_btn.setText("🔒")
-        self.lock_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.INHERITED_BG};
-                border: 1px solid {NotionColors.BORDER};
-                border-radius: 4px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.BACKGROUND_HOVER};
-                border-color: {NotionColors.PRIMARY};
-            }}
-        """)
+        self._apply_state_style(False)
 
     def _apply_overridden_style(self):
         """Apply visual style for overridden state"""
-        self.setObjectName("overriddenField")
-
-        # Enable and highlight input
         self.input_widget.setEnabled(True)
-        self.input_widget.setStyleSheet(f"""
-            background-color: {NotionColors.OVERRIDDEN_BG};
-            color: {NotionColors.OVERRIDDEN};
-            border: 1px solid {NotionColors.PRIMARY};
-            font-weight: 600;
-        """)
-
-        # Badge shows "Modified"
         self.badge.setText("Modified")
-        self.badge.setObjectName("modifiedBadge")
-        self.badge.setStyleSheet(f"""
-            background-color: {NotionColors.OVERRIDDEN_BG};
-            color: {NotionColors.OVERRIDDEN};
-            border-radius: 4px;
-            padding: 2px 8px;
-            font-size: 11px;
-            font-weight: 600;
-        """)
-
-        # Unlock icon
         self.lock_btn.setText("🔓")
-        self.lock_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {NotionColors.OVERRIDDEN_BG};
-                border: 1px solid {NotionColors.PRIMARY};
-                border-radius: 4px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {NotionColors.PRIMARY_LIGHT};
-            }}
-        """)
+        self._apply_state_style(True)
+
+    def _apply_state_style(self, is_overridden: bool):
+        """
+        Flip the dynamic property the app stylesheet selects on.
+
+        The inherited/overridden rules live in notion_light.qss behind
+        [overridden="..."] selectors, so a state change is three cheap
+        property flips and repolishes instead of three stylesheet
+        parses per call.
+        """
+        if is_overridden == self._style_overridden:
+            return  # already applied - skip the repolish entirely
+        self._style_overridden = is_overridden
+        for widget in (self.input_widget, self.badge, self.lock_btn):
+            widget.setProperty("overridden", is_overridden)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
 
     def _set_input_value(self, value: Any):
         """Set the input widget value without triggering signals"""
-        if isinstance(self.input_widget, QComboBox):
-            self.input_widget.blockSignals(True)
-            idx = self.input_widget.findText(str(value))
-            if idx >= 0:
-                self.input_widget.setCurrentIndex(idx)
-            self.input_widget.blockSignals(False)
-
-        elif isinstance(self.input_widget, (QSpinBox, QDoubleSpinBox)):
-            self.input_widget.blockSignals(True)
-            self.input_widget.setValue(value)
-            self.input_widget.blockSignals(False)
-
-        elif isinstance(self.input_widget, QLineEdit):
-            self.input_widget.blockSignals(True)
-            self.input_widget.setText(str(value))
-            self.input_widget.blockSignals(False)
+        self.input_widget.blockSignals(True)
+        self._set_impl(value)
+        self.input_widget.blockSignals(False)
 
     def get_input_value(self) -> Any:
         """Get current value from input widget"""
-        if isinstance(self.input_widget, QComboBox):
-            return self.input_widget.currentText()
-        elif isinstance(self.input_widget, (QSpinBox, QDoubleSpinBox)):
-            return self.input_widget.value()
-        elif isinstance(self.input_widget, QLineEdit):
-            return self.input_widget.text()
-        return None
+        return self._get_impl()
 
     # ==================== Public API ====================
 
@@ -309,8 +298,14 @@ class ParameterSection(QFrame):
     """
     A collapsible section containing multiple parameter fields.
     Used to group related parameters (Temperature, Gas Flow, etc.)
+
+    Field edits are funneled through the section-level field_changed
+    signal, so consumers connect once per section rather than once per
+    field.
     """
 
+    field_changed = Signal(str, object)  # (field_path, new_value)
+
     def __init__(
         self,
         title: str,
@@ -320,43 +315,27 @@ class ParameterSection(QFrame):
         super().__init__(parent)
 
         self.setObjectName("parameterSection")
-        self.setStyleSheet(f"""
-            QFrame#parameterSection {{
-                background-color: {NotionColors.BACKGROUND};
-                border: 1px solid {NotionColors.BORDER};
-                border-left: 3px solid {color};
-                border-radius: 8px;
-                margin: 4px 0;
-            }}
-        """)
+        self.setStyleSheet(_section_frame_qss(color))
 
+        # One flat layout: header then fields. A nested container widget
+        # here would just add a second layout pass per update
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(12, 8, 12, 8)
-        self._layout.setSpacing(4)
+        self._layout.setSpacing(2)
 
         # Header
         header = QLabel(title)
-        header.setStyleSheet(f"""
-            font-size: 13px;
-            font-weight: 600;
-            color: {color};
-            padding: 4px 0;
-        """)
+        header.setStyleSheet(_section_header_qss(color))
         self._layout.addWidget(header)
 
-        # Fields container
-        self._fields_container = QWidget()
-        self._fields_layout = QVBoxLayout(self._fields_container)
-        self._fields_layout.setContentsMargins(0, 0, 0, 0)
-        self._fields_layout.setSpacing(2)
-        self._layout.addWidget(self._fields_container)
-
         self._fields: dict[str, InheritableParameterField] = {}
 
     def add_field(self, field: InheritableParameterField):
         """Add a parameter field to this section"""
-        self._fields_layout.addWidget(field)
+        self._layout.addWidget(field)
         self._fields[field.field_path] = field
+        # Signal-to-signal forwarding; no Python slot on the hot path
+        field.value_changed.connect(self.field_changed)
 
     def get_field(self, field_path: str) -> Optional[InheritableParameterField]:
         """Get a field by its path"""